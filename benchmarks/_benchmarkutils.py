@@ -0,0 +1,235 @@
+import argparse
+import datetime
+import json
+import platform
+import sys
+import time
+from dataclasses import dataclass, field
+from importlib import metadata
+from typing import Callable
+from sbc_communication.skillexecutionmetrics import RollingHistogram
+
+# relative slowdown of p50, reported as regression in compare mode
+BENCHMARK_REGRESSION_THRESHOLD_DEFAULT = 0.1
+# units of benchmark results, for which lower values are better
+BENCHMARK_LOWER_IS_BETTER_UNITS = ("s", "B")
+
+
+@dataclass
+class BenchmarkResult:
+    """dataclass storing samples and summary of one benchmark"""
+
+    name: str = ""
+    unit: str = "s"  # unit of samples, e.g. "s" per call
+    summary: dict = field(default_factory=dict)  # count, mean, max, p50, p95, p99
+    extra: dict = field(default_factory=dict)  # e.g. throughput, allocations
+
+    def asdict(self) -> dict:
+        return {"unit": self.unit, **self.summary, **self.extra}
+
+
+def measure(
+    name: str,
+    function: Callable[[], object],
+    repeat: int = 20,
+    warmup: int = 1,
+    setup: Callable[[], object] | None = None,
+    extra: dict | None = None,
+) -> BenchmarkResult:
+    """measure duration of function calls
+
+    Args:
+        name (str): name of benchmark
+        function (Callable[[], object]): measured function
+        repeat (int, optional): count of measured calls. Defaults to 20.
+        warmup (int, optional): count of calls before measuring. Defaults to 1.
+        setup (Callable[[], object] | None, optional): called before each call, not measured. Defaults to None.
+        extra (dict | None, optional): additional values of result, e.g. allocations. Defaults to None.
+
+    Returns:
+        BenchmarkResult: durations in seconds
+    """
+    for i in range(warmup):
+        if setup is not None:
+            setup()
+        function()
+    histogram = RollingHistogram(windowSize=max(repeat, 1))
+    for i in range(repeat):
+        if setup is not None:
+            setup()
+        startTime = time.perf_counter()
+        function()
+        histogram.add(time.perf_counter() - startTime)
+    result = BenchmarkResult(
+        name=name, summary=histogram.summary(), extra=dict(extra) if extra else {}
+    )
+    print_Result(result)
+    return result
+
+
+def measure_Throughput(
+    name: str, function: Callable[[], object], duration: float = 5.0
+) -> BenchmarkResult:
+    """call function repeatedly for duration, measure latency and calls per second
+
+    Args:
+        name (str): name of benchmark
+        function (Callable[[], object]): measured function
+        duration (float, optional): measuring time in seconds. Defaults to 5.0.
+
+    Returns:
+        BenchmarkResult: latencies in seconds and throughput in calls per second
+    """
+    histogram = RollingHistogram(windowSize=1_000_000)
+    startTime = time.perf_counter()
+    endTime = startTime + duration
+    now = startTime
+    while now < endTime:
+        function()
+        lastTime, now = now, time.perf_counter()
+        histogram.add(now - lastTime)
+    result = BenchmarkResult(
+        name=name,
+        summary=histogram.summary(),
+        extra={"throughput": len(histogram) / (now - startTime)},
+    )
+    print_Result(result)
+    return result
+
+
+def print_Result(result: BenchmarkResult) -> None:
+    summary = result.summary
+    text = f"{result.name:<55} n={summary['count']:<6}"
+    for key in ("p50", "p95", "p99"):
+        text += f" {key}={_format_Value(summary[key], result.unit):>11}"
+    for key, value in result.extra.items():
+        text += f" {key}={value:.4g}"
+    print(text, flush=True)
+
+
+def _format_Value(value: float | None, unit: str) -> str:
+    if value is None:
+        return "-"
+    if unit == "s":
+        return f"{value * 1000:.3f}ms"
+    return f"{value:.4g}{unit}"
+
+
+def get_Metadata(**parameters) -> dict:
+    """get environment and parameters of benchmark run
+
+    Returns:
+        dict: metadata for json results
+    """
+    try:
+        packageVersion = metadata.version("sbc_communication")
+    except metadata.PackageNotFoundError:
+        packageVersion = None
+    try:
+        asyncuaVersion = metadata.version("asyncua")
+    except metadata.PackageNotFoundError:
+        asyncuaVersion = None
+    return {
+        "timestamp": datetime.datetime.now().isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "sbc_communication": packageVersion,
+        "asyncua": asyncuaVersion,
+        "parameters": parameters,
+    }
+
+
+def write_Results(
+    filePath: str, results: list[BenchmarkResult], benchmarkMetadata: dict
+) -> dict:
+    """write benchmark results as json file
+
+    Args:
+        filePath (str): json file path
+        results (list[BenchmarkResult]): benchmark results
+        benchmarkMetadata (dict): see get_Metadata
+
+    Returns:
+        dict: written json content
+    """
+    content = {
+        "metadata": benchmarkMetadata,
+        "results": {result.name: result.asdict() for result in results},
+    }
+    with open(filePath, "w") as jsonFile:
+        json.dump(content, jsonFile, indent=2)
+    return content
+
+
+def compare_Results(
+    baselineFilePath: str,
+    results: list[BenchmarkResult],
+    threshold: float = BENCHMARK_REGRESSION_THRESHOLD_DEFAULT,
+    key: str = "p50",
+) -> list[str]:
+    """compare results with baseline json file, print table of ratios
+
+    Args:
+        baselineFilePath (str): json file of baseline run, see write_Results
+        results (list[BenchmarkResult]): actual benchmark results
+        threshold (float, optional): relative slowdown reported as regression. Defaults to BENCHMARK_REGRESSION_THRESHOLD_DEFAULT.
+        key (str, optional): compared summary value. Defaults to "p50".
+
+    Returns:
+        list[str]: names of regressed benchmarks
+    """
+    with open(baselineFilePath, "r") as jsonFile:
+        baselineResults = json.load(jsonFile)["results"]
+    regressions = []
+    print(f"\ncompare {key} with {baselineFilePath}:")
+    for result in results:
+        baseline = baselineResults.get(result.name, {}).get(key)
+        actual = result.summary.get(key)
+        if baseline is None or actual is None or baseline <= 0:
+            print(f"{result.name:<55} no baseline")
+            continue
+        ratio = actual / baseline
+        # lower is better for durations and bytes, higher for throughput units
+        regressed = (
+            ratio > 1 + threshold
+            if result.unit in BENCHMARK_LOWER_IS_BETTER_UNITS
+            else ratio < 1 - threshold
+        )
+        if regressed:
+            regressions.append(result.name)
+        print(
+            f"{result.name:<55} {_format_Value(baseline, result.unit):>11} -> "
+            f"{_format_Value(actual, result.unit):>11} x{ratio:.3f}"
+            f"{'  REGRESSION' if regressed else ''}"
+        )
+    return regressions
+
+
+def add_CommonArguments(parser: argparse.ArgumentParser) -> None:
+    """add output and compare arguments to benchmark command line parser"""
+    parser.add_argument("--output", help="write results to json file")
+    parser.add_argument("--compare", help="compare results with baseline json file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=BENCHMARK_REGRESSION_THRESHOLD_DEFAULT,
+        help="relative slowdown reported as regression",
+    )
+
+
+def finish(
+    args: argparse.Namespace, results: list[BenchmarkResult], benchmarkMetadata: dict
+) -> int:
+    """write and compare results as requested by command line arguments
+
+    Returns:
+        int: exit code, 1 if regressions found
+    """
+    if args.output:
+        write_Results(args.output, results, benchmarkMetadata)
+    if args.compare:
+        regressions = compare_Results(args.compare, results, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regressions: {', '.join(regressions)}")
+            return 1
+    return 0
@@ -0,0 +1,98 @@
+"""benchmarks of cold start cost, import time of sbc_communication modules in fresh interpreters
+
+run from repository root, e.g.:
+python -m benchmarks.bench_import --output import.json
+python -m benchmarks.bench_import --compare import.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from sbc_communication.skillexecutionmetrics import RollingHistogram
+from . import _benchmarkutils
+from ._benchmarkutils import BenchmarkResult
+
+BENCHMARK_IMPORT_MODULES_DEFAULT = [
+    "sbc_communication",
+    "sbc_communication.servertypes",
+    "sbc_communication.assetConnectionInfo",
+    "sbc_communication.assetskillscommunication_factory",
+    "sbc_communication.assetskillshandle",
+    "sbc_communication.opcua.assetskillscommunication_opcua_beckhoff",
+]
+
+# run in fresh interpreter, prints import time in seconds and if asyncua got loaded
+IMPORT_SCRIPT = """
+import json, sys, time
+startTime = time.perf_counter()
+import {module}
+print(json.dumps([time.perf_counter() - startTime, "asyncua" in sys.modules]))
+"""
+
+
+def measure_Import(module: str) -> tuple[float, bool]:
+    """import module in fresh interpreter
+
+    Args:
+        module (str): module name, e.g. "sbc_communication"
+
+    Returns:
+        tuple[float, bool]: import time in seconds, True if asyncua got loaded
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(path for path in sys.path if path)
+    completed = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT.format(module=module)],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    importTime, asyncuaLoaded = json.loads(completed.stdout.splitlines()[-1])
+    return importTime, asyncuaLoaded
+
+
+def run_Benchmarks(args: argparse.Namespace) -> list[BenchmarkResult]:
+    results: list[BenchmarkResult] = []
+    for module in args.modules:
+        histogram = RollingHistogram(windowSize=max(args.repeat, 1))
+        asyncuaLoaded = False
+        for i in range(args.repeat):
+            importTime, asyncuaLoaded = measure_Import(module)
+            histogram.add(importTime)
+        result = BenchmarkResult(
+            name=f"import/{module}",
+            summary=histogram.summary(),
+            extra={"asyncuaLoaded": asyncuaLoaded},
+        )
+        _benchmarkutils.print_Result(result)
+        results.append(result)
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.bench_import",
+        description="benchmarks of import time of sbc_communication modules",
+    )
+    parser.add_argument(
+        "--modules",
+        nargs="+",
+        default=BENCHMARK_IMPORT_MODULES_DEFAULT,
+        help="imported modules, each in fresh interpreters",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=10, help="count of fresh interpreters per module"
+    )
+    _benchmarkutils.add_CommonArguments(parser)
+    args = parser.parse_args(argv)
+
+    results = run_Benchmarks(args)
+    benchmarkMetadata = _benchmarkutils.get_Metadata(**vars(args))
+    return _benchmarkutils.finish(args, results, benchmarkMetadata)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
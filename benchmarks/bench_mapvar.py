@@ -0,0 +1,223 @@
+"""microbenchmarks of mapVar, mapObject and mapList with synthetic ST_SkillData like structs
+
+run from repository root, e.g.:
+python -m benchmarks.bench_mapvar --output mapvar.json
+python -m benchmarks.bench_mapvar --compare mapvar.json
+"""
+
+import argparse
+import copy
+import sys
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Callable
+from sbc_communication import mapVar as mapVarModule
+from . import _benchmarkutils, _mapvarreference
+from ._benchmarkutils import BenchmarkResult, measure
+
+BENCHMARK_PARAMETER_COUNTS_DEFAULT = [1, 10, 50, 100, 250, 500]
+
+
+@dataclass
+class SynLimits:
+    """nested struct of synthetic parameter"""
+
+    fMin: float = 0.0
+    fMax: float = 0.0
+
+
+@dataclass
+class SynParameter:
+    """synthetic ST_Parameter like struct"""
+
+    strName: str = ""
+    strValue: str = ""
+    strUnit: str = ""
+    stLimits: SynLimits = field(default_factory=SynLimits)
+
+
+@dataclass
+class SynSkillData:
+    """synthetic ST_SkillData like struct"""
+
+    strName: str = ""
+    iParameterCount: int = 0
+    astParameters: list[SynParameter] = field(default_factory=list)
+
+
+class SynUaParameter:
+    """synthetic parameter as plain object, like opc ua structs without dataclass"""
+
+    def __init__(self):
+        self.strName = ""
+        self.strValue = ""
+        self.strUnit = ""
+        self.stLimits = SynLimits()
+
+
+def create_SkillData(parameterCount: int, parameterType: type = SynParameter):
+    """create synthetic skill data with filled parameters
+
+    Args:
+        parameterCount (int): count of parameters
+        parameterType (type, optional): type of parameters. Defaults to SynParameter.
+
+    Returns:
+        SynSkillData: skill data
+    """
+    astParameters = []
+    for i in range(parameterCount):
+        parameter = parameterType()
+        parameter.strName = f"Parameter{i}"
+        parameter.strValue = str(i * 1.5)
+        parameter.strUnit = "mm"
+        parameter.stLimits = SynLimits(fMin=-i, fMax=i)
+        astParameters.append(parameter)
+    return SynSkillData(
+        strName="SynSkill", iParameterCount=parameterCount, astParameters=astParameters
+    )
+
+
+def create_Scenarios(
+    parameterCount: int,
+) -> dict[str, Callable[[], tuple[Callable, tuple, dict]]]:
+    """get mapping scenarios of read and write paths, each creates fresh target data
+
+    Args:
+        parameterCount (int): count of parameters
+
+    Returns:
+        dict[str, Callable]: scenario name -> factory of (mapping function name, args, kwargs)
+    """
+    source = create_SkillData(parameterCount)
+    plainSource = create_SkillData(parameterCount, SynUaParameter)
+
+    def readSkillData():
+        # read_stSkillData: target list preallocated to iParameterCount
+        target = create_SkillData(parameterCount)
+        for parameter in target.astParameters:
+            parameter.strValue = ""
+        return "mapVar", (source, target), {"maxListLength": parameterCount}
+
+    def readPlainSkillData():
+        target = create_SkillData(parameterCount)
+        return "mapVar", (plainSource, target), {"maxListLength": parameterCount}
+
+    def growList():
+        # target list with one element grows up to maxListLength
+        target = create_SkillData(1)
+        return "mapVar", (source, target), {"maxListLength": parameterCount}
+
+    def mapParameterList():
+        # write_stSkillData_astParameters: parameter list only
+        target = create_SkillData(parameterCount, SynUaParameter).astParameters
+        return (
+            "mapList",
+            (source.astParameters, target),
+            {"maxListLength": parameterCount},
+        )
+
+    def mapSingleObject():
+        target = SynParameter()
+        return "mapObject", (source.astParameters[-1], target), {}
+
+    return {
+        "mapVar_skillData": readSkillData,
+        "mapVar_plainObjects": readPlainSkillData,
+        "mapVar_growList": growList,
+        "mapList_parameters": mapParameterList,
+        "mapObject_parameter": mapSingleObject,
+    }
+
+
+def check_Scenario(scenario: Callable[[], tuple[str, tuple, dict]]) -> None:
+    """check mapping result of sbc_communication.mapVar against frozen reference implementation
+
+    Raises:
+        AssertionError: results differ
+    """
+    functionName, args, kwargs = scenario()
+    referenceArgs = copy.deepcopy(args)
+    getattr(mapVarModule, functionName)(*args, **kwargs)
+    getattr(_mapvarreference, functionName)(*referenceArgs, **kwargs)
+    if _asComparable(args[1]) != _asComparable(referenceArgs[1]):
+        raise AssertionError(f"{functionName} result differs from reference")
+
+
+def _asComparable(obj):
+    if isinstance(obj, list):
+        return [_asComparable(element) for element in obj]
+    if hasattr(obj, "__dict__"):
+        return {key: _asComparable(value) for key, value in vars(obj).items()}
+    return obj
+
+
+def measure_PeakBytes(scenario: Callable[[], tuple[str, tuple, dict]]) -> int:
+    """measure peak of allocated memory during one mapping call
+
+    Returns:
+        int: peak bytes, allocated by mapping call
+    """
+    functionName, args, kwargs = scenario()
+    function = getattr(mapVarModule, functionName)
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        currentBytes, _ = tracemalloc.get_traced_memory()
+        function(*args, **kwargs)
+        _, peakBytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peakBytes - currentBytes
+
+
+def run_Benchmarks(args: argparse.Namespace) -> list[BenchmarkResult]:
+    results: list[BenchmarkResult] = []
+    for parameterCount in args.parameter_counts:
+        for scenarioName, scenario in create_Scenarios(parameterCount).items():
+            check_Scenario(scenario)
+            calls = []
+
+            def setup():
+                calls.clear()
+                calls.append(scenario())
+
+            def call():
+                functionName, functionArgs, functionKwargs = calls[-1]
+                getattr(mapVarModule, functionName)(*functionArgs, **functionKwargs)
+
+            result = measure(
+                f"{scenarioName}[{parameterCount}]",
+                call,
+                repeat=max(args.repeat // max(parameterCount // 50, 1), 5),
+                setup=setup,
+                extra={"peakBytes": measure_PeakBytes(scenario)},
+            )
+            results.append(result)
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.bench_mapvar",
+        description="microbenchmarks of sbc_communication.mapVar",
+    )
+    parser.add_argument(
+        "--parameter-counts",
+        type=int,
+        nargs="+",
+        default=BENCHMARK_PARAMETER_COUNTS_DEFAULT,
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=200, help="count of measured calls"
+    )
+    _benchmarkutils.add_CommonArguments(parser)
+    args = parser.parse_args(argv)
+
+    results = run_Benchmarks(args)
+    benchmarkMetadata = _benchmarkutils.get_Metadata(**vars(args))
+    return _benchmarkutils.finish(args, results, benchmarkMetadata)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,290 @@
+"""benchmarks of skill execution logic and multi asset scheduling with in memory simulated assets,
+without network or server (ServerTypes.Memory)
+
+run from repository root, e.g.:
+python -m benchmarks.bench_memoryasset --output memory.json
+python -m benchmarks.bench_memoryasset --assets 1 10 100 --request-latency 0.001
+"""
+
+import argparse
+import sys
+import threading
+import time
+from functools import partial
+from sbc_communication.assetskillscommunication_factory import (
+    createAssetSkillCommunication,
+    ServerTypes,
+)
+from sbc_communication.assetskillshandle import AssetSkillsHandle
+from sbc_communication.memory.assetskillscommunication_memory import (
+    MemoryConnectionInfo,
+)
+from sbc_communication.skillexecutionhandler import SkillExecutionHandler
+from sbc_communication.skillexecutionmetrics import RollingHistogram
+from . import _benchmarkutils
+from ._benchmarkutils import BenchmarkResult, measure, measure_Throughput
+
+BENCHMARK_ASSET_COUNTS_DEFAULT = [1, 10, 50]
+BENCHMARK_SKILL_NAME = "SimSkill0000"
+
+
+def create_AssetHandle(
+    args: argparse.Namespace,
+    assetName: str,
+    eagerReset: bool = False,
+    adaptiveWait: bool = False,
+) -> AssetSkillsHandle:
+    """create connected asset handle with in memory simulated asset
+
+    Returns:
+        AssetSkillsHandle: asset handle with read skills
+    """
+    connectionInfo = MemoryConnectionInfo(
+        testSkills=False,
+        generatedSkillCount=1,
+        generatedParameterCount=args.parameters,
+        generatedReturnParameterCount=args.return_parameters,
+        executionTime=args.execution_time,
+        transitionTime=args.transition_time,
+        requestLatency=args.request_latency,
+    )
+    assetHandle = AssetSkillsHandle(
+        assetName=assetName,
+        assetSkillCommunication=createAssetSkillCommunication(
+            ServerTypes.Memory, connectionInfo
+        ),
+        skillExecutionHandlerClass=partial(
+            SkillExecutionHandler,
+            assetSkillsCycleTime=args.cycle_time,
+            eagerReset=eagerReset,
+            adaptiveWait=adaptiveWait,
+        ),
+    )
+    assetHandle.read_availableSkills()
+    return assetHandle
+
+
+def run_Benchmarks(args: argparse.Namespace) -> list[BenchmarkResult]:
+    results: list[BenchmarkResult] = []
+    parameters = {f"Parameter{j}": str(j) for j in range(args.parameters)}
+    assetHandle = create_AssetHandle(args, "Benchmark")
+    skillCom = assetHandle.skillCom
+    results.append(
+        measure(
+            "memory/read_stSkillState",
+            lambda: skillCom.read_stSkillState(BENCHMARK_SKILL_NAME),
+            repeat=args.repeat * 10,
+        )
+    )
+    results.append(
+        measure(
+            "memory/executeSkill",
+            lambda: assetHandle.executeSkill(BENCHMARK_SKILL_NAME, **parameters),
+            repeat=args.repeat * 5,
+        )
+    )
+    results.append(
+        measure_Throughput(
+            "memory/executeSkill_throughput",
+            lambda: assetHandle.executeSkill(BENCHMARK_SKILL_NAME, **parameters),
+            duration=args.duration,
+        )
+    )
+    for eagerReset in [False, True]:
+        results.append(_benchmark_NextJob(args, parameters, eagerReset))
+    for adaptiveWait in [False, True]:
+        results.append(_benchmark_Wait(args, parameters, adaptiveWait))
+    for executeMany in [False, True]:
+        results.append(_benchmark_Batch(args, parameters, executeMany))
+    for assetCount in args.assets:
+        results.append(_benchmark_Fleet(args, assetCount, parameters))
+    return results
+
+
+def _benchmark_NextJob(
+    args: argparse.Namespace, parameters: dict[str, str], eagerReset: bool
+) -> BenchmarkResult:
+    """executeSkill latency of jobs with --job-interval seconds in between,
+    with reset at start of next job or eager reset after results are read"""
+    assetHandle = create_AssetHandle(args, "Benchmark", eagerReset)
+    return measure(
+        f"memory/executeSkill_nextJob[{'eagerReset' if eagerReset else 'reset'}]",
+        lambda: assetHandle.executeSkill(BENCHMARK_SKILL_NAME, **parameters),
+        repeat=args.repeat,
+        setup=lambda: time.sleep(args.job_interval),
+    )
+
+
+def _benchmark_Wait(
+    args: argparse.Namespace, parameters: dict[str, str], adaptiveWait: bool
+) -> BenchmarkResult:
+    """executeSkill latency and requests per call of skills with --wait-execution-time seconds in Execute state,
+    with fixed polling at --wait-cycle-time or adaptive wait by learned durations"""
+    waitArgs = argparse.Namespace(
+        **{
+            **vars(args),
+            "execution_time": args.wait_execution_time,
+            "cycle_time": args.wait_cycle_time,
+        }
+    )
+    assetHandle = create_AssetHandle(waitArgs, "Benchmark", adaptiveWait=adaptiveWait)
+    skillCom = assetHandle.skillCom
+    # learn durations of skill
+    for i in range(5):
+        assetHandle.executeSkill(BENCHMARK_SKILL_NAME, **parameters)
+    repeat = max(args.repeat // 10, 1)
+    histogram = RollingHistogram(windowSize=repeat)
+    requestCount = skillCom.requestCount
+    for i in range(repeat):
+        startTime = time.perf_counter()
+        assetHandle.executeSkill(BENCHMARK_SKILL_NAME, **parameters)
+        histogram.add(time.perf_counter() - startTime)
+    result = BenchmarkResult(
+        name=f"memory/executeSkill_wait[{'adaptive' if adaptiveWait else 'fixed'}]",
+        summary=histogram.summary(),
+        extra={"requestsPerCall": (skillCom.requestCount - requestCount) / repeat},
+    )
+    _benchmarkutils.print_Result(result)
+    return result
+
+
+def _benchmark_Batch(
+    args: argparse.Namespace, parameters: dict[str, str], executeMany: bool
+) -> BenchmarkResult:
+    """latency per result of a batch of executions with --job-interval seconds processing of each result,
+    by executeSkill in a loop or by executeMany"""
+    assetHandle = create_AssetHandle(args, "Benchmark")
+    skillCom = assetHandle.skillCom
+    repeat = max(args.repeat // 10, 1)
+    parameterSets = [parameters] * repeat
+    histogram = RollingHistogram(windowSize=repeat)
+    requestCount = skillCom.requestCount
+    startTime = time.perf_counter()
+    if executeMany:
+        results = assetHandle.executeMany(BENCHMARK_SKILL_NAME, parameterSets)
+    else:
+        results = (
+            assetHandle.executeSkill(BENCHMARK_SKILL_NAME, **parameterSet)
+            for parameterSet in parameterSets
+        )
+    for ret in results:
+        histogram.add(time.perf_counter() - startTime)
+        # processing of result, not measured
+        time.sleep(args.job_interval)
+        startTime = time.perf_counter()
+    result = BenchmarkResult(
+        name=f"memory/executeSkill_batch[{'executeMany' if executeMany else 'loop'}]",
+        summary=histogram.summary(),
+        extra={"requestsPerCall": (skillCom.requestCount - requestCount) / repeat},
+    )
+    _benchmarkutils.print_Result(result)
+    return result
+
+
+def _benchmark_Fleet(
+    args: argparse.Namespace, assetCount: int, parameters: dict[str, str]
+) -> BenchmarkResult:
+    """execute skills of assetCount assets in parallel threads for duration,
+    measure latency and throughput of all executions"""
+    assetHandles = [create_AssetHandle(args, f"Asset{i}") for i in range(assetCount)]
+    latencies: list[list[float]] = [[] for i in range(assetCount)]
+    endTime = time.perf_counter() + args.duration
+
+    def executeLoop(index: int):
+        assetHandle = assetHandles[index]
+        now = time.perf_counter()
+        while now < endTime:
+            assetHandle.executeSkill(BENCHMARK_SKILL_NAME, **parameters)
+            lastTime, now = now, time.perf_counter()
+            latencies[index].append(now - lastTime)
+
+    threads = [
+        threading.Thread(target=executeLoop, args=(i,)) for i in range(assetCount)
+    ]
+    startTime = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    duration = time.perf_counter() - startTime
+    allLatencies = [
+        latency for assetLatencies in latencies for latency in assetLatencies
+    ]
+    histogram = RollingHistogram(windowSize=max(len(allLatencies), 1))
+    for latency in allLatencies:
+        histogram.add(latency)
+    result = BenchmarkResult(
+        name=f"memory/fleet_executeSkill[{assetCount}]",
+        summary=histogram.summary(),
+        extra={"throughput": len(allLatencies) / duration},
+    )
+    _benchmarkutils.print_Result(result)
+    return result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.bench_memoryasset",
+        description="benchmarks of skill execution with in memory simulated assets",
+    )
+    parser.add_argument(
+        "--assets",
+        type=int,
+        nargs="+",
+        default=BENCHMARK_ASSET_COUNTS_DEFAULT,
+        help="count of assets executing in parallel threads",
+    )
+    parser.add_argument("--parameters", type=int, default=5)
+    parser.add_argument("--return-parameters", type=int, default=2)
+    parser.add_argument(
+        "--execution-time", type=float, default=0.0, help="seconds in Execute state"
+    )
+    parser.add_argument(
+        "--transition-time",
+        type=float,
+        default=0.0,
+        help="seconds in Starting, Completing, Resetting states",
+    )
+    parser.add_argument(
+        "--request-latency", type=float, default=0.0, help="seconds per request"
+    )
+    parser.add_argument(
+        "--cycle-time",
+        type=float,
+        default=0.0,
+        help="assetSkillsCycleTime of SkillExecutionHandler",
+    )
+    parser.add_argument(
+        "--wait-execution-time",
+        type=float,
+        default=0.05,
+        help="seconds in Execute state of executeSkill_wait benchmarks",
+    )
+    parser.add_argument(
+        "--wait-cycle-time",
+        type=float,
+        default=0.02,
+        help="assetSkillsCycleTime of executeSkill_wait benchmarks",
+    )
+    parser.add_argument(
+        "--job-interval",
+        type=float,
+        default=0.01,
+        help="seconds between jobs of executeSkill_nextJob and executeSkill_batch benchmarks",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=200, help="count of measured calls"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=2.0, help="seconds of throughput benchmarks"
+    )
+    _benchmarkutils.add_CommonArguments(parser)
+    args = parser.parse_args(argv)
+
+    results = run_Benchmarks(args)
+    benchmarkMetadata = _benchmarkutils.get_Metadata(**vars(args))
+    return _benchmarkutils.finish(args, results, benchmarkMetadata)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
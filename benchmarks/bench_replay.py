@@ -0,0 +1,194 @@
+"""benchmarks of client side cost of discovery (connect, searchfor_Skills, read_SkillDatas) on recorded opc ua traffic,
+replayed without server. Compares client versions on identical traffic, e.g. of a real plc.
+
+run from repository root, e.g.:
+python -m benchmarks.bench_replay --record plc.jsonl --server-type beckhoff --opc-url opc.tcp://<plc>:4840 --opc-user <user> --opc-password <password>
+python -m benchmarks.bench_replay --recording plc.jsonl --output replay.json
+without --record or --recording, a session of the simulated skill server is recorded first
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+from sbc_communication.assetskillscommunication_factory import (
+    createAssetSkillCommunication,
+    createAssetSkillCommunication_OpcUa,
+    ServerTypes,
+    ServerTypesToClass,
+)
+from sbc_communication.opcua.assetskillscommunication_opcua import (
+    AssetSkillsCommunication_OPCUA,
+    OpcUaConnectionInfo,
+)
+from sbc_communication.opcua.opcuarecording import read_Recording
+from sbc_communication.simulation.simulatedskillserver import (
+    SERVER_TYPE_NAMES,
+    SimulatedSkillServer,
+    SimulatedSkillServerConfig,
+)
+from . import _benchmarkutils
+from ._benchmarkutils import BenchmarkResult, measure
+
+
+def run_Discovery(skillCom: AssetSkillsCommunication_OPCUA) -> int:
+    """recorded and replayed workload: connect, discover skills, read skill datas, disconnect
+
+    Returns:
+        int: count of found skills
+    """
+    skillCom.connect()
+    try:
+        skillCount = skillCom.searchfor_Skills()
+        skillCom.read_SkillDatas()
+    finally:
+        skillCom.disconnect()
+    return skillCount
+
+
+def record_Discovery(skillCom: AssetSkillsCommunication_OPCUA, filePath: str) -> int:
+    """record discovery workload of connected skill communication
+
+    Returns:
+        int: count of recorded requests
+    """
+    recorder = skillCom.start_OpcUaRecording(filePath)
+    try:
+        skillCount = run_Discovery(skillCom)
+    finally:
+        skillCom.stop_OpcUaRecording()
+    print(
+        f"# recorded {recorder.entryCount} requests, {skillCount} skills to {filePath}"
+    )
+    return recorder.entryCount
+
+
+def record_SimulatedDiscovery(args: argparse.Namespace, filePath: str) -> None:
+    config = SimulatedSkillServerConfig(
+        serverType=SERVER_TYPE_NAMES[args.server_type],
+        port=args.port,
+        testSkills=False,
+        generatedSkillCount=args.skills,
+        generatedParameterCount=args.parameters,
+    )
+    with SimulatedSkillServer(config) as server:
+        record_Discovery(
+            createAssetSkillCommunication(config.serverType, server.connectionInfo),
+            filePath,
+        )
+
+
+def create_ReplaySkillCom(
+    filePath: str, speed: float | None = None, latencyOnly: bool = False
+) -> AssetSkillsCommunication_OPCUA:
+    """create skill communication of recorded server type, replaying recording
+
+    Args:
+        filePath (str): recording json lines file
+        speed (float | None, optional): see AssetSkillsCommunication_OPCUA.set_OpcUaReplay. Defaults to None.
+        latencyOnly (bool, optional): see AssetSkillsCommunication_OPCUA.set_OpcUaReplay. Defaults to False.
+
+    Returns:
+        AssetSkillsCommunication_OPCUA: skill communication, not connected
+    """
+    header, _ = read_Recording(filePath)
+    for serverType, commClass in ServerTypesToClass.items():
+        if commClass.__name__ == header.get("communicationClass"):
+            break
+    else:
+        serverType = ServerTypes.OPC_UA_Python_Asyncua
+    skillCom = createAssetSkillCommunication(
+        serverType, OpcUaConnectionInfo(opc_url=header["opc_url"])
+    )
+    skillCom.set_OpcUaReplay(filePath, speed, latencyOnly)
+    return skillCom
+
+
+def run_Benchmarks(args: argparse.Namespace, filePath: str) -> list[BenchmarkResult]:
+    skillComs = []
+
+    def setup():
+        skillComs.clear()
+        skillComs.append(create_ReplaySkillCom(filePath, args.speed, args.latency_only))
+
+    _, entries = read_Recording(filePath)
+    name = os.path.splitext(os.path.basename(filePath))[0]
+    return [
+        measure(
+            f"replay/{name}/discovery",
+            lambda: run_Discovery(skillComs[-1]),
+            repeat=args.repeat,
+            setup=setup,
+            extra={"requests": len(entries)},
+        )
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.bench_replay",
+        description="benchmarks of discovery on recorded opc ua traffic",
+    )
+    parser.add_argument("--recording", help="replay this recording json lines file")
+    parser.add_argument(
+        "--record",
+        help="record discovery of --opc-url (or simulated server) to file and exit",
+    )
+    parser.add_argument("--opc-url", help="record real server, else simulated server")
+    parser.add_argument("--opc-user")
+    parser.add_argument("--opc-password")
+    parser.add_argument("--root-node-id")
+    parser.add_argument(
+        "--server-type", choices=SERVER_TYPE_NAMES.keys(), default="beckhoff"
+    )
+    parser.add_argument("--port", type=int, default=4844)
+    parser.add_argument("--skills", type=int, default=100)
+    parser.add_argument("--parameters", type=int, default=5)
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=None,
+        help="replay recorded offsets and latencies divided by speed, default as fast as possible",
+    )
+    parser.add_argument(
+        "--latency-only",
+        action="store_true",
+        help="with --speed, replay recorded latencies only, not recorded offsets",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=10, help="count of measured calls"
+    )
+    _benchmarkutils.add_CommonArguments(parser)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.ERROR)
+
+    if args.record:
+        if args.opc_url:
+            record_Discovery(
+                createAssetSkillCommunication_OpcUa(
+                    serverType=SERVER_TYPE_NAMES[args.server_type],
+                    opc_url=args.opc_url,
+                    opc_user=args.opc_user,
+                    opc_password=args.opc_password,
+                    rootNodeId=args.root_node_id,
+                ),
+                args.record,
+            )
+        else:
+            record_SimulatedDiscovery(args, args.record)
+        return 0
+
+    if args.recording:
+        results = run_Benchmarks(args, args.recording)
+    else:
+        with tempfile.TemporaryDirectory() as directory:
+            filePath = os.path.join(directory, f"{args.server_type}.jsonl")
+            record_SimulatedDiscovery(args, filePath)
+            results = run_Benchmarks(args, filePath)
+    benchmarkMetadata = _benchmarkutils.get_Metadata(**vars(args))
+    return _benchmarkutils.finish(args, results, benchmarkMetadata)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,306 @@
+"""benchmarks of discovery, read, write and execute paths against the simulated skill server
+
+run from repository root, e.g.:
+python -m benchmarks.bench_skillcommunication --server-type beckhoff --output results.json
+python -m benchmarks.bench_skillcommunication --compare results.json
+"""
+
+import argparse
+import logging
+import sys
+import threading
+import time
+from sbc_communication.assetskillscommunication_factory import (
+    createAssetSkillCommunication,
+)
+from sbc_communication.assetskillshandle import AssetSkillsHandle
+from sbc_communication.simulation.simulatedskillserver import (
+    SERVER_TYPE_NAMES,
+    SimulatedSkillServer,
+    SimulatedSkillServerConfig,
+)
+from sbc_communication.skillexecutionmetrics import RollingHistogram
+from . import _benchmarkutils
+from ._benchmarkutils import BenchmarkResult, measure, measure_Throughput
+
+BENCHMARK_SKILL_COUNTS_DEFAULT = [10, 100, 1000]
+BENCHMARK_SKILL_NAME = "SimSkill0000"
+
+
+def run_Benchmarks(args: argparse.Namespace) -> list[BenchmarkResult]:
+    """run benchmarks for each skill count, each with own simulated skill server
+
+    Returns:
+        list[BenchmarkResult]: results of all benchmarks
+    """
+    serverType = SERVER_TYPE_NAMES[args.server_type]
+    results: list[BenchmarkResult] = []
+    for i, skillCount in enumerate(args.skill_counts):
+        config = SimulatedSkillServerConfig(
+            serverType=serverType,
+            port=args.port,
+            testSkills=False,
+            generatedSkillCount=skillCount,
+            generatedParameterCount=args.parameters,
+            generatedReturnParameterCount=args.return_parameters,
+            plcParameterListLength=args.plc_parameter_list_length,
+            executionTime=args.execution_time,
+            browseDepth=args.browse_depth,
+        )
+        startTime = time.perf_counter()
+        with SimulatedSkillServer(config) as server:
+            print(
+                f"# {serverType.name}: {skillCount} skills, "
+                f"server started in {time.perf_counter() - startTime:.1f}s",
+                flush=True,
+            )
+            prefix = f"{args.server_type}/"
+            # skill count independent benchmarks only with first server
+            if i == 0:
+                results.append(_benchmark_Connect(server, args, prefix))
+            results.extend(
+                _benchmark_Skills(
+                    server, args, prefix, skillCount, withSingleSkill=i == 0
+                )
+            )
+    return results
+
+
+def _create_SkillCom(server: SimulatedSkillServer):
+    return createAssetSkillCommunication(
+        server.config.serverType, server.connectionInfo
+    )
+
+
+def _benchmark_Connect(
+    server: SimulatedSkillServer, args: argparse.Namespace, prefix: str
+) -> BenchmarkResult:
+    skillComs = []
+
+    def setup():
+        while skillComs:
+            skillComs.pop().disconnect()
+        skillComs.append(_create_SkillCom(server))
+
+    result = measure(
+        f"{prefix}connect",
+        lambda: skillComs[-1].connect(),
+        repeat=args.repeat,
+        setup=setup,
+    )
+    setup()
+    return result
+
+
+def _benchmark_Skills(
+    server: SimulatedSkillServer,
+    args: argparse.Namespace,
+    prefix: str,
+    skillCount: int,
+    withSingleSkill: bool,
+) -> list[BenchmarkResult]:
+    results: list[BenchmarkResult] = []
+    skillCom = _create_SkillCom(server)
+    skillCom.connect()
+    try:
+        # discovery of many skills is slow, measure less often
+        discoveryRepeat = max(min(args.repeat, 10_000 // skillCount), 3)
+        results.append(
+            measure(
+                f"{prefix}searchfor_Skills[{skillCount}]",
+                skillCom.searchfor_Skills,
+                repeat=discoveryRepeat,
+            )
+        )
+        results.append(
+            measure(
+                f"{prefix}read_SkillDatas[{skillCount}]",
+                skillCom.read_SkillDatas,
+                repeat=discoveryRepeat,
+            )
+        )
+        if not withSingleSkill:
+            return results
+
+        results.append(
+            measure(
+                f"{prefix}read_stSkillState",
+                lambda: skillCom.read_stSkillState(BENCHMARK_SKILL_NAME),
+                repeat=args.repeat * 10,
+            )
+        )
+        results.append(_benchmark_ConcurrentReads(skillCom, args, prefix))
+        results.extend(_benchmark_CommandsWhilePolling(skillCom, args, prefix))
+        results.append(
+            measure(
+                f"{prefix}write_stSkillData_astParameters",
+                lambda: skillCom.write_stSkillData_astParameters(BENCHMARK_SKILL_NAME),
+                repeat=args.repeat * 10,
+            )
+        )
+        assetHandle = AssetSkillsHandle(
+            assetName="Benchmark", assetSkillCommunication=skillCom
+        )
+        parameters = {
+            f"Parameter{j}": str(j)
+            for j in range(server.config.generatedParameterCount)
+        }
+        results.append(
+            measure(
+                f"{prefix}executeSkill",
+                lambda: assetHandle.executeSkill(BENCHMARK_SKILL_NAME, **parameters),
+                repeat=args.repeat * 5,
+            )
+        )
+        results.append(
+            measure_Throughput(
+                f"{prefix}executeSkill_throughput",
+                lambda: assetHandle.executeSkill(BENCHMARK_SKILL_NAME, **parameters),
+                duration=args.duration,
+            )
+        )
+    finally:
+        skillCom.disconnect()
+    return results
+
+
+def _benchmark_ConcurrentReads(
+    skillCom, args: argparse.Namespace, prefix: str
+) -> BenchmarkResult:
+    """read_stSkillState of same skill from --reader-threads threads, e.g. hmi poller, orchestrator and watchdog,
+    measure latency, throughput and opc ua requests per call (coalesced by skillCom.singleFlight)
+    """
+    threadCount = args.reader_threads
+    latencies: list[list[float]] = [[] for i in range(threadCount)]
+    barrier = threading.Barrier(threadCount)
+
+    def readLoop(index: int):
+        barrier.wait()
+        for i in range(args.repeat * 10):
+            startTime = time.perf_counter()
+            skillCom.read_stSkillState(BENCHMARK_SKILL_NAME)
+            latencies[index].append(time.perf_counter() - startTime)
+
+    threads = [threading.Thread(target=readLoop, args=(i,)) for i in range(threadCount)]
+    requestCount = skillCom.requestCount
+    if skillCom.singleFlight is not None:
+        skillCom.singleFlight.reset()
+    startTime = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    duration = time.perf_counter() - startTime
+    allLatencies = [
+        latency for threadLatencies in latencies for latency in threadLatencies
+    ]
+    histogram = RollingHistogram(windowSize=len(allLatencies))
+    for latency in allLatencies:
+        histogram.add(latency)
+    extra = {
+        "throughput": len(allLatencies) / duration,
+        "requestsPerCall": (skillCom.requestCount - requestCount) / len(allLatencies),
+    }
+    if skillCom.singleFlight is not None:
+        operations = skillCom.singleFlight.snapshot()["operations"]
+        if "read_stSkillState" in operations:
+            extra["coalescingRatio"] = operations["read_stSkillState"][
+                "coalescingRatio"
+            ]
+    result = BenchmarkResult(
+        name=f"{prefix}read_stSkillState_concurrent[{threadCount}]",
+        summary=histogram.summary(),
+        extra=extra,
+    )
+    _benchmarkutils.print_Result(result)
+    return result
+
+
+def _benchmark_CommandsWhilePolling(
+    skillCom, args: argparse.Namespace, prefix: str
+) -> list[BenchmarkResult]:
+    """write_SingleSkillCommand while --reader-threads threads poll skill data, e.g. hmi pollers,
+    measure command latency with and without skillCom.requestScheduler
+    """
+    requestScheduler = skillCom.requestScheduler
+    results: list[BenchmarkResult] = []
+    for name, scheduler in [("scheduled", requestScheduler), ("unscheduled", None)]:
+        skillCom.requestScheduler = scheduler
+        polling = threading.Event()
+        polling.set()
+
+        def pollLoop():
+            while polling.is_set():
+                skillCom.read_stSkillData(BENCHMARK_SKILL_NAME, False)
+
+        pollers = [
+            threading.Thread(target=pollLoop) for i in range(args.reader_threads)
+        ]
+        for poller in pollers:
+            poller.start()
+        try:
+            result = measure(
+                f"{prefix}write_SingleSkillCommand_{name}[{args.reader_threads}]",
+                lambda: skillCom.write_SingleSkillCommand(
+                    BENCHMARK_SKILL_NAME, "Reset"
+                ),
+                repeat=args.repeat * 5,
+            )
+        finally:
+            polling.clear()
+            for poller in pollers:
+                poller.join()
+        results.append(result)
+    skillCom.requestScheduler = requestScheduler
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.bench_skillcommunication",
+        description="benchmarks of sbc_communication against simulated skill server",
+    )
+    parser.add_argument(
+        "--server-type", choices=SERVER_TYPE_NAMES.keys(), default="beckhoff"
+    )
+    parser.add_argument("--port", type=int, default=4843)
+    parser.add_argument(
+        "--skill-counts",
+        type=int,
+        nargs="+",
+        default=BENCHMARK_SKILL_COUNTS_DEFAULT,
+        help="count of skills on server for discovery benchmarks",
+    )
+    parser.add_argument("--parameters", type=int, default=5)
+    parser.add_argument("--return-parameters", type=int, default=2)
+    parser.add_argument("--plc-parameter-list-length", type=int, default=0)
+    parser.add_argument("--browse-depth", type=int, default=1)
+    parser.add_argument(
+        "--execution-time", type=float, default=0.0, help="seconds in Execute state"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=20, help="count of measured calls"
+    )
+    parser.add_argument(
+        "--reader-threads",
+        type=int,
+        default=8,
+        help="threads reading the same skill state concurrently",
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=5.0,
+        help="seconds of executeSkill throughput benchmark",
+    )
+    _benchmarkutils.add_CommonArguments(parser)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.ERROR)
+
+    results = run_Benchmarks(args)
+    benchmarkMetadata = _benchmarkutils.get_Metadata(**vars(args))
+    return _benchmarkutils.finish(args, results, benchmarkMetadata)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
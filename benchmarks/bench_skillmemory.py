@@ -0,0 +1,148 @@
+"""benchmarks of retained memory per skill of AssetSkillsCommunication_OPCUA after searchfor_Skills,
+e.g. skillConnectionNodes, skillDataHandles, against the simulated skill server
+
+run from repository root, e.g.:
+python -m benchmarks.bench_skillmemory --output skillmemory.json
+python -m benchmarks.bench_skillmemory --skill-counts 1000 10000 --compare skillmemory.json
+"""
+
+import argparse
+import gc
+import logging
+import sys
+import types
+from sbc_communication.assetskillscommunication_factory import (
+    createAssetSkillCommunication,
+)
+from sbc_communication.simulation.simulatedskillserver import (
+    SERVER_TYPE_NAMES,
+    SimulatedSkillServer,
+    SimulatedSkillServerConfig,
+)
+from sbc_communication.skillexecutionmetrics import RollingHistogram
+from . import _benchmarkutils
+from ._benchmarkutils import BenchmarkResult
+
+BENCHMARK_SKILL_COUNTS_DEFAULT = [100, 1000]
+# per skill attributes of AssetSkillsCommunication_OPCUA, filled by searchfor_Skills
+BENCHMARK_SKILL_ATTRIBUTES = [
+    "skillConnectionNodes",
+    "skillDataHandles",
+    "skillStructLayouts",
+    "skillParameterIndexes",
+]
+
+
+_NOT_RETAINED_TYPES = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+)
+
+
+def get_RetainedSize(obj, sharedObjects: list) -> int:
+    """get deep size in bytes of obj and all objects referenced by it, except types, modules,
+    functions and shared objects like the opc ua client
+
+    Args:
+        obj (): measured object, e.g. skillCom.skillConnectionNodes
+        sharedObjects (list): objects not counted and not followed
+
+    Returns:
+        int: retained bytes
+    """
+    seenIds = {id(sharedObject) for sharedObject in sharedObjects}
+    size = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seenIds or isinstance(current, _NOT_RETAINED_TYPES):
+            continue
+        seenIds.add(id(current))
+        size += sys.getsizeof(current)
+        stack.extend(gc.get_referents(current))
+    return size
+
+
+def get_SharedObjects(skillCom) -> list:
+    """get objects shared by all skills of skill communication, not counted per skill"""
+    opcClient = skillCom.opcClient
+    return [
+        skillCom,
+        opcClient,
+        opcClient.tloop,
+        opcClient.aio_obj,
+        opcClient.aio_obj.uaclient,
+    ]
+
+
+def run_Benchmarks(args: argparse.Namespace) -> list[BenchmarkResult]:
+    serverType = SERVER_TYPE_NAMES[args.server_type]
+    results: list[BenchmarkResult] = []
+    for skillCount in args.skill_counts:
+        config = SimulatedSkillServerConfig(
+            serverType=serverType,
+            port=args.port,
+            testSkills=False,
+            generatedSkillCount=skillCount,
+            generatedParameterCount=args.parameters,
+            browseDepth=args.browse_depth,
+        )
+        # server startup with thousands of skills takes longer than default timeout
+        server = SimulatedSkillServer(config).start(timeout=120.0)
+        try:
+            skillCom = createAssetSkillCommunication(
+                config.serverType, server.connectionInfo
+            )
+            skillCom.connect()
+            try:
+                skillCom.searchfor_Skills()
+                sharedObjects = get_SharedObjects(skillCom)
+                for attributeName in BENCHMARK_SKILL_ATTRIBUTES:
+                    retainedSize = get_RetainedSize(
+                        getattr(skillCom, attributeName), sharedObjects
+                    )
+                    histogram = RollingHistogram(windowSize=1)
+                    histogram.add(retainedSize / skillCount)
+                    result = BenchmarkResult(
+                        name=f"{args.server_type}/{attributeName}[{skillCount}]",
+                        unit="B",
+                        summary=histogram.summary(),
+                        extra={"totalBytes": retainedSize},
+                    )
+                    _benchmarkutils.print_Result(result)
+                    results.append(result)
+            finally:
+                skillCom.disconnect()
+        finally:
+            server.stop()
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.bench_skillmemory",
+        description="benchmarks of retained bytes per skill after searchfor_Skills",
+    )
+    parser.add_argument(
+        "--server-type", choices=SERVER_TYPE_NAMES.keys(), default="beckhoff"
+    )
+    parser.add_argument("--port", type=int, default=4845)
+    parser.add_argument(
+        "--skill-counts", type=int, nargs="+", default=BENCHMARK_SKILL_COUNTS_DEFAULT
+    )
+    parser.add_argument("--parameters", type=int, default=5)
+    parser.add_argument("--browse-depth", type=int, default=1)
+    _benchmarkutils.add_CommonArguments(parser)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.ERROR)
+
+    results = run_Benchmarks(args)
+    benchmarkMetadata = _benchmarkutils.get_Metadata(**vars(args))
+    return _benchmarkutils.finish(args, results, benchmarkMetadata)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,23 @@
-# import all submodules for better access overview
-from . import assetskillscommunication_factory
-from . import assetskillshandle
-from . import opcua
-from . import assetConnectionInfo
+# submodules for better access overview, imported on first access (PEP 562)
+# vendor classes and asyncua are loaded only when used
+import importlib
+
+__all__ = [
+    "assetskillscommunication_factory",
+    "assetskillshandle",
+    "opcua",
+    "memory",
+    "assetConnectionInfo",
+    "servertypes",
+    "requestpriority",
+]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
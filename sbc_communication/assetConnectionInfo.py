@@ -1,6 +1,6 @@
 import dataclasses
-from .opcua.assetskillscommunication_opcua import OpcUaConnectionInfo
-from .assetskillscommunication_factory import ServerTypes
+from .opcua.opcuaconnectioninfo import OpcUaConnectionInfo
+from .servertypes import ServerTypes
 
 
 @dataclasses.dataclass
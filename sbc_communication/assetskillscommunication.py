@@ -1,4 +1,7 @@
 import abc
+import logging
+import threading
+import time
 from dataclasses import dataclass
 from sbc_statemachine.skilldatahandle import SkillDataHandle
 from sbc_statemachine.skilldatatypes import (
@@ -6,6 +9,10 @@ from sbc_statemachine.skilldatatypes import (
     ST_Parameter,
     ST_SkillState,
 )
+from .skillparametercodec import SkillParameterCodec
+from .skillparameterindex import SkillParameterIndex
+
+_logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -14,12 +21,41 @@ class AssetSkillsComConnectionInfo:
 
 
 class AssetSkillsCommunication(abc.ABC):
-    """abstract class for handling the communication to multiple skills of one asset / machine."""
+    """abstract class for handling the communication to multiple skills of one asset / machine.
+
+    Concurrency model: one connected object may be shared by many threads (one session to the asset).
+    - read methods return snapshots: a new ST_SkillState / ST_SkillData object per read, which replaces the reference
+      in the skill data handle. Returned objects are not changed by later reads.
+    - stSkillDataCommand and stSkillDataDefault of a skill data handle are also the write buffers of the skill.
+      Changing and writing them is guarded by the per skill lock, see get_SkillLock.
+    - skillDataHandles and the per skill dicts are replaced as a whole by searchfor_Skills, not changed in place.
+    - executing the same skill from several threads at the same time is rejected by the skill state machine.
+    """
 
     def __init__(self, connectionInfo: AssetSkillsComConnectionInfo):
         self.connectionInfo = connectionInfo
         self.skillDataHandles: dict[str, SkillDataHandle] = {}
+        self.skillParameterIndexes: dict[str, SkillParameterIndex] = {}
+        # codecs compiled from parameter index, explicit types are kept over searchfor_Skills
+        self.skillParameterCodecs: dict[str, SkillParameterCodec] = {}
+        self.skillParameterTypes: dict[str, dict[str, type]] = {}
+        # cache of stSkillDataDefault (the snapshot in skill data handle), see read_stSkillDataDefault_cached
+        # validated against the asset only by searchfor_Skills (read_availableSkills), invalidate_SkillDataDefaults,
+        # skillDataDefaultMaxAge or opc ua subscription (subscribeSkillDataDefaults), not on each execution
+        # seconds a read stSkillDataDefault is used, None: until changed or invalidated
+        self.skillDataDefaultMaxAge: float | None = None
+        self.skillDataDefaultCacheTimes: dict[str, float] = {}
+        # incremented per skill, if a read stSkillDataDefault differs from the cached one
+        self.skillDataDefaultVersions: dict[str, int] = {}
+        # read stSkillDataCommand only on first use of skill, see load_stSkillDataCommand
+        self.lazySkillDataCommand: bool = False
+        # skills with stSkillDataCommand in skill data handle read or reset from stSkillDataDefault
+        self.skillDataCommandsLoaded: set[str] = set()
         self.connected = False
+        # count of requests sent to asset, incremented by communication implementation
+        self.requestCount: int = 0
+        # per skill locks, see get_SkillLock
+        self.skillLocks: dict[str, threading.RLock] = {}
 
     @abc.abstractmethod
     def connect(self) -> bool:
@@ -60,16 +96,86 @@ class AssetSkillsCommunication(abc.ABC):
         raise NotImplementedError
 
     def read_SkillDatas(self) -> bool:
-        """read all skill data by communication interface, update SkillData in self.skillDataHandles
+        """read all skill data by communication interface, update SkillData in self.skillDataHandles.
+        With self.lazySkillDataCommand, stSkillDataCommand is read only for skills already loaded.
 
         Returns:
             bool: returns True if successful
         """
         for skill in self.skillDataHandles:
-            self.read_stSkillData(skill, useSkillDataDefault=True)
-            self.read_stSkillData(skill, useSkillDataDefault=False)
+            self.read_stSkillDataDefault_cached(skill)
+            if not self.lazySkillDataCommand or self.is_SkillDataCommandLoaded(skill):
+                self.read_stSkillData(skill, useSkillDataDefault=False)
         return True
 
+    def is_SkillDataCommandLoaded(self, skillName: str) -> bool:
+        """check if stSkillDataCommand of skill in self.skillDataHandles is loaded
+
+        Args:
+            skillName (str): name of skill in self.SkillDataHandles.
+
+        Returns:
+            bool: True if read or reset from stSkillDataDefault
+        """
+        return skillName in self.skillDataCommandsLoaded
+
+    def load_stSkillDataCommand(self, skillName: str) -> ST_SkillData:
+        """get stSkillDataCommand of specific skill, read by communication interface on first use of skill
+
+        Args:
+            skillName (str): name of skill in self.SkillDataHandles.
+
+        Returns:
+            ST_SkillData: stSkillDataCommand or None, if not successful
+        """
+        if skillName in self.skillDataCommandsLoaded:
+            return self.skillDataHandles[skillName].stSkillDataCommand
+        return self.read_stSkillData(skillName, useSkillDataDefault=False)
+
+    def read_stSkillDataDefault_cached(self, skillName: str) -> ST_SkillData:
+        """get cached stSkillDataDefault of specific skill, read by communication interface only if not cached,
+        older than self.skillDataDefaultMaxAge or invalidated (see invalidate_SkillDataDefaults).
+        The cache is not validated against the asset by default, only searchfor_Skills reads all defaults again.
+
+        Args:
+            skillName (str): name of skill in self.SkillDataHandles.
+
+        Returns:
+            ST_SkillData: stSkillDataDefault or None, if not successful
+        """
+        if self.is_SkillDataDefaultCached(skillName):
+            return self.skillDataHandles[skillName].stSkillDataDefault
+        return self.read_stSkillData(skillName, useSkillDataDefault=True)
+
+    def is_SkillDataDefaultCached(self, skillName: str) -> bool:
+        """check if cached stSkillDataDefault of skill is valid
+
+        Args:
+            skillName (str): name of skill in self.SkillDataHandles.
+
+        Returns:
+            bool: True if read and not older than self.skillDataDefaultMaxAge and not invalidated
+        """
+        cacheTime = self.skillDataDefaultCacheTimes.get(skillName)
+        if cacheTime is None:
+            return False
+        return (
+            self.skillDataDefaultMaxAge is None
+            or time.monotonic() - cacheTime <= self.skillDataDefaultMaxAge
+        )
+
+    def invalidate_SkillDataDefaults(self, skillName: str | None = None) -> None:
+        """invalidate cached stSkillDataDefault, next read_stSkillDataDefault_cached reads from asset.
+        E.g. after skill defaults are changed on the asset.
+
+        Args:
+            skillName (str | None, optional): name of skill, None: all skills. Defaults to None.
+        """
+        if skillName is None:
+            self.skillDataDefaultCacheTimes = {}
+        else:
+            self.skillDataDefaultCacheTimes.pop(skillName, None)
+
     @abc.abstractmethod
     def read_stSkillData(
         self, skillName: str, useSkillDataDefault=True
@@ -85,15 +191,63 @@ class AssetSkillsCommunication(abc.ABC):
         """
         raise NotImplementedError
 
+    def read_stSkillData_astParameters_byIndexes(
+        self, skillName: str, indexes: tuple[int, ...], useSkillDataDefault=False
+    ) -> list[ST_Parameter]:
+        """read selected elements of astParameters from stSkillDataCommand or stSkillDataDefault of specific skill,
+        update SkillData in self.SkillDataHandles. Reads complete skill data, if not overwritten by communication interface.
+
+        Args:
+            skillName (str): name of skill in self.SkillDataHandles.
+            indexes (tuple[int, ...]): indexes of parameters in astParameters, e.g. SkillParameterIndex.returnIndexes
+            useSkillDataDefault (bool): read stSkillDataDefault or stSkillDataCommand
+
+        Returns:
+            list[ST_Parameter]: read parameters in order of indexes
+        """
+        astParameters = self.read_stSkillData(
+            skillName, useSkillDataDefault
+        ).astParameters
+        return [
+            astParameters[index]
+            for index in self._get_ExistingIndexes(
+                skillName, indexes, len(astParameters)
+            )
+        ]
+
+    @staticmethod
+    def _get_ExistingIndexes(
+        skillName: str, indexes: tuple[int, ...], parameterCount: int
+    ) -> list[int]:
+        """filter indexes to existing elements of astParameters, log indexes behind array end
+
+        Args:
+            skillName (str): name of skill, for log message
+            indexes (tuple[int, ...]): requested indexes of parameters in astParameters
+            parameterCount (int): length of astParameters
+
+        Returns:
+            list[int]: requested indexes smaller than parameterCount
+        """
+        existingIndexes = [index for index in indexes if index < parameterCount]
+        if len(existingIndexes) != len(indexes):
+            _logger.warning(
+                f"Skill {skillName}: parameter indexes "
+                f"{[index for index in indexes if index >= parameterCount]} "
+                f"out of range of astParameters with length {parameterCount}"
+            )
+        return existingIndexes
+
     @abc.abstractmethod
     def read_stSkillState(self, skillName: str) -> ST_SkillState:
-        """read stSkillState of specific skill by communication interface
+        """read stSkillState of specific skill by communication interface,
+        replaces stSkillState in self.skillDataHandles by the new snapshot
 
         Args:
             skillName (str): name of skill in self.SkillDatas.
 
         Returns:
-            ST_SkillState: Skillstate as ST_SkillState or None, if not successful
+            ST_SkillState: Skillstate as new ST_SkillState or None, if not successful
         """
         raise NotImplementedError
 
@@ -110,6 +264,20 @@ class AssetSkillsCommunication(abc.ABC):
         """
         raise NotImplementedError
 
+    def read_stSkillState_eActiveState(self, skillName: str) -> int:
+        """read only eActiveState of stSkillState of specific skill by communication interface,
+        lightweight probe for polling skill states, e.g. in SkillExecutionHandler.
+        Default reads member by read_stSkillState_member, communication interfaces may overwrite by a cheaper read,
+        which doesnt replace stSkillState in self.skillDataHandles.
+
+        Args:
+            skillName (str): name of skill in self.SkillDatas.
+
+        Returns:
+            int: eActiveState value (see ESkillStates)
+        """
+        return self.read_stSkillState_member(skillName, "eActiveState")
+
     @abc.abstractmethod
     def write_SingleSkillCommand(self, skillname: str, skillCommand: str) -> bool:
         """write single stSkillCommand (Start, Reset, ...) of specific skill by communication interface
@@ -158,22 +326,128 @@ class AssetSkillsCommunication(abc.ABC):
         """
         return self.skillDataHandles.keys()
 
+    def get_SkillLock(self, skillName: str) -> threading.RLock:
+        """get lock of skill, created on first use. Guards changing and writing the skill data buffers of the skill
+        and per skill structures of the communication implementation. Reentrant, e.g. set parameters and write them.
+
+        Args:
+            skillName (str): name of skill in self.SkillDatas.
+
+        Returns:
+            threading.RLock: lock of skill
+        """
+        lock = self.skillLocks.get(skillName)
+        if lock is None:
+            # setdefault is atomic, concurrent first calls get the same lock
+            lock = self.skillLocks.setdefault(skillName, threading.RLock())
+        return lock
+
+    def get_SkillParameterIndex(self, skillName: str) -> SkillParameterIndex:
+        """get parameter index of skill, build from stSkillDataDefault if not exists
+
+        Args:
+            skillName (str): name of skill in self.SkillDatas.
+
+        Returns:
+            SkillParameterIndex: parameter index of skill
+        """
+        parameterIndex = self.skillParameterIndexes.get(skillName)
+        if parameterIndex is None:
+            parameterIndex = self.update_SkillParameterIndex(skillName)
+        return parameterIndex
+
+    def update_SkillDataDefaultCache(
+        self, skillName: str, previousSkillDataDefault: ST_SkillData | None = None
+    ) -> None:
+        """mark stSkillDataDefault in self.skillDataHandles as cached. If changed, increment version
+        and build parameter index of skill. Called by communication implementation after reading stSkillDataDefault.
+
+        Args:
+            skillName (str): name of skill in self.SkillDatas.
+            previousSkillDataDefault (ST_SkillData | None, optional): replaced stSkillDataDefault. Defaults to None: changed.
+        """
+        stSkillDataDefault = self.skillDataHandles[skillName].stSkillDataDefault
+        if (
+            previousSkillDataDefault is None
+            or skillName not in self.skillParameterIndexes
+            or stSkillDataDefault != previousSkillDataDefault
+        ):
+            self.skillDataDefaultVersions[skillName] = (
+                self.skillDataDefaultVersions.get(skillName, 0) + 1
+            )
+            self.update_SkillParameterIndex(skillName)
+        self.skillDataDefaultCacheTimes[skillName] = time.monotonic()
+
+    def update_SkillParameterIndex(self, skillName: str) -> SkillParameterIndex:
+        """build parameter index of skill from stSkillDataDefault in self.skillDataHandles.
+        Called by update_SkillDataDefaultCache, if stSkillDataDefault changed.
+
+        Args:
+            skillName (str): name of skill in self.SkillDatas.
+
+        Returns:
+            SkillParameterIndex: new parameter index of skill
+        """
+        parameterIndex = SkillParameterIndex.fromSkillData(
+            self.skillDataHandles[skillName].stSkillDataDefault
+        )
+        self.skillParameterIndexes[skillName] = parameterIndex
+        return parameterIndex
+
+    def get_SkillParameterCodec(self, skillName: str) -> SkillParameterCodec:
+        """get parameter codec of skill, compiled from stSkillDataDefault and parameter types of skill,
+        recompiled if parameter index was rebuilt
+
+        Args:
+            skillName (str): name of skill in self.SkillDatas.
+
+        Returns:
+            SkillParameterCodec: parameter codec of skill
+        """
+        parameterIndex = self.get_SkillParameterIndex(skillName)
+        codec = self.skillParameterCodecs.get(skillName)
+        if codec is None or codec.parameterIndex is not parameterIndex:
+            codec = SkillParameterCodec.fromSkillData(
+                self.skillDataHandles[skillName].stSkillDataDefault,
+                parameterIndex,
+                self.skillParameterTypes.get(skillName),
+            )
+            self.skillParameterCodecs[skillName] = codec
+        return codec
+
+    def set_SkillParameterTypes(
+        self, skillName: str, parameterTypes: dict[str, type]
+    ) -> None:
+        """set explicit types of skill parameters, overrule types inferred from stSkillDataDefault
+
+        Args:
+            skillName (str): name of skill
+            parameterTypes (dict[str, type]): type by parameter name, str, int, float or bool
+        """
+        self.skillParameterTypes[skillName] = dict(parameterTypes)
+        self.skillParameterCodecs.pop(skillName, None)
+
     def reset_SkillDataCommand(self, skillName: str, useSkillDataDefault=True) -> bool:
-        """resets stSkillDataCommand to stSkillDataDefault
+        """resets stSkillDataCommand to stSkillDataDefault.
+        The cached stSkillDataDefault is used without request: defaults changed on the asset by other clients are not
+        seen until the cache is validated, see read_stSkillDataDefault_cached. Use skillDataDefaultMaxAge,
+        invalidate_SkillDataDefaults or opc ua subscribeSkillDataDefaults, if defaults change on the asset.
 
         Args:
             skillname (str): name of skill in self.SkillDatas.
-            useSkillDataDefault (bool, optional): call read_SkillDataDefault before resetting
+            useSkillDataDefault (bool, optional): get stSkillDataDefault by read_stSkillDataDefault_cached before resetting
 
         Returns:
             bool: True, if successful
         """
         if useSkillDataDefault:
-            ret = self.read_stSkillData(skillName, useSkillDataDefault=True) is not None
+            ret = self.read_stSkillDataDefault_cached(skillName) is not None
         else:
             ret = True
         if ret:
-            self.skillDataHandles[skillName].reset_SkillDataCommand()
+            with self.get_SkillLock(skillName):
+                self.skillDataHandles[skillName].reset_SkillDataCommand()
+            self.skillDataCommandsLoaded.add(skillName)
         return ret
 
     def get_stSkillData(
@@ -191,7 +465,7 @@ class AssetSkillsCommunication(abc.ABC):
         if useSkillDataDefault:
             return self.skillDataHandles[skillName].stSkillDataDefault
         else:
-            return self.skillDataHandles[skillName].stSkillDataCommand
+            return self.load_stSkillDataCommand(skillName)
 
     def set_stSkillData_astParameters(
         self, skillName: str, parameters: list[ST_Parameter], toSkillDataDefault=False
@@ -206,10 +480,13 @@ class AssetSkillsCommunication(abc.ABC):
         Returns:
             bool: True if successful
         """
-        for parameter in parameters:
-            if not self.skillDataHandles[skillName].set_Parameter(
-                setparam=parameter, toSkillDataDefault=toSkillDataDefault
-            ):
-                return False
-        else:
-            return True
+        if not toSkillDataDefault and self.load_stSkillDataCommand(skillName) is None:
+            return False
+        with self.get_SkillLock(skillName):
+            for parameter in parameters:
+                if not self.skillDataHandles[skillName].set_Parameter(
+                    setparam=parameter, toSkillDataDefault=toSkillDataDefault
+                ):
+                    return False
+            else:
+                return True
@@ -1,37 +1,96 @@
-import enum
+from __future__ import annotations
+import collections.abc
+import importlib
 from functools import partial
-from typing import Type
+from typing import TYPE_CHECKING, Type
 import json
-from asyncua.sync import SyncNode
 
 from .assetskillscommunication import (
     AssetSkillsCommunication,
     AssetSkillsComConnectionInfo,
 )
-from .opcua.assetskillscommunication_opcua import (
-    AssetSkillsCommunication_OPCUA,
+from .opcua.opcuaconnectioninfo import (
     OpcUaConnectionInfo,
     ASSET_SKILL_COMMUNICATION_OPC_TIMEOUT_DEFAULT,
+    OPC_UA_MAX_REQUESTS_IN_FLIGHT_DEFAULT,
+    OPC_UA_RATE_LIMIT_MAX_WAIT_DEFAULT,
 )
+from .memory.assetskillscommunication_memory import (
+    AssetSkillsCommunication_Memory,
+    MemoryConnectionInfo,
+)
+from .servertypes import ServerTypes
 from . import opcua
 
-
-class ServerTypes(enum.IntEnum):
-    """Enum for representing different server types for asset skill communication"""
-
-    OPC_UA_Beckhoff = 0
-    OPC_UA_Siemens = 1
-    OPC_UA_Python_Asyncua = 2
-    OPC_UA_BundR = 3
-
-
-# dict mapping server types to AssetSkillCommunication classes
-ServerTypesToClass = {
-    ServerTypes.OPC_UA_Beckhoff: opcua.assetskillscommunication_opcua_beckhoff.AssetSkillsCommunication_OPCUA_Beckhoff,
-    ServerTypes.OPC_UA_Siemens: opcua.assetskillscommunication_opcua_siemens.AssetSkillsCommunication_OPCUA_Siemens,
-    ServerTypes.OPC_UA_Python_Asyncua: opcua.assetskillscommunication_opcua_python_asyncua.AssetSkillsCommunication_OPCUA_Python_Asyncua,
-    ServerTypes.OPC_UA_BundR: opcua.assetskillscommunication_opcua_bundr.AssetSkillsCommunication_OPCUA_BundR,
-}
+# asyncua and vendor classes are imported on first use, see ServerTypesToClass
+if TYPE_CHECKING:
+    from asyncua.sync import SyncNode
+    from .opcua.assetskillscommunication_opcua import AssetSkillsCommunication_OPCUA
+
+
+class _LazyClassMapping(collections.abc.MutableMapping):
+    """mapping of keys to classes, the module of a class is imported on first access"""
+
+    def __init__(self, classPaths: dict[object, tuple[str, str]]):
+        """generate lazy class mapping
+
+        Args:
+            classPaths (dict[object, tuple[str, str]]): key -> (module name relative to this package, class name)
+        """
+        self._classPaths = dict(classPaths)
+        self._classes: dict[object, Type] = {}
+
+    def __getitem__(self, key) -> Type:
+        cls = self._classes.get(key)
+        if cls is None:
+            moduleName, className = self._classPaths[key]
+            module = importlib.import_module(moduleName, __package__)
+            cls = self._classes[key] = getattr(module, className)
+        return cls
+
+    def __setitem__(self, key, cls: Type) -> None:
+        self._classPaths[key] = (cls.__module__, cls.__name__)
+        self._classes[key] = cls
+
+    def __delitem__(self, key) -> None:
+        del self._classPaths[key]
+        self._classes.pop(key, None)
+
+    def __contains__(self, key) -> bool:
+        return key in self._classPaths
+
+    def __iter__(self):
+        return iter(self._classPaths)
+
+    def __len__(self) -> int:
+        return len(self._classPaths)
+
+
+# dict mapping server types to AssetSkillCommunication classes, imported on first access
+ServerTypesToClass = _LazyClassMapping(
+    {
+        ServerTypes.OPC_UA_Beckhoff: (
+            ".opcua.assetskillscommunication_opcua_beckhoff",
+            "AssetSkillsCommunication_OPCUA_Beckhoff",
+        ),
+        ServerTypes.OPC_UA_Siemens: (
+            ".opcua.assetskillscommunication_opcua_siemens",
+            "AssetSkillsCommunication_OPCUA_Siemens",
+        ),
+        ServerTypes.OPC_UA_Python_Asyncua: (
+            ".opcua.assetskillscommunication_opcua_python_asyncua",
+            "AssetSkillsCommunication_OPCUA_Python_Asyncua",
+        ),
+        ServerTypes.OPC_UA_BundR: (
+            ".opcua.assetskillscommunication_opcua_bundr",
+            "AssetSkillsCommunication_OPCUA_BundR",
+        ),
+        ServerTypes.Memory: (
+            ".memory.assetskillscommunication_memory",
+            "AssetSkillsCommunication_Memory",
+        ),
+    }
+)
 
 # list of keywords for searching server type by manufacturer informations
 OpcUaServerManufacturerToType = [
@@ -84,7 +143,9 @@ def createAssetSkillCommunication_OpcUa(
     if serverType is None:
         serverType = getServerTypeFromOpcUaServer(opcConnectionInfo)
     commClass = _create_AssetSkillsCommunication_Class(serverType)
-    if issubclass(commClass, AssetSkillsCommunication_OPCUA):
+    if issubclass(
+        commClass, opcua.assetskillscommunication_opcua.AssetSkillsCommunication_OPCUA
+    ):
         return commClass(
             opcConnectionInfo=opcConnectionInfo, opcua_timeout=opcua_timeout
         )
@@ -232,7 +293,15 @@ def createAssetSkillCommunication_byConfigDict(
         Optional[AssetSkillsCommunication]: server type specific skill com object
     """
     commClass = _create_AssetSkillsCommunication_Class(configDict["serverType"])
-    if issubclass(commClass, AssetSkillsCommunication_OPCUA):
+    if issubclass(commClass, AssetSkillsCommunication_Memory):
+        memoryConnectionInfo = MemoryConnectionInfo()
+        for key in vars(memoryConnectionInfo):
+            if key in configDict:
+                setattr(memoryConnectionInfo, key, configDict[key])
+        return commClass(memoryConnectionInfo)
+    elif issubclass(
+        commClass, opcua.assetskillscommunication_opcua.AssetSkillsCommunication_OPCUA
+    ):
         return commClass(
             OpcUaConnectionInfo(
                 opc_url=configDict["opc_url"],
@@ -268,6 +337,17 @@ def createAssetSkillCommunication_byConfigDict(
                     if "searchSkillsBrowseDepthMax" in configDict
                     else 3
                 ),
+                maxRequestsInFlight=configDict.get(
+                    "maxRequestsInFlight", OPC_UA_MAX_REQUESTS_IN_FLIGHT_DEFAULT
+                ),
+                maxRequestsPerSecond=configDict.get("maxRequestsPerSecond"),
+                maxNodesPerSecond=configDict.get("maxNodesPerSecond"),
+                rateLimitMaxWait=configDict.get(
+                    "rateLimitMaxWait", OPC_UA_RATE_LIMIT_MAX_WAIT_DEFAULT
+                ),
+                subscribeSkillDataDefaults=configDict.get(
+                    "subscribeSkillDataDefaults", False
+                ),
             )
         )
     else:
@@ -344,7 +424,9 @@ def getServerTypeFromOpcUaServer(
     Returns:
         Optional[ServerTypes]: serverType or None
     """
-    comm = AssetSkillsCommunication_OPCUA(opcConnectionInfo)
+    comm = opcua.assetskillscommunication_opcua.AssetSkillsCommunication_OPCUA(
+        opcConnectionInfo
+    )
     comm.opcClient.set_security_string(comm.opc_security_string)
     comm.opcClient.connect()
     manufactureNameNode: SyncNode = comm.opcClient.get_node("i=2263")
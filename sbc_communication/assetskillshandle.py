@@ -1,9 +1,11 @@
-from typing import Type
+from typing import Any, Callable, Type
 import logging
 
 from sbc_statemachine.skilldatahandle import SkillDataHandle
 from .assetskillscommunication import AssetSkillsCommunication
 from .skillexecutionhandler import SkillExecutionHandler
+from .skillexecutionmetrics import SkillExecutionPhaseRecord
+from .skillsweep import sweepSkill
 
 
 # implement logging
@@ -34,6 +36,7 @@ class AssetSkillsHandle:
         else:
             self.skillExecHandler = SkillExecutionHandler(self.skillCom)
         self.executeSkill = self.skillExecHandler.executeSkill
+        self.executeMany = self.skillExecHandler.executeMany
         self.resetSkill = self.skillExecHandler.resetSkill
 
     def connect(self) -> bool:
@@ -45,11 +48,12 @@ class AssetSkillsHandle:
         return self.skillCom.connect()
 
     def disconnect(self) -> bool:
-        """runs connect method of self.assetSkillsCommunication
+        """runs connect method of self.assetSkillsCommunication, cancels eager resets of skill execution handler before
 
         Returns:
             bool: True, if successful
         """
+        self.skillExecHandler.cancel_EagerResets()
         return self.skillCom.disconnect()
 
     def read_availableSkills(self) -> dict[str, SkillDataHandle]:
@@ -63,6 +67,9 @@ class AssetSkillsHandle:
                 return []
         self.skillCom.searchfor_Skills()
         self.skillCom.read_SkillDatas()
+        # compile parameter schemas, executions check parameters without requests
+        for skillName in self.skillCom.skillDataHandles:
+            self.skillCom.get_SkillParameterCodec(skillName)
         return self.skillCom.skillDataHandles
 
     def get_SkillData_byName(self, skillName: str) -> SkillDataHandle:
@@ -94,3 +101,48 @@ class AssetSkillsHandle:
         if readSkillDataCommand:
             self.skillCom.read_stSkillData(skillName, useSkillDataDefault=False)
         return self.get_SkillData_byName(skillName)
+
+    def sweepSkill(
+        self,
+        skillName: str,
+        columns: Any,
+        resultTypes: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """execute skill once per row of parameter columns, e.g. calibration points, return results as columns.
+        Rows are executed pipelined by executeMany. Values are converted and checked by the parameter codec of the skill
+        per column before the first execution, numpy arrays of numbers and bools vectorized, python lists per value.
+
+        Args:
+            skillName (str): name of skill to execute
+            columns (Any): numpy structured array or dict of columns (sequences or numpy arrays), keyed by parameter name
+            resultTypes (dict[str, Any] | None, optional): type per result parameter name, e.g. {"Result": float}. Defaults to None: str.
+
+        Returns:
+            dict[str, Any]: column per result parameter name, numpy arrays if numpy is installed (masked arrays, if results are missing), else lists
+        """
+        return sweepSkill(self.skillExecHandler, skillName, columns, resultTypes)
+
+    def enable_SkillExecutionMetrics(
+        self,
+        enable: bool = True,
+        callback: Callable[[SkillExecutionPhaseRecord], None] | None = None,
+    ) -> None:
+        """enable or disable per phase latency instrumentation of skill executions
+
+        Args:
+            enable (bool, optional): record phase metrics in rolling histograms. Defaults to True.
+            callback (Callable[[SkillExecutionPhaseRecord], None] | None, optional): called with phase record after each execution. Defaults to None.
+        """
+        self.skillExecHandler.recordPhaseMetrics = enable
+        self.skillExecHandler.phaseMetricsCallback = callback
+
+    def get_SkillExecutionMetrics(self, skillName: str | None = None) -> dict:
+        """get p50/p95/p99 of phase durations (seconds) and request counts of recorded skill executions
+
+        Args:
+            skillName (str | None, optional): metrics of single skill, else all skills. Defaults to None.
+
+        Returns:
+            dict: {skillName: {"total": {...}, "phases": {phase: {"duration": {...}, "requests": {...}}}}}
+        """
+        return self.skillExecHandler.skillExecutionMetrics.get_Summary(skillName)
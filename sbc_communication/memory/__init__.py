@@ -0,0 +1,2 @@
+# import all submodules for better access overview
+from . import assetskillscommunication_memory
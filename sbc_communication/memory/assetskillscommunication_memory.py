@@ -0,0 +1,437 @@
+import copy
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from sbc_statemachine.skilldatahandle import SkillDataHandle
+from sbc_statemachine.skilldatatypes import (
+    ST_SkillData,
+    ST_Parameter,
+    ST_SkillCommand,
+    ST_SkillState,
+)
+from sbc_statemachine.skillstatemachinetypes import ESkillModes, ESkillStates
+from ..assetskillscommunication import (
+    AssetSkillsCommunication,
+    AssetSkillsComConnectionInfo,
+)
+from ..skillexecutionmetrics import count_ExecutionRequest
+from ..simulatedskills import (
+    ACTIVE_STATE_VALUES,
+    RESETTABLE_STATE_VALUES,
+    SimulatedSkill,
+    SimulatedSkillsConfig,
+    create_SkillData,
+    create_SkillState,
+    get_SimulatedSkills,
+    set_SkillState,
+)
+
+_logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MemoryConnectionInfo(AssetSkillsComConnectionInfo, SimulatedSkillsConfig):
+    """dataclass storing skills and timing of in memory simulated asset, see SimulatedSkillsConfig"""
+
+    requestLatency: float = 0.0  # seconds slept per request, e.g. network round trip
+
+
+class MemorySkill:
+    """asset side data and time based state machine of one in memory simulated skill.
+    State transitions are scheduled on commands and applied lazily by update(), no background thread.
+    """
+
+    def __init__(self, skill: SimulatedSkill, config: SimulatedSkillsConfig):
+        self.skill = skill
+        self.config = config
+        self.stSkillDataDefault: ST_SkillData = create_SkillData(skill)
+        self.stSkillDataCommand: ST_SkillData = create_SkillData(skill)
+        self.stSkillState: ST_SkillState = create_SkillState(ESkillStates.Idle)
+        # scheduled transitions (time, state, return parameter values or None)
+        self.transitions: deque[tuple[float, ESkillStates, dict | None]] = deque()
+
+    def update(self, now: float | None = None) -> None:
+        """apply scheduled state transitions up to now
+
+        Args:
+            now (float | None, optional): time.perf_counter() value. Defaults to None.
+        """
+        if not self.transitions:
+            return
+        if now is None:
+            now = time.perf_counter()
+        while self.transitions and self.transitions[0][0] <= now:
+            _, state, outputs = self.transitions.popleft()
+            if outputs is not None:
+                for parameter in self.stSkillDataCommand.astParameters:
+                    if parameter.strName in outputs:
+                        parameter.strValue = str(outputs[parameter.strName])
+            set_SkillState(self.stSkillState, state)
+
+    def handle_Command(self, command: str) -> None:
+        """handle state or mode command, like "Start", "Reset" or "Automatic_External"
+
+        Args:
+            command (str): member name of ST_SkillCommand_State or ST_SkillCommand_Mode
+        """
+        now = time.perf_counter()
+        self.update(now)
+        if command in ESkillModes.__members__:
+            self.stSkillState.eActiveMode = ESkillModes[command].value
+            self.stSkillState.strActiveMode = command
+            return
+        activeState = self.stSkillState.eActiveState
+        if command == "Start" and activeState == ESkillStates.Idle.value:
+            self._schedule_Execution(now)
+        elif command == "Reset" and activeState in RESETTABLE_STATE_VALUES:
+            self._schedule(now, ["Resetting"], ESkillStates.Idle)
+        elif command == "Stop" and activeState in ACTIVE_STATE_VALUES:
+            self.transitions.clear()
+            set_SkillState(self.stSkillState, ESkillStates.Stopped)
+        elif command == "Abort" and activeState != ESkillStates.Aborted.value:
+            self.transitions.clear()
+            set_SkillState(self.stSkillState, ESkillStates.Aborted)
+        self.update(now)
+
+    def _schedule_Execution(self, now: float) -> None:
+        parameters = self.stSkillDataCommand.astParameters[
+            : self.stSkillDataCommand.iParameterCount
+        ]
+        inputs = {parameter.strName: parameter.strValue for parameter in parameters}
+        try:
+            outputs = self.skill.function(inputs) if self.skill.function else {}
+        except Exception as e:
+            _logger.info(f"MemorySkill {self.skill.name} aborted: {e}")
+            self._schedule(now, ["Starting", "Execute"], ESkillStates.Aborted)
+            return
+        executionTime = self.skill.executionTime
+        if executionTime is None:
+            executionTime = self.config.executionTime
+        self._schedule(
+            now,
+            ["Starting", "Execute", "Completing"],
+            ESkillStates.Completed,
+            outputs,
+            executionTime,
+        )
+
+    def _schedule(
+        self,
+        now: float,
+        transientStateNames: list[str],
+        finalState: ESkillStates,
+        outputs: dict | None = None,
+        executionTime: float = 0.0,
+    ) -> None:
+        # transient states only, if defined in ESkillStates
+        transitionTime = self.config.transitionTime
+        self.transitions.clear()
+        for stateName in transientStateNames:
+            state = ESkillStates.__members__.get(stateName)
+            if state is None:
+                continue
+            if stateName == "Completing":
+                self.transitions.append((now, state, outputs))
+                outputs = None
+            else:
+                self.transitions.append((now, state, None))
+            now += executionTime if stateName == "Execute" else transitionTime
+        self.transitions.append((now, finalState, outputs))
+
+
+class AssetSkillsCommunication_Memory(AssetSkillsCommunication):
+    """in memory skill communication with simulated skills, without network or server.
+    For testing and benchmarking SkillExecutionHandler, AssetSkillsHandle and multi asset scheduling.
+    Thread safe, reads and writes of skill data of multiple threads are serialized by one lock.
+    The request latency is slept outside the lock: requests of multiple threads overlap like network round trips
+    of one session, the latency is not serialized.
+    """
+
+    def __init__(self, memoryConnectionInfo: MemoryConnectionInfo | None = None):
+        """generate in memory skill communication
+
+        Args:
+            memoryConnectionInfo (MemoryConnectionInfo | None, optional): skills and timing of simulated asset. Defaults to None.
+        """
+        if memoryConnectionInfo is None:
+            memoryConnectionInfo = MemoryConnectionInfo()
+        super().__init__(memoryConnectionInfo)
+        self.memorySkills: dict[str, MemorySkill] = {
+            skill.name: MemorySkill(skill, memoryConnectionInfo)
+            for skill in get_SimulatedSkills(memoryConnectionInfo)
+        }
+        self._lock = threading.Lock()
+
+    def connect(self) -> bool:
+        """Activate communication / connect.
+
+        Returns:
+            bool: returns True if successful
+        """
+        self.connected = True
+        return True
+
+    def checkComm(self) -> bool:
+        """Check if the communication has been established correctly
+
+        Returns:
+            bool: returns True if connected
+        """
+        return self.connected
+
+    def disconnect(self) -> bool:
+        """Close communication / disconnect
+
+        Returns:
+            bool: returns True if successful
+        """
+        self.connected = False
+        return True
+
+    def searchfor_Skills(self) -> int:
+        """Searches for Skills in simulated asset and fill the skillDataHandles dict
+
+        Returns:
+            int: count of found Skills in asset
+        """
+        self._request()
+        # replaced as a whole, see concurrency model of AssetSkillsCommunication
+        skillDataHandles = {
+            skillName: SkillDataHandle(connectionID=skillName)
+            for skillName in self.memorySkills
+        }
+        self.skillParameterIndexes = {}
+        self.skillDataDefaultCacheTimes = {}
+        self.skillDataCommandsLoaded = set()
+        self.skillDataHandles = skillDataHandles
+        return len(self.skillDataHandles)
+
+    def read_stSkillData(
+        self, skillName: str, useSkillDataDefault=True
+    ) -> ST_SkillData:
+        """read stSkillDataDefault or stSkillDataCommand of specific skill from simulated asset,
+        replaces SkillData in self.SkillDataHandles by the new snapshot
+
+        Args:
+            skillName (str): name of skill in self.SkillDataHandles.
+            useSkillDataDefault (bool): read stSkillDataDefault or stSkillDataCommand
+
+        Returns:
+            ST_SkillData: stSkillDataDefault or stSkillDataCommand as new ST_SkillData
+        """
+        self._request()
+        with self._lock:
+            memorySkill = self.memorySkills[skillName]
+            memorySkill.update()
+            if useSkillDataDefault:
+                setSkillData = copy.deepcopy(memorySkill.stSkillDataDefault)
+            else:
+                setSkillData = copy.deepcopy(memorySkill.stSkillDataCommand)
+        with self.get_SkillLock(skillName):
+            if useSkillDataDefault:
+                previousSkillDataDefault = self.skillDataHandles[
+                    skillName
+                ].stSkillDataDefault
+                self.skillDataHandles[skillName].stSkillDataDefault = setSkillData
+                self.update_SkillDataDefaultCache(skillName, previousSkillDataDefault)
+            else:
+                self.skillDataHandles[skillName].stSkillDataCommand = setSkillData
+                self.skillDataCommandsLoaded.add(skillName)
+        return setSkillData
+
+    def read_stSkillData_astParameters_byIndexes(
+        self, skillName: str, indexes: tuple[int, ...], useSkillDataDefault=False
+    ) -> list[ST_Parameter]:
+        """read selected elements of astParameters from stSkillDataCommand or stSkillDataDefault of specific skill,
+        update SkillData in self.SkillDataHandles. Only the selected elements are copied from simulated asset.
+
+        Args:
+            skillName (str): name of skill in self.SkillDataHandles.
+            indexes (tuple[int, ...]): indexes of parameters in astParameters, e.g. SkillParameterIndex.returnIndexes
+            useSkillDataDefault (bool): read stSkillDataDefault or stSkillDataCommand
+
+        Returns:
+            list[ST_Parameter]: read parameters in order of indexes
+        """
+        self._request()
+        with self._lock:
+            memorySkill = self.memorySkills[skillName]
+            memorySkill.update()
+            if useSkillDataDefault:
+                skillData = memorySkill.stSkillDataDefault
+            else:
+                skillData = memorySkill.stSkillDataCommand
+            parameters = [
+                (index, copy.deepcopy(skillData.astParameters[index]))
+                for index in self._get_ExistingIndexes(
+                    skillName, indexes, len(skillData.astParameters)
+                )
+            ]
+        # replace elements in skill data handle by new parameters
+        with self.get_SkillLock(skillName):
+            if useSkillDataDefault:
+                astParameters = self.skillDataHandles[
+                    skillName
+                ].stSkillDataDefault.astParameters
+            else:
+                astParameters = self.skillDataHandles[
+                    skillName
+                ].stSkillDataCommand.astParameters
+            for index, parameter in parameters:
+                while index >= len(astParameters):
+                    astParameters.append(ST_Parameter())
+                astParameters[index] = parameter
+        return [parameter for index, parameter in parameters]
+
+    def read_stSkillState(self, skillName: str) -> ST_SkillState:
+        """read stSkillState of specific skill from simulated asset,
+        replaces stSkillState in self.skillDataHandles by the new snapshot
+
+        Args:
+            skillName (str): name of skill in self.SkillDatas.
+
+        Returns:
+            ST_SkillState: Skillstate as new ST_SkillState
+        """
+        self._request()
+        with self._lock:
+            memorySkill = self.memorySkills[skillName]
+            memorySkill.update()
+            stSkillState = copy.deepcopy(memorySkill.stSkillState)
+        self.skillDataHandles[skillName].stSkillState = stSkillState
+        return stSkillState
+
+    def read_stSkillState_member(self, skillName: str, member: str):
+        """read specific member from stSkillState of specific skill from simulated asset
+
+        Args:
+            skillName (str): name of skill in self.SkillDatas.
+            member (str): membername of ST_SkillState
+
+        Returns:
+            str, int, ...: Skillstate member value or None, if not successful
+        """
+        if not hasattr(self.skillDataHandles[skillName].stSkillState, member):
+            return None
+        self._request()
+        with self._lock:
+            memorySkill = self.memorySkills[skillName]
+            memorySkill.update()
+            value = copy.deepcopy(getattr(memorySkill.stSkillState, member))
+        # copy of last snapshot with new member value, replaces reference in skill data handle
+        with self.get_SkillLock(skillName):
+            stSkillState = copy.copy(self.skillDataHandles[skillName].stSkillState)
+            setattr(stSkillState, member, value)
+            self.skillDataHandles[skillName].stSkillState = stSkillState
+        return value
+
+    def read_stSkillState_eActiveState(self, skillName: str) -> int:
+        """read only eActiveState of stSkillState of specific skill from simulated asset,
+        doesnt replace stSkillState in self.skillDataHandles
+
+        Args:
+            skillName (str): name of skill in self.SkillDatas.
+
+        Returns:
+            int: eActiveState value (see ESkillStates)
+        """
+        self._request()
+        with self._lock:
+            memorySkill = self.memorySkills[skillName]
+            memorySkill.update()
+            return int(memorySkill.stSkillState.eActiveState)
+
+    def write_SingleSkillCommand(self, skillname: str, skillCommand: str) -> bool:
+        """write single stSkillCommand (Start, Reset, ...) of specific skill to simulated asset
+
+        Args:
+            skillname (str): name of skill in self.SkillDatas.
+            SkillCommand (dict): dictionary with single command, like "Start", "Reset", "Offline" (see skilltypes ST_SkillCommand_State and ST_SkillCommand_Mode)
+
+        Returns:
+            bool: True if successful
+        """
+        stSkillCommand = ST_SkillCommand()
+        if not isinstance(skillCommand, str) or not (
+            skillCommand in stSkillCommand.stCommand_State.__dict__
+            or skillCommand in stSkillCommand.stCommand_Mode.__dict__
+        ):
+            return False
+        self._request()
+        with self._lock:
+            self.memorySkills[skillname].handle_Command(skillCommand)
+        return True
+
+    def write_stSkillData(self, skillName: str, useSkillDataDefault=False) -> bool:
+        """write stSkillDataCommand or stSkillDataDefault of specific skill to simulated asset
+
+        Args:
+            skillname (str): name of skill in self.SkillDatas.
+            useSkillDataDefault (bool): write stSkillDataDefault or stSkillDataCommand
+
+        Returns:
+            bool: True, if successful
+        """
+        with self.get_SkillLock(skillName):
+            if useSkillDataDefault:
+                sourceSkillData = self.skillDataHandles[skillName].stSkillDataDefault
+            else:
+                sourceSkillData = self.skillDataHandles[skillName].stSkillDataCommand
+            skillData = copy.deepcopy(sourceSkillData)
+        self._request()
+        with self._lock:
+            memorySkill = self.memorySkills[skillName]
+            if useSkillDataDefault:
+                memorySkill.stSkillDataDefault = skillData
+            else:
+                memorySkill.stSkillDataCommand = skillData
+        if useSkillDataDefault:
+            # written snapshot is the new stSkillDataDefault
+            self.update_SkillDataDefaultCache(skillName)
+        return True
+
+    def write_stSkillData_astParameters(
+        self, skillname: str, useSkillDataDefault=False
+    ) -> bool:
+        """write astParameters of stSkillDataCommand or stSkillDataDefault of specific skill to simulated asset
+
+        Args:
+            skillname (str): name of skill in self.SkillDatas.
+            useSkillDataDefault (bool): read stSkillDataDefault or stSkillDataCommand
+
+        Returns:
+            bool: True, if successful
+        """
+        with self.get_SkillLock(skillname):
+            if useSkillDataDefault:
+                sourceSkillData = self.skillDataHandles[skillname].stSkillDataDefault
+            else:
+                sourceSkillData = self.skillDataHandles[skillname].stSkillDataCommand
+            # if no parameters then return
+            if sourceSkillData.iParameterCount <= 0:
+                return True
+            astParameters = copy.deepcopy(
+                sourceSkillData.astParameters[: sourceSkillData.iParameterCount]
+            )
+        self._request()
+        with self._lock:
+            memorySkill = self.memorySkills[skillname]
+            if useSkillDataDefault:
+                memorySkill.stSkillDataDefault.astParameters = astParameters
+            else:
+                memorySkill.stSkillDataCommand.astParameters = astParameters
+        if useSkillDataDefault:
+            # written snapshot is the new stSkillDataDefault
+            self.update_SkillDataDefaultCache(skillname)
+        return True
+
+    def _request(self) -> None:
+        """count request and simulate request latency"""
+        with self._lock:
+            self.requestCount += 1
+        count_ExecutionRequest()
+        # round trip outside the lock, concurrent requests overlap
+        if self.connectionInfo.requestLatency > 0:
+            time.sleep(self.connectionInfo.requestLatency)
@@ -1,6 +1,27 @@
-# import all submodules for better access overview
-from . import assetskillscommunication_opcua
-from . import assetskillscommunication_opcua_beckhoff
-from . import assetskillscommunication_opcua_python_asyncua
-from . import assetskillscommunication_opcua_siemens
-from . import assetskillscommunication_opcua_bundr
+# submodules for better access overview, imported on first access (PEP 562)
+# to keep "import sbc_communication" free of asyncua
+import importlib
+
+__all__ = [
+    "assetskillscommunication_opcua",
+    "assetskillscommunication_opcua_beckhoff",
+    "assetskillscommunication_opcua_python_asyncua",
+    "assetskillscommunication_opcua_siemens",
+    "assetskillscommunication_opcua_bundr",
+    "opcuaconnectioninfo",
+    "opcuaservicemetrics",
+    "opcuarecording",
+    "opcuasingleflight",
+    "opcuarequestscheduler",
+    "opcuaratelimiter",
+]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
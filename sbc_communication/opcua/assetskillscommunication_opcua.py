@@ -1,7 +1,9 @@
 import os
 import copy
+import time
 from asyncua.sync import Client, SyncNode, ua, ThreadLoop
-from dataclasses import dataclass, fields
+from asyncua.common.node import Node
+from dataclasses import dataclass, field, fields
 from typing import Type
 from sbc_statemachine.skilldatahandle import SkillDataHandle
 from sbc_statemachine.skilldatatypes import (
@@ -15,39 +17,146 @@ from ..assetskillscommunication import (
     AssetSkillsComConnectionInfo,
 )
 from ..mapVar import mapVar
+from ..requestpriority import RequestPriority, requestPriorityContext
+from ..skillexecutionmetrics import count_ExecutionRequest
+from .opcuaconnectioninfo import (
+    OpcUaConnectionInfo,
+    ASSET_SKILL_COMMUNICATION_OPC_TIMEOUT_DEFAULT,
+    OPC_UA_SKILL_DATA_DEFAULT_PUBLISHING_INTERVAL_DEFAULT,
+)
+from .opcuaservicemetrics import OpcUaServiceMetrics, skillRequestContext
+from .opcuarecording import OpcUaRecorder, OpcUaReplay
+from .opcuaratelimiter import OpcUaRateLimiter, rateLimitExemptContext
+from .opcuarequestscheduler import OpcUaRequestScheduler
+from .opcuasingleflight import (
+    SingleFlight,
+    singleFlightRequest,
+    SINGLE_FLIGHT_OPERATIONS_DEFAULT,
+)
 
-ASSET_SKILL_COMMUNICATION_OPC_TIMEOUT_DEFAULT = 2.0
 
+def _get_NodeIdString(node: SyncNode | None) -> str | None:
+    return node.nodeid.to_string() if node is not None else None
 
-@dataclass
-class SkillConnectionNodes:
-    """dataclass storing opc ua nodes for accessing a skill internal data"""
 
-    nodeId: str = ""
-    skillNode: SyncNode = None
-    skillStateNode: SyncNode = None
-    skillCommandNode: SyncNode = None
-    skillDataDefaultNode: SyncNode = None
-    skillDataCommandNode: SyncNode = None
+def _create_NodeProperty(nodeIdName: str, doc: str) -> property:
+    """property creating SyncNode of NodeId string slot on access, setter stores NodeId string of node"""
 
+    def getNode(self: "SkillConnectionNodes") -> SyncNode | None:
+        nodeId = getattr(self, nodeIdName)
+        if nodeId is None:
+            return None
+        return SyncNode(self._tloop, Node(self._session, ua.NodeId.from_string(nodeId)))
 
-@dataclass
-class OpcUaConnectionInfo(AssetSkillsComConnectionInfo):
-    """dataclass storing the opc ua connection informations"""
-
-    opc_url: str = "opc.tcp://127.0.0.1:4840"
-    opc_user: str | None = None  # opc ua username
-    opc_password: str | None = None  # opc ua password
-    opc_security_policy: str | None = (
-        None  # opc ua security policy: Basic256Sha256, ...
+    def setNode(self: "SkillConnectionNodes", node: SyncNode | None) -> None:
+        if node is not None and self._session is None:
+            self._tloop, self._session = node.tloop, node.aio_obj.session
+        setattr(self, nodeIdName, _get_NodeIdString(node))
+
+    return property(getNode, setNode, doc=doc)
+
+
+class SkillConnectionNodes:
+    """compact record storing opc ua NodeIds for accessing a skill internal data.
+    NodeIds are stored as strings, nodes are created on access with the client of the first given node,
+    so thousands of skills do not keep node objects alive."""
+
+    __slots__ = (
+        "nodeId",
+        "_tloop",
+        "_session",
+        "skillNodeId",
+        "skillStateNodeId",
+        "skillCommandNodeId",
+        "skillDataDefaultNodeId",
+        "skillDataCommandNodeId",
+        # member NodeIds, resolved on first use
+        "skillDataDefaultParametersNodeId",
+        "skillDataCommandParametersNodeId",
+        "skillStateActiveStateNodeId",
     )
-    opc_security_mode: str | None = None  # opc ua security mode: SignAndEncrypt, ...
-    opc_certificate_filepath: str | None = None  # filepath to opc ua certificate *.der
-    opc_private_key_filepath: str | None = None  # filepath to opc ua key *.pem
-    rootNodeId: str | None = None  # root node id for start searching skills
-    searchSkillsBrowseDepthMax: int = (
-        3  # maximal browse depth from rootNodeId for searching skills
+
+    def __init__(
+        self,
+        nodeId: str = "",
+        skillNode: SyncNode | None = None,
+        skillStateNode: SyncNode | None = None,
+        skillCommandNode: SyncNode | None = None,
+        skillDataDefaultNode: SyncNode | None = None,
+        skillDataCommandNode: SyncNode | None = None,
+        skillDataDefaultParametersNode: SyncNode | None = None,
+        skillDataCommandParametersNode: SyncNode | None = None,
+        skillStateActiveStateNode: SyncNode | None = None,
+    ):
+        self.nodeId = nodeId
+        self._tloop: ThreadLoop | None = None
+        self._session = None
+        self.skillNode = skillNode
+        self.skillStateNode = skillStateNode
+        self.skillCommandNode = skillCommandNode
+        self.skillDataDefaultNode = skillDataDefaultNode
+        self.skillDataCommandNode = skillDataCommandNode
+        self.skillDataDefaultParametersNode = skillDataDefaultParametersNode
+        self.skillDataCommandParametersNode = skillDataCommandParametersNode
+        self.skillStateActiveStateNode = skillStateActiveStateNode
+
+    skillNode = _create_NodeProperty("skillNodeId", "node of skill")
+    skillStateNode = _create_NodeProperty("skillStateNodeId", "stSkillState node")
+    skillCommandNode = _create_NodeProperty("skillCommandNodeId", "stSkillCommand node")
+    skillDataDefaultNode = _create_NodeProperty(
+        "skillDataDefaultNodeId", "stSkillDataDefault node"
+    )
+    skillDataCommandNode = _create_NodeProperty(
+        "skillDataCommandNodeId", "stSkillDataCommand node"
+    )
+    skillDataDefaultParametersNode = _create_NodeProperty(
+        "skillDataDefaultParametersNodeId", "astParameters node of stSkillDataDefault"
     )
+    skillDataCommandParametersNode = _create_NodeProperty(
+        "skillDataCommandParametersNodeId", "astParameters node of stSkillDataCommand"
+    )
+    skillStateActiveStateNode = _create_NodeProperty(
+        "skillStateActiveStateNodeId", "eActiveState node of stSkillState"
+    )
+
+    def __repr__(self) -> str:
+        return f"SkillConnectionNodes(nodeId={self.nodeId!r})"
+
+
+@dataclass(slots=True)
+class SkillStructLayout:
+    """dataclass storing the plc struct layout of one skill and reusable write targets"""
+
+    plcParameterListCount: int = 0  # length of astParameters array in plc struct
+    # reusable opc ua write targets, key: useSkillDataDefault
+    targetSkillDatas: dict[bool, object] = field(default_factory=dict)
+    targetParameterLists: dict[bool, list] = field(default_factory=dict)
+    # count of leading target parameters, which may hold values of the last write
+    targetSkillDataDirtyCounts: dict[bool, int] = field(default_factory=dict)
+    targetParameterListDirtyCounts: dict[bool, int] = field(default_factory=dict)
+
+
+class SkillDataDefaultSubscriptionHandler:
+    """opc ua subscription handler invalidating cached stSkillDataDefault of changed skills.
+    The initial notification per node (current value) is ignored."""
+
+    def __init__(
+        self, skillCom: "AssetSkillsCommunication", skillNames: dict[str, str]
+    ):
+        self.skillCom = skillCom
+        self.skillNames = (
+            skillNames  # skill name by NodeId string of stSkillDataDefault
+        )
+        self.notifiedNodeIds: set[str] = set()
+
+    def datachange_notification(self, node: Node, val, data) -> None:
+        nodeId = node.nodeid.to_string()
+        if nodeId not in self.notifiedNodeIds:
+            self.notifiedNodeIds.add(nodeId)
+            return
+        skillName = self.skillNames.get(nodeId)
+        if skillName is not None:
+            self.skillCom.invalidate_SkillDataDefaults(skillName)
 
 
 @dataclass
@@ -70,6 +179,10 @@ OPC_UA_CERTIFICATE_PATH_CERTIFICATE = os.path.join(
 OPC_UA_CERTIFICATE_PATH_PRIVATEKEY = os.path.join(
     OPC_UA_CERTIFICATE_PATH, "opc_private_key.pem"
 )
+# status codes of IndexRange reads, which disable IndexRange reads for the session
+INDEX_RANGE_UNSUPPORTED_STATUS_CODES = frozenset(
+    {ua.StatusCodes.BadIndexRangeInvalid, ua.StatusCodes.BadNotSupported}
+)
 
 
 # "abstract" class for connecting to Skills provided by OPC-UA Server
@@ -93,6 +206,14 @@ class AssetSkillsCommunication_OPCUA(AssetSkillsCommunication):
         self.skillConnectionNodes: dict[str, SkillConnectionNodes] = {}
         self.opcUaSkillTypes = OpcUaSkillTypes()
 
+        # per skill plc struct layout and reusable write targets
+        self.skillStructLayouts: dict[str, SkillStructLayout] = {}
+        # write astParameters with exact plc array length (Siemens, B&R)
+        # beckhoff server accepts smaller arrays in structs
+        self.writeExactPlcParameterList = False
+        # subscription of stSkillDataDefault nodes, see subscribeSkillDataDefaults
+        self.skillDataDefaultSubscription = None
+
         # create asyncio EventLoop for handling async opc Ua Client
         # self.asyncEventLoop = asyncio.new_event_loop()
 
@@ -102,6 +223,17 @@ class AssetSkillsCommunication_OPCUA(AssetSkillsCommunication):
         # marker for opc ua browse namespaceIndex
         self.opcUaNameSpaceIndex = 4
 
+        # maximal count of nodes in one bulk read request
+        self.maxNodesPerRead: int = 100
+        # read single elements of astParameters by opc ua IndexRange
+        # reset on first rejected IndexRange read, then complete structs are read
+        self.indexRangeReadSupported = True
+
+        # concurrent reads of same skill data share one request, set None to disable
+        # coalesced read methods by name, e.g. add "read_stSkillData"
+        self.singleFlight: SingleFlight | None = SingleFlight()
+        self.singleFlightOperations: set[str] = set(SINGLE_FLIGHT_OPERATIONS_DEFAULT)
+
         # communication try count and reconnect time
         self.maxtrycount: int = 10
         self.reconnectTime: float = 1.0
@@ -121,6 +253,24 @@ class AssetSkillsCommunication_OPCUA(AssetSkillsCommunication):
             self.opcConnectionInfo.opc_url, timeout=opcua_timeout, tloop=tloop
         )
         self.opcClient.close_tloop = True
+        # instrumentation of all requests sent by opcClient, set None to disable
+        self.serviceMetrics: OpcUaServiceMetrics | None = OpcUaServiceMetrics()
+        # limits requests in flight, commands are sent ahead of polling reads, set None to disable
+        self.requestScheduler: OpcUaRequestScheduler | None = OpcUaRequestScheduler(
+            self.opcConnectionInfo.maxRequestsInFlight
+        )
+        # token buckets of requests and nodes per second, backpressure by bounded wait and OpcUaRateLimit_Error
+        self.rateLimiter: OpcUaRateLimiter | None = None
+        if (
+            self.opcConnectionInfo.maxRequestsPerSecond is not None
+            or self.opcConnectionInfo.maxNodesPerSecond is not None
+        ):
+            self.rateLimiter = OpcUaRateLimiter(
+                self.opcConnectionInfo.maxRequestsPerSecond,
+                self.opcConnectionInfo.maxNodesPerSecond,
+                self.opcConnectionInfo.rateLimitMaxWait,
+            )
+        self.__initServiceHooks()
 
         # set conenction user and password
         if self.opcConnectionInfo.opc_user is not None:
@@ -166,15 +316,143 @@ class AssetSkillsCommunication_OPCUA(AssetSkillsCommunication):
                 f"When providing opc server security, at least opc_policy and opc_mode must be set!"
             )
 
+    def __initServiceHooks(self):
+        """hook into every request sent by opcClient: count in self.requestCount and counter of skill execution, limit rate by self.rateLimiter,
+        schedule by self.requestScheduler, observe in self.serviceMetrics, record by self.opcUaRecorder. Wraps send_request of each socket protocol created by the opc ua client on connect.
+        With self.opcUaReplay, a replay protocol without socket is created instead.
+        """
+        self.opcUaRecorder: OpcUaRecorder | None = None
+        self.opcUaReplay: OpcUaReplay | None = None
+        uaclient = self.opcClient.aio_obj.uaclient
+        make_protocol = uaclient._make_protocol
+        connect_socket = uaclient.connect_socket
+
+        def _make_protocol():
+            if self.opcUaReplay is not None:
+                protocol = self.opcUaReplay.make_Protocol(uaclient)
+            else:
+                protocol = make_protocol()
+            send_request = protocol.send_request
+            open_secure_channel = protocol.open_secure_channel
+
+            async def _send_request(request, *args, **kwargs):
+                self.requestCount += 1
+                count_ExecutionRequest()
+                # wait for rate limit before taking a slot in flight
+                rateLimiter = self.rateLimiter
+                if rateLimiter is not None and rateLimiter.is_Limited(request):
+                    await rateLimiter.acquire(request)
+                requestScheduler = self.requestScheduler
+                if requestScheduler is None or not requestScheduler.is_Scheduled(
+                    request
+                ):
+                    return await _observe_request(request, *args, **kwargs)
+                await requestScheduler.acquire()
+                try:
+                    return await _observe_request(request, *args, **kwargs)
+                finally:
+                    requestScheduler.release()
+
+            async def _observe_request(request, *args, **kwargs):
+                serviceMetrics = self.serviceMetrics
+                recorder = self.opcUaRecorder
+                if serviceMetrics is None and recorder is None:
+                    return await send_request(request, *args, **kwargs)
+                startTime = time.perf_counter()
+                try:
+                    data = await send_request(request, *args, **kwargs)
+                except Exception as e:
+                    latency = time.perf_counter() - startTime
+                    if serviceMetrics is not None:
+                        serviceMetrics.observe(request, None, latency, error=True)
+                    if recorder is not None:
+                        recorder.record(request, None, latency, error=e)
+                    raise
+                latency = time.perf_counter() - startTime
+                if serviceMetrics is not None:
+                    serviceMetrics.observe(request, data, latency)
+                if recorder is not None:
+                    recorder.record(request, data, latency)
+                return data
+
+            async def _open_secure_channel(params):
+                startTime = time.perf_counter()
+                result = await open_secure_channel(params)
+                if self.opcUaRecorder is not None:
+                    self.opcUaRecorder.record_OpenSecureChannel(
+                        result, time.perf_counter() - startTime
+                    )
+                return result
+
+            protocol.send_request = _send_request
+            protocol.open_secure_channel = _open_secure_channel
+            return protocol
+
+        async def _connect_socket(host: str, port: int):
+            if self.opcUaReplay is None:
+                return await connect_socket(host, port)
+            _make_protocol()
+
+        uaclient._make_protocol = _make_protocol
+        uaclient.connect_socket = _connect_socket
+
+    def start_OpcUaRecording(self, filePath: str) -> OpcUaRecorder:
+        """record all following opc ua requests and responses with timing to json lines file, e.g. of a production session.
+        Start before connect to record complete session for replay.
+
+        Args:
+            filePath (str): json lines file path
+
+        Returns:
+            OpcUaRecorder: active recorder
+        """
+        self.stop_OpcUaRecording()
+        self.opcUaRecorder = OpcUaRecorder(
+            filePath,
+            opc_url=self.opcConnectionInfo.opc_url,
+            communicationClass=type(self).__name__,
+        )
+        return self.opcUaRecorder
+
+    def stop_OpcUaRecording(self) -> None:
+        """stop recording and close recording file"""
+        if self.opcUaRecorder is not None:
+            self.opcUaRecorder.close()
+            self.opcUaRecorder = None
+
+    def set_OpcUaReplay(
+        self,
+        filePath: str | None,
+        speed: float | None = None,
+        latencyOnly: bool = False,
+    ) -> None:
+        """replay recorded opc ua session instead of connecting to opc ua server, set before connect.
+        Calls must follow the recorded session, e.g. same discovery and skill executions.
+
+        Args:
+            filePath (str | None): json lines file path, written by start_OpcUaRecording. None: disable replay
+            speed (float | None, optional): replay requests at recorded offsets and with recorded latencies, divided by speed. None: as fast as possible. Defaults to None.
+            latencyOnly (bool, optional): with speed, replay recorded latencies only, not recorded offsets. Defaults to False.
+        """
+        if self.connected:
+            raise RuntimeError("Cant set opc ua replay while connected")
+        if filePath is None:
+            self.opcUaReplay = None
+        else:
+            self.opcUaReplay = OpcUaReplay(filePath, speed, latencyOnly)
+
+    @rateLimitExemptContext()
     def connect(self) -> bool:
-        """Activate communication.
+        """Activate communication. Not rate limited, also the server state watchdog started by the opc ua client.
 
         Returns:
             bool: returns True if successful
         """
         # only connect if not already connected
         if not self.connected:
-            self.opcClient.set_security_string(self.opc_security_string)
+            # replayed session needs no server certificate
+            if self.opcUaReplay is None:
+                self.opcClient.set_security_string(self.opc_security_string)
             self.opcClient.connect()
             # load data type definitions on connection
             self.connected = self.loadSkillDataTypes()
@@ -219,14 +497,16 @@ class AssetSkillsCommunication_OPCUA(AssetSkillsCommunication):
         else:
             return None
 
+    @rateLimitExemptContext()
     def checkComm(self) -> bool:
-        """Check if the communication has been established correctly
+        """Check if the communication has been established correctly, not rate limited
 
         Returns:
             bool: returns True if successful
         """
         if self.connected:
             try:
+                # health check is not rate limited, reports the connection state
                 serverstatusnode = self.opcClient.get_node(
                     f"i={ua.object_ids.ObjectIds().Server_ServerStatus_State}"
                 )
@@ -242,13 +522,15 @@ class AssetSkillsCommunication_OPCUA(AssetSkillsCommunication):
         else:
             return False
 
+    @rateLimitExemptContext()
     def disconnect(self) -> bool:
-        """Close communication
+        """Close communication, not rate limited
 
         Returns:
             bool: returns True if successful
         """
         if self.connected:
+            self._delete_SkillDataDefaultSubscription()
             self.opcClient.disconnect()
             self.connected = False
         return True
@@ -330,8 +612,10 @@ class AssetSkillsCommunication_OPCUA(AssetSkillsCommunication):
             ]
         else:
             return -1
-        # init skillConnectionNodesList
-        self.skillDataHandles = {}
+        # per skill dicts are built new and replaced at the end, see concurrency model
+        skillDataHandles: dict[str, SkillDataHandle] = {}
+        skillConnectionNodesDict: dict[str, SkillConnectionNodes] = {}
+        skillStructLayouts: dict[str, SkillStructLayout] = {}
         skillConnectionNodesList: list[SkillConnectionNodes] = []
         # get skillConnectionNodesList from root nodes
         for SearchNode in SearchNodeList:
@@ -344,10 +628,26 @@ class AssetSkillsCommunication_OPCUA(AssetSkillsCommunication):
                 )
             )
 
+        # read all stSkillDataDefault structs in bulk requests
+        # used for skill names and as layout probe of the plc structs
+        stSkillDataDefaults = []
+        for i in range(0, len(skillConnectionNodesList), self.maxNodesPerRead):
+            stSkillDataDefaults.extend(
+                self.opcClient.read_values(
+                    [
+                        skillConnectionNodes.skillDataDefaultNode
+                        for skillConnectionNodes in skillConnectionNodesList[
+                            i : i + self.maxNodesPerRead
+                        ]
+                    ]
+                )
+            )
+
         # self.SkillDatas = [SkillDataHandle()] * 0
-        for skillConnectionNodes in skillConnectionNodesList:
-            # read skillname
-            stSkillDataDefault = skillConnectionNodes.skillDataDefaultNode.read_value()
+        for skillConnectionNodes, skillData in zip(
+            skillConnectionNodesList, stSkillDataDefaults
+        ):
+            stSkillDataDefault = self._map_SkillData(skillData)
             # handle stSkillDataDefault.strName is empty ("")
             if len(stSkillDataDefault.strName) == 0:
                 skillName = "Unnamed"
@@ -356,60 +656,279 @@ class AssetSkillsCommunication_OPCUA(AssetSkillsCommunication):
             # handle duplicate skillname in dict
             duplicateCounter = 1
             newSkillName = skillName
-            while newSkillName in self.skillDataHandles:
+            while newSkillName in skillDataHandles:
                 newSkillName = skillName + "_duplicate" + str(duplicateCounter)
                 duplicateCounter += 1
             # create Skill Data Handle for new skill
-            self.skillDataHandles[newSkillName] = SkillDataHandle(
+            skillDataHandles[newSkillName] = SkillDataHandle(
                 connectionID=skillConnectionNodes.nodeId
             )
-            self.skillConnectionNodes[newSkillName] = skillConnectionNodes
+            # bulk read stSkillDataDefault is the first cached snapshot
+            skillDataHandles[newSkillName].stSkillDataDefault = stSkillDataDefault
+            skillConnectionNodesDict[newSkillName] = skillConnectionNodes
+            skillStructLayouts[newSkillName] = SkillStructLayout(
+                plcParameterListCount=len(skillData.astParameters)
+            )
+        self._delete_SkillDataDefaultSubscription()
+        self.skillConnectionNodes = skillConnectionNodesDict
+        self.skillStructLayouts = skillStructLayouts
+        self.skillParameterIndexes = {}
+        self.skillDataDefaultCacheTimes = {}
+        self.skillDataCommandsLoaded = set()
+        self.skillDataHandles = skillDataHandles
+        for skillName in skillDataHandles:
+            self.update_SkillDataDefaultCache(skillName)
+        if self.opcConnectionInfo.subscribeSkillDataDefaults and skillDataHandles:
+            self._create_SkillDataDefaultSubscription()
         return len(self.skillDataHandles.keys())
 
+    def _create_SkillDataDefaultSubscription(self) -> None:
+        """subscribe stSkillDataDefault nodes of all skills, changes invalidate cached skill data defaults"""
+        skillNames = {
+            skillConnectionNodes.skillDataDefaultNodeId: skillName
+            for skillName, skillConnectionNodes in self.skillConnectionNodes.items()
+        }
+        self.skillDataDefaultSubscription = self.opcClient.create_subscription(
+            OPC_UA_SKILL_DATA_DEFAULT_PUBLISHING_INTERVAL_DEFAULT,
+            SkillDataDefaultSubscriptionHandler(self, skillNames),
+        )
+        self.skillDataDefaultSubscription.subscribe_data_change(
+            [
+                skillConnectionNodes.skillDataDefaultNode
+                for skillConnectionNodes in self.skillConnectionNodes.values()
+            ]
+        )
+
+    def _delete_SkillDataDefaultSubscription(self) -> None:
+        """delete subscription of stSkillDataDefault nodes, if any"""
+        subscription, self.skillDataDefaultSubscription = (
+            self.skillDataDefaultSubscription,
+            None,
+        )
+        if subscription is None:
+            return
+        try:
+            subscription.delete()
+        except Exception:
+            # connection lost, subscription is gone with session
+            ...
+
+    def _map_SkillData(self, skillData) -> ST_SkillData:
+        """map skill data struct as read from server to new ST_SkillData
+
+        Args:
+            skillData (opc ua ST_SkillData): skill data struct as read from server
+
+        Returns:
+            ST_SkillData: new snapshot
+        """
+        setSkillData = ST_SkillData()
+        setSkillData.astParameters = [
+            ST_Parameter() for i in range(skillData.iParameterCount)
+        ]
+        mapVar(skillData, setSkillData, maxListLength=skillData.iParameterCount)
+        return setSkillData
+
+    @skillRequestContext
+    @singleFlightRequest
     def read_stSkillData(
         self, skillName: str, useSkillDataDefault=True
     ) -> ST_SkillData:
-        """read stSkillDataDefault or stSkillDataCommand of specific skill by communication interface, update SkillData in self.SkillDataHandles
+        """read stSkillDataDefault or stSkillDataCommand of specific skill by communication interface,
+        replaces SkillData in self.SkillDataHandles by the new snapshot
 
         Args:
             skillName (str): name of skill in self.SkillDataHandles.
             useSkillDataDefault (bool): read stSkillDataDefault or stSkillDataCommand
 
         Returns:
-            ST_SkillData: stSkillDataDefault or stSkillDataCommand as ST_SkillData or None, if not successful
+            ST_SkillData: stSkillDataDefault or stSkillDataCommand as new ST_SkillData or None, if not successful
         """
         if useSkillDataDefault:
-            setSkillData = self.skillDataHandles[skillName].stSkillDataDefault
             sourceSkillDataNode = self.skillConnectionNodes[
                 skillName
             ].skillDataDefaultNode
         else:
-            setSkillData = self.skillDataHandles[skillName].stSkillDataCommand
             sourceSkillDataNode = self.skillConnectionNodes[
                 skillName
             ].skillDataCommandNode
         skillData = sourceSkillDataNode.read_value()
-        setSkillData.astParameters = [
-            ST_Parameter() for i in range(skillData.iParameterCount)
-        ]
-        mapVar(skillData, setSkillData, maxListLength=skillData.iParameterCount)
+        # map to new snapshot, then replace reference in skill data handle
+        setSkillData = self._map_SkillData(skillData)
+        with self.get_SkillLock(skillName):
+            # keep length of array in struct, read from server
+            self._update_SkillStructLayout(skillName, skillData)
+            if useSkillDataDefault:
+                previousSkillDataDefault = self.skillDataHandles[
+                    skillName
+                ].stSkillDataDefault
+                self.skillDataHandles[skillName].stSkillDataDefault = setSkillData
+                self.update_SkillDataDefaultCache(skillName, previousSkillDataDefault)
+            else:
+                self.skillDataHandles[skillName].stSkillDataCommand = setSkillData
+                self.skillDataCommandsLoaded.add(skillName)
         return setSkillData
 
+    @skillRequestContext
+    @singleFlightRequest
+    def read_stSkillData_astParameters_byIndexes(
+        self, skillName: str, indexes: tuple[int, ...], useSkillDataDefault=False
+    ) -> list[ST_Parameter]:
+        """read selected elements of astParameters from stSkillDataCommand or stSkillDataDefault of specific skill,
+        update SkillData in self.SkillDataHandles. Only the selected elements are read by opc ua IndexRange.
+
+        Args:
+            skillName (str): name of skill in self.SkillDataHandles.
+            indexes (tuple[int, ...]): indexes of parameters in astParameters, e.g. SkillParameterIndex.returnIndexes
+            useSkillDataDefault (bool): read stSkillDataDefault or stSkillDataCommand
+
+        Returns:
+            list[ST_Parameter]: read parameters in order of indexes
+        """
+        if not self.indexRangeReadSupported:
+            return super().read_stSkillData_astParameters_byIndexes(
+                skillName, indexes, useSkillDataDefault
+            )
+        skillDataParameterNode = self._get_astParametersNode(
+            skillName, useSkillDataDefault
+        )
+        uaParameters: dict[int, object] = {}
+        try:
+            for start, end in self._get_IndexRanges(indexes):
+                indexRange = f"{start}:{end}" if end > start else f"{start}"
+                dataValue = skillDataParameterNode.read_attribute(
+                    ua.AttributeIds.Value, indexrange=indexRange
+                )
+                values = dataValue.Value.Value
+                if not isinstance(values, list):
+                    values = [values]
+                if len(values) != end - start + 1:
+                    # server ignores IndexRange or array is shorter than range, read complete struct for this call
+                    return super().read_stSkillData_astParameters_byIndexes(
+                        skillName, indexes, useSkillDataDefault
+                    )
+                for index, uaParameter in enumerate(values, start):
+                    uaParameters[index] = uaParameter
+        except ua.UaStatusCodeError as e:
+            if e.code in INDEX_RANGE_UNSUPPORTED_STATUS_CODES:
+                # server rejects IndexRange on struct arrays, read complete structs from now on
+                self.indexRangeReadSupported = False
+            # e.g. BadIndexRangeNoData for indexes behind array end, read complete struct for this call
+            return super().read_stSkillData_astParameters_byIndexes(
+                skillName, indexes, useSkillDataDefault
+            )
+        # map to new parameters, then replace elements in skill data handle
+        parameters = []
+        for index in indexes:
+            if index not in uaParameters:
+                continue
+            parameter = ST_Parameter()
+            mapVar(uaParameters[index], parameter)
+            parameters.append((index, parameter))
+        with self.get_SkillLock(skillName):
+            if useSkillDataDefault:
+                astParameters = self.skillDataHandles[
+                    skillName
+                ].stSkillDataDefault.astParameters
+            else:
+                astParameters = self.skillDataHandles[
+                    skillName
+                ].stSkillDataCommand.astParameters
+            for index, parameter in parameters:
+                while index >= len(astParameters):
+                    astParameters.append(ST_Parameter())
+                astParameters[index] = parameter
+        return [parameter for index, parameter in parameters]
+
+    @staticmethod
+    def _get_IndexRanges(indexes: tuple[int, ...]) -> list[tuple[int, int]]:
+        """group indexes to contiguous ranges for opc ua IndexRange reads
+
+        Args:
+            indexes (tuple[int, ...]): indexes of array elements
+
+        Returns:
+            list[tuple[int, int]]: list of (start, end) ranges, end inclusive
+        """
+        ranges: list[tuple[int, int]] = []
+        for index in sorted(set(indexes)):
+            if ranges and ranges[-1][1] + 1 == index:
+                ranges[-1] = (ranges[-1][0], index)
+            else:
+                ranges.append((index, index))
+        return ranges
+
+    def _get_astParametersNode(
+        self, skillName: str, useSkillDataDefault: bool
+    ) -> SyncNode:
+        """get astParameters member node of stSkillDataDefault or stSkillDataCommand, resolved once per skill
+
+        Args:
+            skillName (str): name of skill in self.SkillDatas.
+            useSkillDataDefault (bool): member of stSkillDataDefault or stSkillDataCommand
+
+        Returns:
+            SyncNode: astParameters node
+        """
+        skillConnectionNodes = self.skillConnectionNodes[skillName]
+        if useSkillDataDefault:
+            if skillConnectionNodes.skillDataDefaultParametersNodeId is None:
+                skillConnectionNodes.skillDataDefaultParametersNode = (
+                    skillConnectionNodes.skillDataDefaultNode.get_child(
+                        f"{self.opcUaNameSpaceIndex}:astParameters"
+                    )
+                )
+            return skillConnectionNodes.skillDataDefaultParametersNode
+        else:
+            if skillConnectionNodes.skillDataCommandParametersNodeId is None:
+                skillConnectionNodes.skillDataCommandParametersNode = (
+                    skillConnectionNodes.skillDataCommandNode.get_child(
+                        f"{self.opcUaNameSpaceIndex}:astParameters"
+                    )
+                )
+            return skillConnectionNodes.skillDataCommandParametersNode
+
+    def _get_eActiveStateNode(self, skillName: str) -> SyncNode:
+        """get eActiveState member node of stSkillState, resolved once per skill
+
+        Args:
+            skillName (str): name of skill in self.SkillDatas.
+
+        Returns:
+            SyncNode: eActiveState node
+        """
+        skillConnectionNodes = self.skillConnectionNodes[skillName]
+        if skillConnectionNodes.skillStateActiveStateNodeId is None:
+            skillConnectionNodes.skillStateActiveStateNode = (
+                skillConnectionNodes.skillStateNode.get_child(
+                    f"{self.opcUaNameSpaceIndex}:eActiveState"
+                )
+            )
+        return skillConnectionNodes.skillStateActiveStateNode
+
+    @skillRequestContext
+    @singleFlightRequest
     def read_stSkillState(self, skillName: str) -> ST_SkillState:
-        """read stSkillState of specific skill by communication interface
+        """read stSkillState of specific skill by communication interface,
+        replaces stSkillState in self.skillDataHandles by the new snapshot
 
         Args:
             skillName (str): name of skill in self.SkillDatas.
 
         Returns:
-            ST_SkillState: Skillstate as ST_SkillState or None, if not successful
+            ST_SkillState: Skillstate as new ST_SkillState or None, if not successful
         """
         skillStateNodeValue = self.skillConnectionNodes[
             skillName
         ].skillStateNode.read_value()
-        mapVar(skillStateNodeValue, self.skillDataHandles[skillName].stSkillState)
-        return self.skillDataHandles[skillName].stSkillState
-
+        # new snapshot, replaces reference in skill data handle
+        stSkillState = ST_SkillState()
+        mapVar(skillStateNodeValue, stSkillState)
+        self.skillDataHandles[skillName].stSkillState = stSkillState
+        return stSkillState
+
+    @skillRequestContext
+    @singleFlightRequest
     def read_stSkillState_member(self, skillName: str, member: str):
         """read specific member from stSkillState of specific skill by communication interface
 
@@ -427,13 +946,29 @@ class AssetSkillsCommunication_OPCUA(AssetSkillsCommunication):
             skillName
         ].skillStateNode.get_child(f"{self.opcUaNameSpaceIndex}:{member}")
         skillStateMemberNodeValue = skillStateMemberNode.read_value()
-        setattr(
-            self.skillDataHandles[skillName].stSkillState,
-            member,
-            skillStateMemberNodeValue,
-        )
+        # copy of last snapshot with new member value, replaces reference in skill data handle
+        with self.get_SkillLock(skillName):
+            stSkillState = copy.copy(self.skillDataHandles[skillName].stSkillState)
+            setattr(stSkillState, member, skillStateMemberNodeValue)
+            self.skillDataHandles[skillName].stSkillState = stSkillState
         return skillStateMemberNodeValue
 
+    @skillRequestContext
+    @singleFlightRequest
+    def read_stSkillState_eActiveState(self, skillName: str) -> int:
+        """read only eActiveState of stSkillState of specific skill by communication interface,
+        by one read of the cached eActiveState member node. Doesnt replace stSkillState in self.skillDataHandles.
+
+        Args:
+            skillName (str): name of skill in self.SkillDatas.
+
+        Returns:
+            int: eActiveState value (see ESkillStates)
+        """
+        return int(self._get_eActiveStateNode(skillName).read_value())
+
+    @requestPriorityContext(RequestPriority.Command)
+    @skillRequestContext
     def write_SingleSkillCommand(self, skillname: str, skillCommand: str) -> bool:
         """write single stSkillCommand (Start, Reset, ...) of specific skill by communication interface
 
@@ -475,6 +1010,8 @@ class AssetSkillsCommunication_OPCUA(AssetSkillsCommunication):
         else:
             return False
 
+    @requestPriorityContext(RequestPriority.Execution)
+    @skillRequestContext
     def write_stSkillData(self, skillName: str, useSkillDataDefault=False) -> bool:
         """write stSkillDataCommand or stSkillDataDefault of specific skill by communication interface
 
@@ -488,25 +1025,36 @@ class AssetSkillsCommunication_OPCUA(AssetSkillsCommunication):
 
         if useSkillDataDefault:
             skillDataNode = self.skillConnectionNodes[skillName].skillDataDefaultNode
-            sourceSkillData = self.skillDataHandles[skillName].stSkillDataDefault
         else:
             skillDataNode = self.skillConnectionNodes[skillName].skillDataCommandNode
-            sourceSkillData = self.skillDataHandles[skillName].stSkillDataCommand
-        targetSkillData = self.opcUaSkillTypes.ST_SkillData()
-        # if  parameters exists
-        if sourceSkillData.iParameterCount > 0:
-            targetSkillData.astParameters = [
-                self.opcUaSkillTypes.ST_Parameter()
-                for i in range(sourceSkillData.iParameterCount)
-            ]
-        mapVar(
-            sourceSkillData,
-            targetSkillData,
-            maxListLength=sourceSkillData.iParameterCount,
-        )
-        skillDataNode.write_value(ua.DataValue(targetSkillData))
+        # source buffer and reusable write target of skill are guarded until written
+        with self.get_SkillLock(skillName):
+            if useSkillDataDefault:
+                sourceSkillData = self.skillDataHandles[skillName].stSkillDataDefault
+            else:
+                sourceSkillData = self.skillDataHandles[skillName].stSkillDataCommand
+            targetSkillData = self._get_targetSkillData(
+                skillName, useSkillDataDefault, sourceSkillData.iParameterCount
+            )
+            mapVar(
+                sourceSkillData,
+                targetSkillData,
+                maxListLength=sourceSkillData.iParameterCount,
+            )
+            self._reset_targetParameterTail(
+                targetSkillData.astParameters,
+                sourceSkillData,
+                self.skillStructLayouts[skillName].targetSkillDataDirtyCounts,
+                useSkillDataDefault,
+            )
+            skillDataNode.write_value(ua.DataValue(targetSkillData))
+        if useSkillDataDefault:
+            # written snapshot is the new stSkillDataDefault
+            self.update_SkillDataDefaultCache(skillName)
         return True
 
+    @requestPriorityContext(RequestPriority.Execution)
+    @skillRequestContext
     def write_stSkillData_astParameters(
         self, skillname: str, useSkillDataDefault=False
     ) -> bool:
@@ -519,36 +1067,160 @@ class AssetSkillsCommunication_OPCUA(AssetSkillsCommunication):
         Returns:
             bool: True, if successful
         """
-        if useSkillDataDefault:
-            skillDataParameterNode = self.skillConnectionNodes[
-                skillname
-            ].skillDataDefaultNode.get_child(
-                f"{self.opcUaNameSpaceIndex}:astParameters"
+        skillDataParameterNode = self._get_astParametersNode(
+            skillname, useSkillDataDefault
+        )
+        # source buffer and reusable write target of skill are guarded until written
+        with self.get_SkillLock(skillname):
+            if useSkillDataDefault:
+                sourceSkillData = self.skillDataHandles[skillname].stSkillDataDefault
+            else:
+                sourceSkillData = self.skillDataHandles[skillname].stSkillDataCommand
+
+            # if no parameters then return
+            if sourceSkillData.iParameterCount <= 0:
+                return True
+            sourceSkillDataParameters = sourceSkillData.astParameters
+            targetskillDataParameter = self._get_targetParameterList(
+                skillname, useSkillDataDefault, sourceSkillData.iParameterCount
             )
-            sourceSkillData = self.skillDataHandles[skillname].stSkillDataDefault
-        else:
-            skillDataParameterNode = self.skillConnectionNodes[
-                skillname
-            ].skillDataCommandNode.get_child(
-                f"{self.opcUaNameSpaceIndex}:astParameters"
+            mapVar(
+                sourceSkillDataParameters,
+                targetskillDataParameter,
+                maxListLength=sourceSkillData.iParameterCount,
+            )
+            self._reset_targetParameterTail(
+                targetskillDataParameter,
+                sourceSkillData,
+                self.skillStructLayouts[skillname].targetParameterListDirtyCounts,
+                useSkillDataDefault,
             )
-            sourceSkillData = self.skillDataHandles[skillname].stSkillDataCommand
+            skillDataParameterNode.write_value(ua.DataValue(targetskillDataParameter))
+        if useSkillDataDefault:
+            # written snapshot is the new stSkillDataDefault
+            self.update_SkillDataDefaultCache(skillname)
+        return True
 
-        # if no parameters then return
-        if sourceSkillData.iParameterCount <= 0:
-            return True
-        sourceSkillDataParameters = sourceSkillData.astParameters
-        targetskillDataParameter = [
-            self.opcUaSkillTypes.ST_Parameter()
-            for i in range(sourceSkillData.iParameterCount)
-        ]
-        mapVar(
-            sourceSkillDataParameters,
-            targetskillDataParameter,
-            maxListLength=sourceSkillData.iParameterCount,
+    def _update_SkillStructLayout(self, skillName: str, skillData) -> None:
+        """keep plc struct layout of skill, read from server. Drops reusable write targets, if layout changed.
+        Called with lock of skill.
+
+        Args:
+            skillName (str): name of skill in self.SkillDatas.
+            skillData (opc ua ST_SkillData): skill data struct as read from server
+        """
+        plcParameterListCount = len(skillData.astParameters)
+        layout = self.skillStructLayouts.get(skillName)
+        if layout is None:
+            self.skillStructLayouts[skillName] = SkillStructLayout(
+                plcParameterListCount=plcParameterListCount
+            )
+        elif layout.plcParameterListCount != plcParameterListCount:
+            layout.plcParameterListCount = plcParameterListCount
+            layout.targetSkillDatas.clear()
+            layout.targetParameterLists.clear()
+            layout.targetSkillDataDirtyCounts.clear()
+            layout.targetParameterListDirtyCounts.clear()
+
+    def _get_targetParameterListCount(
+        self, layout: SkillStructLayout, parameterCount: int
+    ) -> int:
+        """get length of astParameters array written to server
+
+        Args:
+            layout (SkillStructLayout): plc struct layout of skill
+            parameterCount (int): iParameterCount of source skill data
+
+        Returns:
+            int: array length
+        """
+        if (
+            self.writeExactPlcParameterList
+            and layout.plcParameterListCount >= parameterCount
+        ):
+            return layout.plcParameterListCount
+        return parameterCount
+
+    def _get_targetParameterList(
+        self, skillName: str, useSkillDataDefault: bool, parameterCount: int
+    ) -> list:
+        """get reusable list of opc ua ST_Parameter for writing astParameters of skill
+
+        Args:
+            skillName (str): name of skill in self.SkillDatas.
+            useSkillDataDefault (bool): target for stSkillDataDefault or stSkillDataCommand
+            parameterCount (int): iParameterCount of source skill data
+
+        Returns:
+            list: list of opc ua ST_Parameter, allocated once per skill and layout
+        """
+        layout = self.skillStructLayouts.setdefault(skillName, SkillStructLayout())
+        listCount = self._get_targetParameterListCount(layout, parameterCount)
+        targetParameterList = layout.targetParameterLists.get(useSkillDataDefault)
+        if targetParameterList is None or len(targetParameterList) != listCount:
+            targetParameterList = [
+                self.opcUaSkillTypes.ST_Parameter() for i in range(listCount)
+            ]
+            layout.targetParameterLists[useSkillDataDefault] = targetParameterList
+            layout.targetParameterListDirtyCounts.pop(useSkillDataDefault, None)
+        return targetParameterList
+
+    def _reset_targetParameterTail(
+        self,
+        targetParameterList: list,
+        sourceSkillData,
+        dirtyCounts: dict[bool, int],
+        useSkillDataDefault: bool,
+    ) -> None:
+        """empty elements of target list behind iParameterCount in place after mapping,
+        so neither values of earlier writes (reused target) nor unused source elements are written (exact plc array length).
+        Only the dirty part of the tail is reset: elements mapped by this write or holding parameters of the last write.
+
+        Args:
+            targetParameterList (list): reused list of opc ua ST_Parameter
+            sourceSkillData (ST_SkillData): mapped source skill data
+            dirtyCounts (dict[bool, int]): dirty count of target by useSkillDataDefault, updated
+            useSkillDataDefault (bool): target for stSkillDataDefault or stSkillDataCommand
+        """
+        parameterCount = sourceSkillData.iParameterCount
+        # mapVar maps all source elements fitting into target, earlier writes up to their iParameterCount
+        dirtyCount = max(
+            min(len(sourceSkillData.astParameters), len(targetParameterList)),
+            dirtyCounts.get(useSkillDataDefault, 0),
         )
-        skillDataParameterNode.write_value(ua.DataValue(targetskillDataParameter))
-        return True
+        if dirtyCount > parameterCount:
+            # field values of one empty parameter, immutable and shared by the reset elements
+            emptyValues = vars(self.opcUaSkillTypes.ST_Parameter()).items()
+            for i in range(parameterCount, dirtyCount):
+                parameter = targetParameterList[i]
+                for key, value in emptyValues:
+                    setattr(parameter, key, value)
+        dirtyCounts[useSkillDataDefault] = parameterCount
+
+    def _get_targetSkillData(
+        self, skillName: str, useSkillDataDefault: bool, parameterCount: int
+    ):
+        """get reusable opc ua ST_SkillData for writing stSkillData of skill
+
+        Args:
+            skillName (str): name of skill in self.SkillDatas.
+            useSkillDataDefault (bool): target for stSkillDataDefault or stSkillDataCommand
+            parameterCount (int): iParameterCount of source skill data
+
+        Returns:
+            opc ua ST_SkillData: allocated once per skill and layout
+        """
+        layout = self.skillStructLayouts.setdefault(skillName, SkillStructLayout())
+        listCount = self._get_targetParameterListCount(layout, parameterCount)
+        targetSkillData = layout.targetSkillDatas.get(useSkillDataDefault)
+        if targetSkillData is None or len(targetSkillData.astParameters) != listCount:
+            targetSkillData = self.opcUaSkillTypes.ST_SkillData()
+            targetSkillData.astParameters = [
+                self.opcUaSkillTypes.ST_Parameter() for i in range(listCount)
+            ]
+            layout.targetSkillDatas[useSkillDataDefault] = targetSkillData
+            layout.targetSkillDataDirtyCounts.pop(useSkillDataDefault, None)
+        return targetSkillData
 
     def get_SkillConnectionNodes(
         self, skillNode: SyncNode, nodeId: str
@@ -5,6 +5,9 @@ from .assetskillscommunication_opcua import (
     OpcUaConnectionInfo,
     ASSET_SKILL_COMMUNICATION_OPC_TIMEOUT_DEFAULT,
 )
+from .opcuaservicemetrics import skillRequestContext
+from .opcuasingleflight import singleFlightRequest
+from ..requestpriority import RequestPriority, requestPriorityContext
 
 
 class AssetSkillsCommunication_OPCUA_Python_Asyncua(AssetSkillsCommunication_OPCUA):
@@ -24,7 +27,11 @@ class AssetSkillsCommunication_OPCUA_Python_Asyncua(AssetSkillsCommunication_OPC
     ):
         super().__init__(opcConnectionInfo, opcua_timeout)
         self.opcUaNameSpaceIndex = 0
+        # structs have no member nodes on python opc ua server
+        self.indexRangeReadSupported = False
 
+    @skillRequestContext
+    @singleFlightRequest
     def read_stSkillState_member(self, skillName: str, member: str):
         """read specific member from stSkillState of specific skill by communication interface
 
@@ -44,6 +51,25 @@ class AssetSkillsCommunication_OPCUA_Python_Asyncua(AssetSkillsCommunication_OPC
 
         return getattr(skillStateNodeValue, member)
 
+    @skillRequestContext
+    @singleFlightRequest
+    def read_stSkillState_eActiveState(self, skillName: str) -> int:
+        """read only eActiveState of stSkillState of specific skill by communication interface,
+        reads stSkillState node without mapping. Doesnt replace stSkillState in self.skillDataHandles.
+
+        Args:
+            skillName (str): name of skill in self.SkillDatas.
+
+        Returns:
+            int: eActiveState value (see ESkillStates)
+        """
+        skillStateNodeValue = self.skillConnectionNodes[
+            skillName
+        ].skillStateNode.read_value()
+        return int(skillStateNodeValue.eActiveState)
+
+    @requestPriorityContext(RequestPriority.Command)
+    @skillRequestContext
     def write_SingleSkillCommand(self, skillname: str, skillCommand: str) -> bool:
         """write single stSkillCommand (Start, Reset, ...) of specific skill by communication interface
 
@@ -73,6 +99,8 @@ class AssetSkillsCommunication_OPCUA_Python_Asyncua(AssetSkillsCommunication_OPC
         )
         return True
 
+    @requestPriorityContext(RequestPriority.Execution)
+    @skillRequestContext
     def write_stSkillData_astParameters(
         self, skillname: str, useSkillDataDefault=False
     ) -> bool:
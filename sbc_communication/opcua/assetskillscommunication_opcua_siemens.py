@@ -1,12 +1,10 @@
-from asyncua.sync import ua, SyncNode
-from sbc_statemachine.skilldatatypes import ST_SkillData, ST_Parameter
+from asyncua.sync import SyncNode
 from .assetskillscommunication_opcua import (
     AssetSkillsCommunication_OPCUA,
     SkillConnectionNodes,
     OpcUaConnectionInfo,
     ASSET_SKILL_COMMUNICATION_OPC_TIMEOUT_DEFAULT,
 )
-from ..mapVar import mapVar
 
 
 class AssetSkillsCommunication_OPCUA_Siemens(AssetSkillsCommunication_OPCUA):
@@ -20,10 +18,11 @@ class AssetSkillsCommunication_OPCUA_Siemens(AssetSkillsCommunication_OPCUA):
         opcua_session_timeout=30.0,
     ):
         super().__init__(opcConnectionInfo, opcua_timeout)
-        # Siemens specific:
-        # keep length of plc array in struct, read from server
         self.opcClient.session_timeout = int(opcua_session_timeout * 1000)
-        self.plc_parameter_list_count = 0
+        # Siemens specific:
+        # length of array in struct, written to server, must be exact!
+        # length is kept per skill in self.skillStructLayouts, read from server
+        self.writeExactPlcParameterList = True
 
     def _browseNodes_recursive(
         self,
@@ -54,118 +53,6 @@ class AssetSkillsCommunication_OPCUA_Siemens(AssetSkillsCommunication_OPCUA):
             node, searchname, searchtype, browsedepth, browsedepthmax
         )
 
-    def read_stSkillData(
-        self, skillName: str, useSkillDataDefault=True
-    ) -> ST_SkillData:
-        """read stSkillDataDefault or stSkillDataCommand of specific skill by communication interface, update SkillData in self.SkillDataHandles
-
-        Args:
-            skillName (str): name of skill in self.SkillDataHandles.
-            useSkillDataDefault (bool): read stSkillDataDefault or stSkillDataCommand
-
-        Returns:
-            ST_SkillData: stSkillDataDefault or stSkillDataCommand as ST_SkillData or None, if not successful
-        """
-        if useSkillDataDefault:
-            setSkillData = self.skillDataHandles[skillName].stSkillDataDefault
-            sourceSkillDataNode = self.skillConnectionNodes[
-                skillName
-            ].skillDataDefaultNode
-        else:
-            setSkillData = self.skillDataHandles[skillName].stSkillDataCommand
-            sourceSkillDataNode = self.skillConnectionNodes[
-                skillName
-            ].skillDataCommandNode
-        skillData = sourceSkillDataNode.read_value()
-        # Siemens specific:
-        # keep length of array in struct, read from server
-        self.plc_parameter_list_count = len(skillData.astParameters)
-        setSkillData.astParameters = [
-            ST_Parameter() for i in range(skillData.iParameterCount)
-        ]
-        mapVar(skillData, setSkillData, maxListLength=skillData.iParameterCount)
-        return setSkillData
-
-    def write_stSkillData(self, skillName: str, useSkillDataDefault=False) -> bool:
-        """write stSkillDataCommand or stSkillDataDefault of specific skill by communication interface
-
-        Args:
-            skillname (str): name of skill in self.SkillDatas.
-            useSkillDataDefault (bool): write stSkillDataDefault or stSkillDataCommand
-
-        Returns:
-            bool: True, if successful
-        """
-
-        if useSkillDataDefault:
-            skillDataNode = self.skillConnectionNodes[skillName].skillDataDefaultNode
-            sourceSkillData = self.skillDataHandles[skillName].stSkillDataDefault
-        else:
-            skillDataNode = self.skillConnectionNodes[skillName].skillDataCommandNode
-            sourceSkillData = self.skillDataHandles[skillName].stSkillDataCommand
-        targetSkillData = self.opcUaSkillTypes.ST_SkillData()
-        # Siemens specific:
-        # length of array in struct, written to server, must be exact!
-        # beckhoff server accepts smaller arrays in structs
-        targetSkillData.astParameters = [
-            self.opcUaSkillTypes.ST_Parameter()
-            for i in range(self.plc_parameter_list_count)
-        ]
-        mapVar(
-            sourceSkillData,
-            targetSkillData,
-            maxListLength=sourceSkillData.iParameterCount,
-        )
-
-        skillDataNode.write_value(ua.DataValue(targetSkillData))
-        return True
-
-    def write_stSkillData_astParameters(
-        self, skillname: str, useSkillDataDefault=False
-    ) -> bool:
-        """write astParameters of stSkillDataCommand or stSkillDataDefault of specific skill by communication interface
-
-        Args:
-            skillname (str): name of skill in self.SkillDatas.
-            useSkillDataDefault (bool): read stSkillDataDefault or stSkillDataCommand
-
-        Returns:
-            bool: True, if successful
-        """
-        if useSkillDataDefault:
-            skillDataParameterNode = self.skillConnectionNodes[
-                skillname
-            ].skillDataDefaultNode.get_child(
-                f"{self.opcUaNameSpaceIndex}:astParameters"
-            )
-            sourceSkillData = self.skillDataHandles[skillname].stSkillDataDefault
-        else:
-            skillDataParameterNode = self.skillConnectionNodes[
-                skillname
-            ].skillDataCommandNode.get_child(
-                f"{self.opcUaNameSpaceIndex}:astParameters"
-            )
-            sourceSkillData = self.skillDataHandles[skillname].stSkillDataCommand
-
-        # if no parameters then return
-        if sourceSkillData.iParameterCount <= 0:
-            return True
-        sourceSkillDataParameters = sourceSkillData.astParameters
-        # Siemens specific:
-        # length of array in struct, written to server, must be exact!
-        # beckhoff server accepts smaller arrays in structs
-        targetskillDataParameter = [
-            self.opcUaSkillTypes.ST_Parameter()
-            for i in range(self.plc_parameter_list_count)
-        ]
-        mapVar(
-            sourceSkillDataParameters,
-            targetskillDataParameter,
-            maxListLength=sourceSkillData.iParameterCount,
-        )
-        skillDataParameterNode.write_value(ua.DataValue(targetskillDataParameter))
-        return True
-
     def get_SkillConnectionNodes(
         self, skillNode: SyncNode, nodeId: str
     ) -> SkillConnectionNodes:
@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+from ..assetskillscommunication import AssetSkillsComConnectionInfo
+
+ASSET_SKILL_COMMUNICATION_OPC_TIMEOUT_DEFAULT = 2.0
+# maximal count of requests in flight per connection, further requests wait by priority
+OPC_UA_MAX_REQUESTS_IN_FLIGHT_DEFAULT = 4
+# maximal seconds a request waits for the rate limit, before OpcUaRateLimit_Error is raised
+OPC_UA_RATE_LIMIT_MAX_WAIT_DEFAULT = 1.0
+# publishing interval in milliseconds of stSkillDataDefault subscription
+OPC_UA_SKILL_DATA_DEFAULT_PUBLISHING_INTERVAL_DEFAULT = 500.0
+
+
+@dataclass
+class OpcUaConnectionInfo(AssetSkillsComConnectionInfo):
+    """dataclass storing the opc ua connection informations"""
+
+    opc_url: str = "opc.tcp://127.0.0.1:4840"
+    opc_user: str | None = None  # opc ua username
+    opc_password: str | None = None  # opc ua password
+    opc_security_policy: str | None = (
+        None  # opc ua security policy: Basic256Sha256, ...
+    )
+    opc_security_mode: str | None = None  # opc ua security mode: SignAndEncrypt, ...
+    opc_certificate_filepath: str | None = None  # filepath to opc ua certificate *.der
+    opc_private_key_filepath: str | None = None  # filepath to opc ua key *.pem
+    rootNodeId: str | None = None  # root node id for start searching skills
+    searchSkillsBrowseDepthMax: int = (
+        3  # maximal browse depth from rootNodeId for searching skills
+    )
+    # maximal count of requests in flight, see OpcUaRequestScheduler
+    maxRequestsInFlight: int = OPC_UA_MAX_REQUESTS_IN_FLIGHT_DEFAULT
+    # rate limits of requests and nodes in requests per second, None: unlimited, see OpcUaRateLimiter
+    maxRequestsPerSecond: float | None = None
+    maxNodesPerSecond: float | None = None
+    # maximal seconds a request waits for rate limit, then OpcUaRateLimit_Error is raised
+    rateLimitMaxWait: float = OPC_UA_RATE_LIMIT_MAX_WAIT_DEFAULT
+    # subscribe stSkillDataDefault of found skills, changes invalidate cached skill data defaults
+    subscribeSkillDataDefaults: bool = False
@@ -0,0 +1,242 @@
+import asyncio
+import contextlib
+import contextvars
+import time
+from ..requestpriority import RequestPriority, get_RequestPriority
+from .opcuaconnectioninfo import OPC_UA_RATE_LIMIT_MAX_WAIT_DEFAULT
+from .opcuaservicemetrics import (
+    _prometheusLabels,
+    get_ServiceName,
+    get_ServiceNodeCount,
+    opcUaRequestSkillName,
+)
+
+# services never rate limited: session services and publish requests (held by the server until notifications are available)
+OPC_UA_UNLIMITED_SERVICES = frozenset(
+    {"CreateSession", "ActivateSession", "CloseSession", "Publish"}
+)
+
+# requests of actual context are not rate limited, set by rateLimitExemptContext in caller thread.
+# Tasks started inside the context inherit it, e.g. the server state watchdog of the opc ua client started by connect.
+rateLimitExempt: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "rateLimitExempt", default=False
+)
+
+
+@contextlib.contextmanager
+def rateLimitExemptContext():
+    """send all requests inside context without rate limit, e.g. connect and health check.
+    Also usable as decorator, e.g. @rateLimitExemptContext()
+    """
+    token = rateLimitExempt.set(True)
+    try:
+        yield
+    finally:
+        rateLimitExempt.reset(token)
+
+
+class OpcUaRateLimit_Error(Exception):
+    """error if request exceeds rate limit of connection longer than maximal wait time"""
+
+
+class TokenBucket:
+    """token bucket of one rate, filled with rate tokens per second up to one second of rate.
+    Tokens are reserved on request, so waiting requests are served in order of arrival.
+    """
+
+    __slots__ = ("rate", "capacity", "tokens", "timestamp")
+
+    def __init__(self, rate: float):
+        """generate TokenBucket object
+
+        Args:
+            rate (float): tokens per second, also maximal burst
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be greater 0, not {rate}")
+        self.rate = rate
+        self.capacity = rate
+        self.tokens = rate
+        self.timestamp = time.monotonic()
+
+    def get_Wait(self, cost: float, now: float) -> float:
+        """get seconds until cost is available, without reserving
+
+        Args:
+            cost (float): count of tokens
+            now (float): actual time.monotonic()
+
+        Returns:
+            float: seconds to wait, 0.0 if available
+        """
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.timestamp) * self.rate
+        )
+        self.timestamp = now
+        # costs above capacity wait for full bucket only
+        missing = min(cost, self.capacity) - self.tokens
+        return missing / self.rate if missing > 0 else 0.0
+
+    def reserve(self, cost: float) -> None:
+        """take cost from bucket, tokens get negative for reserved future tokens"""
+        self.tokens -= cost
+
+
+class _RateLimitCounters:
+    """counters of rate limiter"""
+
+    __slots__ = ("requests", "delayed", "rejected", "waitSum")
+
+    def __init__(self):
+        self.requests = 0  # rate limited requests
+        self.delayed = 0  # requests waiting for tokens
+        self.rejected = 0  # requests raising OpcUaRateLimit_Error
+        self.waitSum = 0.0
+
+    def asdict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "delayed": self.delayed,
+            "rejected": self.rejected,
+            "waitSum": self.waitSum,
+        }
+
+
+class OpcUaRateLimiter:
+    """limits requests per second and nodes per second of one connection by token buckets,
+    e.g. for small request budgets of S7-1500 opc ua servers.
+    Requests of skills (see skillRequestContext) wait for tokens up to maxWait, then OpcUaRateLimit_Error is raised
+    (backpressure), no unbounded queueing. Other requests of the client, e.g. browsing and bulk reads of searchfor_Skills,
+    take their tokens and wait at most maxWait, without being rejected.
+    Commands (RequestPriority.Command) never wait, they take their tokens in advance.
+    Not limited: services in OPC_UA_UNLIMITED_SERVICES and requests in rateLimitExemptContext, e.g. connect,
+    checkComm and the server state watchdog.
+    Runs in the asyncio event loop of the opc ua client, not thread safe.
+    """
+
+    def __init__(
+        self,
+        maxRequestsPerSecond: float | None = None,
+        maxNodesPerSecond: float | None = None,
+        maxWait: float = OPC_UA_RATE_LIMIT_MAX_WAIT_DEFAULT,
+    ):
+        """generate OpcUaRateLimiter object
+
+        Args:
+            maxRequestsPerSecond (float | None, optional): request rate, None: unlimited. Defaults to None.
+            maxNodesPerSecond (float | None, optional): rate of nodes in requests, e.g. NodesToRead. None: unlimited. Defaults to None.
+            maxWait (float, optional): maximal seconds a request waits for tokens. Defaults to OPC_UA_RATE_LIMIT_MAX_WAIT_DEFAULT.
+        """
+        self.requestBucket = (
+            TokenBucket(maxRequestsPerSecond)
+            if maxRequestsPerSecond is not None
+            else None
+        )
+        self.nodeBucket = (
+            TokenBucket(maxNodesPerSecond) if maxNodesPerSecond is not None else None
+        )
+        self.maxWait = maxWait
+        self._counters = _RateLimitCounters()
+
+    def is_Limited(self, request) -> bool:
+        """check if request is rate limited
+
+        Args:
+            request (): asyncua request object
+
+        Returns:
+            bool: True if request takes tokens: not in rateLimitExemptContext and service not in OPC_UA_UNLIMITED_SERVICES
+        """
+        return (
+            (self.requestBucket is not None or self.nodeBucket is not None)
+            and not rateLimitExempt.get()
+            and get_ServiceName(request) not in OPC_UA_UNLIMITED_SERVICES
+        )
+
+    async def acquire(self, request) -> None:
+        """take tokens for request, wait if not available
+
+        Args:
+            request (): asyncua request object
+
+        Raises:
+            OpcUaRateLimit_Error: tokens of skill request not available within maxWait
+        """
+        counters = self._counters
+        counters.requests += 1
+        now = time.monotonic()
+        buckets = []
+        if self.requestBucket is not None:
+            buckets.append((self.requestBucket, 1))
+        if self.nodeBucket is not None:
+            nodeCount = get_ServiceNodeCount(request)
+            if nodeCount > 0:
+                buckets.append((self.nodeBucket, nodeCount))
+        wait = max(
+            (bucket.get_Wait(cost, now) for bucket, cost in buckets), default=0.0
+        )
+        if get_RequestPriority() == RequestPriority.Command:
+            wait = 0.0
+        elif wait > self.maxWait and opcUaRequestSkillName.get() is None:
+            # request of client, e.g. rediscovery: bounded wait, tokens are charged anyway
+            wait = self.maxWait
+        elif wait > self.maxWait:
+            counters.rejected += 1
+            raise OpcUaRateLimit_Error(
+                f"{get_ServiceName(request)} request exceeds rate limit, "
+                f"wait {wait:.3f}s > maxWait {self.maxWait}s"
+            )
+        for bucket, cost in buckets:
+            bucket.reserve(cost)
+        if wait > 0:
+            counters.delayed += 1
+            counters.waitSum += wait
+            await asyncio.sleep(wait)
+
+    def snapshot(self) -> dict:
+        """get snapshot of counters
+
+        Returns:
+            dict: {"timestamp": float, "requests", "delayed", "rejected", "waitSum"}
+        """
+        return {"timestamp": time.time(), **self._counters.asdict()}
+
+    def to_prometheus(
+        self, prefix: str = "sbc_opcua", labels: dict | None = None
+    ) -> str:
+        """export snapshot of counters in prometheus text format
+
+        Args:
+            prefix (str, optional): metric name prefix. Defaults to "sbc_opcua".
+            labels (dict | None, optional): additional labels, e.g. {"asset": "Robot1"}. Defaults to None.
+
+        Returns:
+            str: prometheus text exposition
+        """
+        snapshot = self.snapshot()
+        labelText = _prometheusLabels(dict(labels) if labels else {})
+        lines = []
+        series = [
+            ("ratelimit_requests_total", "requests", "count of rate limited requests"),
+            (
+                "ratelimit_delayed_total",
+                "delayed",
+                "count of requests waiting for tokens",
+            ),
+            (
+                "ratelimit_rejected_total",
+                "rejected",
+                "count of requests rejected after maximal wait",
+            ),
+            ("ratelimit_wait_seconds_sum", "waitSum", "sum of wait times for tokens"),
+        ]
+        for name, key, helpText in series:
+            metric = f"{prefix}_{name}"
+            lines.append(f"# HELP {metric} {helpText}")
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric}{labelText} {snapshot[key]}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """reset all counters, tokens are kept"""
+        self._counters = _RateLimitCounters()
@@ -0,0 +1,313 @@
+import asyncio
+import base64
+import datetime
+import hashlib
+import json
+import time
+from collections import deque
+from dataclasses import dataclass
+from asyncua import ua
+from asyncua.client.ua_client import UASocketProtocol
+from asyncua.common.utils import Buffer
+from asyncua.ua.ua_binary import struct_from_binary, struct_to_binary
+from .opcuaservicemetrics import get_ServiceName
+
+OPC_UA_RECORDING_FORMAT = "sbc_communication.opcua.recording"
+OPC_UA_RECORDING_VERSION = 1
+
+# service name of secure channel results, not sent by send_request
+OPC_UA_RECORDING_OPEN_SECURE_CHANNEL = "OpenSecureChannel"
+
+
+class OpcUaReplay_Error(Exception):
+    """error if replayed request has no recorded response"""
+
+
+@dataclass
+class OpcUaRecordingEntry:
+    """dataclass storing one recorded opc ua request and its response"""
+
+    offset: float = 0.0  # seconds since start of recording, when request was sent
+    service: str = ""  # service name, e.g. "Read"
+    key: str = ""  # hash of service name and request parameters, see get_RequestKey
+    latency: float = 0.0  # round trip time in seconds
+    response: bytes | None = None  # binary response body, None on error
+    error: str | None = None  # error message of failed request
+
+    def asdict(self) -> dict:
+        return {
+            "offset": self.offset,
+            "service": self.service,
+            "key": self.key,
+            "latency": self.latency,
+            "response": (
+                base64.b64encode(self.response).decode("ascii")
+                if self.response is not None
+                else None
+            ),
+            "error": self.error,
+        }
+
+    @staticmethod
+    def fromdict(dictionary: dict) -> "OpcUaRecordingEntry":
+        entry = OpcUaRecordingEntry(**dictionary)
+        if entry.response is not None:
+            entry.response = base64.b64decode(entry.response)
+        return entry
+
+
+def get_RequestKey(request) -> str:
+    """get key of opc ua request, independent of request header (handle, token, timestamp)
+
+    Args:
+        request (): asyncua request object
+
+    Returns:
+        str: hash of service name and binary request parameters
+    """
+    keyHash = hashlib.sha1(type(request).__name__.encode())
+    parameters = getattr(request, "Parameters", None)
+    if parameters is not None:
+        keyHash.update(struct_to_binary(parameters))
+    return keyHash.hexdigest()
+
+
+def read_Recording(filePath: str) -> tuple[dict, list[OpcUaRecordingEntry]]:
+    """read recording file, written by OpcUaRecorder
+
+    Args:
+        filePath (str): json lines file path
+
+    Raises:
+        ValueError: file is no opc ua recording
+
+    Returns:
+        tuple[dict, list[OpcUaRecordingEntry]]: header and recorded entries
+    """
+    with open(filePath, "r") as recordingFile:
+        header = json.loads(recordingFile.readline())
+        if header.get("format") != OPC_UA_RECORDING_FORMAT:
+            raise ValueError(f"{filePath} is no opc ua recording")
+        entries = [
+            OpcUaRecordingEntry.fromdict(json.loads(line))
+            for line in recordingFile
+            if line.strip()
+        ]
+    return header, entries
+
+
+class OpcUaRecorder:
+    """records requests and responses of opc ua client as json lines file, one line per request.
+    Fed by AssetSkillsCommunication_OPCUA for every request of its opc ua client.
+    """
+
+    def __init__(self, filePath: str, **headerInfos):
+        """open recording file and write header
+
+        Args:
+            filePath (str): json lines file path
+            **headerInfos: additional infos in header line, e.g. opc_url
+        """
+        self.filePath = filePath
+        self.entryCount = 0
+        self._startTime = time.perf_counter()
+        self._file = open(filePath, "w")
+        header = {
+            "format": OPC_UA_RECORDING_FORMAT,
+            "version": OPC_UA_RECORDING_VERSION,
+            "timestamp": datetime.datetime.now().isoformat(),
+            **headerInfos,
+        }
+        self._file.write(json.dumps(header) + "\n")
+
+    def record(
+        self,
+        request,
+        responseData,
+        latency: float,
+        error: Exception | None = None,
+    ) -> None:
+        """record one finished request
+
+        Args:
+            request (): asyncua request object
+            responseData (): binary response data or None on error
+            latency (float): round trip time in seconds
+            error (Exception | None, optional): error of failed request. Defaults to None.
+        """
+        self._write(
+            OpcUaRecordingEntry(
+                service=get_ServiceName(request),
+                key=get_RequestKey(request),
+                latency=latency,
+                response=bytes(responseData) if responseData is not None else None,
+                error=repr(error) if error is not None else None,
+            )
+        )
+
+    def record_OpenSecureChannel(self, result, latency: float) -> None:
+        """record result of open secure channel, replayed on connect
+
+        Args:
+            result (ua.OpenSecureChannelResult): result of secure channel request
+            latency (float): round trip time in seconds
+        """
+        self._write(
+            OpcUaRecordingEntry(
+                service=OPC_UA_RECORDING_OPEN_SECURE_CHANNEL,
+                latency=latency,
+                response=struct_to_binary(result),
+            )
+        )
+
+    def _write(self, entry: OpcUaRecordingEntry) -> None:
+        if self._file is None:
+            return
+        entry.offset = time.perf_counter() - self._startTime - entry.latency
+        self._file.write(json.dumps(entry.asdict()) + "\n")
+        self.entryCount += 1
+
+    def close(self) -> None:
+        """close recording file"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class OpcUaReplay:
+    """replays recorded responses to requests of opc ua client, without server.
+    Requests are matched by request key in recorded order, else by next recorded request of same service,
+    e.g. CreateSession with random client nonce.
+    With speed, each request is scheduled at its recorded offset from replay start (first replayed request),
+    so idle times and overlapping requests of the recorded session are replayed, too.
+    """
+
+    def __init__(
+        self, filePath: str, speed: float | None = None, latencyOnly: bool = False
+    ):
+        """read recording file
+
+        Args:
+            filePath (str): json lines file path, written by OpcUaRecorder
+            speed (float | None, optional): replay recorded timing divided by speed, None: as fast as possible. Defaults to None.
+            latencyOnly (bool, optional): with speed, only wait recorded latency per request, ignore recorded offsets. Defaults to False.
+        """
+        self.filePath = filePath
+        self.speed = speed
+        self.latencyOnly = latencyOnly
+        self.header, self.entries = read_Recording(filePath)
+        # recorded offset and perf_counter time of replay start, set by first replayed request
+        self._startOffset = min((entry.offset for entry in self.entries), default=0.0)
+        self._startTime: float | None = None
+        self.replayedCount = 0
+        self.unmatchedKeyCount = 0  # requests replayed by service, not by key
+        self._used = [False] * len(self.entries)
+        self._keyIndexes: dict[str, deque[int]] = {}
+        self._serviceIndexes: dict[str, deque[int]] = {}
+        for index, entry in enumerate(self.entries):
+            self._keyIndexes.setdefault(entry.key, deque()).append(index)
+            self._serviceIndexes.setdefault(entry.service, deque()).append(index)
+
+    def next_Entry(self, service: str, key: str = "") -> OpcUaRecordingEntry:
+        """get next unused recorded entry of request
+
+        Args:
+            service (str): service name, e.g. "Read"
+            key (str, optional): request key, see get_RequestKey. Defaults to "".
+
+        Raises:
+            OpcUaReplay_Error: no recorded entry of service left
+
+        Returns:
+            OpcUaRecordingEntry: recorded entry
+        """
+        index = self._pop_Unused(self._keyIndexes.get(key))
+        if index is None:
+            index = self._pop_Unused(self._serviceIndexes.get(service))
+            if index is None:
+                raise OpcUaReplay_Error(
+                    f"No recorded response left for {service} request in {self.filePath}"
+                )
+            self.unmatchedKeyCount += 1
+        self._used[index] = True
+        self.replayedCount += 1
+        return self.entries[index]
+
+    def _pop_Unused(self, indexes: deque[int] | None) -> int | None:
+        while indexes:
+            index = indexes.popleft()
+            if not self._used[index]:
+                return index
+        return None
+
+    async def wait_Response(self, entry: OpcUaRecordingEntry) -> None:
+        """wait for recorded response, if speed is set: until recorded offset of request from replay start,
+        if request is replayed earlier than recorded, then recorded latency. Times divided by speed.
+        With latencyOnly only recorded latency.
+
+        Args:
+            entry (OpcUaRecordingEntry): recorded entry of replayed request
+        """
+        if not self.speed:
+            return
+        delay = entry.latency / self.speed
+        if not self.latencyOnly:
+            now = time.perf_counter()
+            if self._startTime is None:
+                self._startTime = now
+            sendTime = self._startTime + (entry.offset - self._startOffset) / self.speed
+            delay += max(sendTime - now, 0.0)
+        await asyncio.sleep(delay)
+
+    def make_Protocol(self, uaclient) -> "_ReplayProtocol":
+        """create protocol replaying responses instead of socket protocol of asyncua UaClient
+
+        Args:
+            uaclient (asyncua.client.ua_client.UaClient): low level client
+
+        Returns:
+            _ReplayProtocol: replay protocol, set as uaclient.protocol
+        """
+        protocol = _ReplayProtocol(self, uaclient._timeout)
+        protocol.pre_request_hook = uaclient.pre_request_hook
+        uaclient.protocol = protocol
+        return protocol
+
+
+class _ReplayProtocol(UASocketProtocol):
+    """socket protocol of asyncua without socket, responses are replayed from OpcUaReplay"""
+
+    def __init__(self, replay: OpcUaReplay, timeout: float = 1):
+        super().__init__(timeout)
+        self.replay = replay
+        self.state = self.OPEN
+
+    async def send_request(
+        self, request, timeout: float | None = None, message_type=None
+    ):
+        if self.pre_request_hook:
+            await self.pre_request_hook()
+        self._setup_request_header(request.RequestHeader)
+        entry = self.replay.next_Entry(
+            get_ServiceName(request), get_RequestKey(request)
+        )
+        await self.replay.wait_Response(entry)
+        if entry.response is None:
+            raise ua.UaError(f"Replayed error: {entry.error}")
+        data = Buffer(entry.response)
+        self.check_answer(data, f" in response to {request.__class__.__name__}")
+        return data
+
+    async def send_hello(self, url, max_messagesize: int = 0, max_chunkcount: int = 0):
+        return None
+
+    async def open_secure_channel(self, params):
+        entry = self.replay.next_Entry(OPC_UA_RECORDING_OPEN_SECURE_CHANNEL)
+        await self.replay.wait_Response(entry)
+        return struct_from_binary(ua.OpenSecureChannelResult, Buffer(entry.response))
+
+    async def close_secure_channel(self):
+        return None
+
+    def disconnect_socket(self):
+        self.state = self.CLOSED
@@ -0,0 +1,183 @@
+import asyncio
+import heapq
+import itertools
+import time
+from ..requestpriority import RequestPriority, get_RequestPriority
+from .opcuaconnectioninfo import OPC_UA_MAX_REQUESTS_IN_FLIGHT_DEFAULT
+from .opcuaservicemetrics import _prometheusLabels, get_ServiceName
+
+# services not scheduled: publish requests are held by the server until notifications are available
+OPC_UA_UNSCHEDULED_SERVICES = frozenset({"Publish"})
+
+
+class _PriorityCounters:
+    """counters of one priority class"""
+
+    __slots__ = ("requests", "queued", "waitSum", "waitMax")
+
+    def __init__(self):
+        self.requests = 0  # scheduled requests
+        self.queued = 0  # requests waiting for a free slot
+        self.waitSum = 0.0
+        self.waitMax = 0.0
+
+    def asdict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "queued": self.queued,
+            "waitSum": self.waitSum,
+            "waitMax": self.waitMax,
+            "waitMean": self.waitSum / self.requests if self.requests > 0 else None,
+        }
+
+
+class OpcUaRequestScheduler:
+    """limits the opc ua requests in flight of one connection. If the limit is reached,
+    waiting requests are sent by RequestPriority of their context (see requestPriorityContext), then in order of arrival.
+    So skill commands are sent next, also while hmi pollers flood the session with reads.
+    Runs in the asyncio event loop of the opc ua client, not thread safe.
+    """
+
+    def __init__(self, maxInFlight: int = OPC_UA_MAX_REQUESTS_IN_FLIGHT_DEFAULT):
+        """generate OpcUaRequestScheduler object
+
+        Args:
+            maxInFlight (int, optional): maximal count of requests in flight. Defaults to OPC_UA_MAX_REQUESTS_IN_FLIGHT_DEFAULT.
+        """
+        if maxInFlight < 1:
+            raise ValueError(f"maxInFlight must be at least 1, not {maxInFlight}")
+        self.maxInFlight = maxInFlight
+        self.inFlight = 0
+        # heap of (priority, arrival, future)
+        self._waiting: list[tuple[int, int, asyncio.Future]] = []
+        self._arrival = itertools.count()
+        self._priorities: dict[RequestPriority, _PriorityCounters] = {
+            priority: _PriorityCounters() for priority in RequestPriority
+        }
+
+    def is_Scheduled(self, request) -> bool:
+        """check if request is scheduled, e.g. publish requests are not
+
+        Args:
+            request (): asyncua request object
+
+        Returns:
+            bool: True if request waits for a free slot
+        """
+        return get_ServiceName(request) not in OPC_UA_UNSCHEDULED_SERVICES
+
+    async def acquire(self) -> None:
+        """wait for free slot by priority of actual context, release after response"""
+        priority = get_RequestPriority()
+        counters = self._priorities[priority]
+        counters.requests += 1
+        if self.inFlight < self.maxInFlight and not self._waiting:
+            self.inFlight += 1
+            return
+        counters.queued += 1
+        startTime = time.perf_counter()
+        future = asyncio.get_running_loop().create_future()
+        entry = (priority, next(self._arrival), future)
+        heapq.heappush(self._waiting, entry)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.cancelled():
+                # e.g. request timeout while waiting, only waiting requests are kept
+                self._waiting.remove(entry)
+                heapq.heapify(self._waiting)
+            else:
+                # slot handed over while cancelled: pass on to next request
+                self.release()
+            raise
+        finally:
+            wait = time.perf_counter() - startTime
+            counters.waitSum += wait
+            counters.waitMax = max(counters.waitMax, wait)
+
+    def release(self) -> None:
+        """release slot, hand over to waiting request of highest priority"""
+        if self._waiting:
+            # slot stays in flight for the waiting request
+            heapq.heappop(self._waiting)[2].set_result(None)
+        else:
+            self.inFlight -= 1
+
+    def snapshot(self) -> dict:
+        """get snapshot of counters per priority class
+
+        Returns:
+            dict: {"timestamp": float, "inFlight": int, "waiting": int, "priorities": {name: {"requests", "queued", "waitSum", "waitMax", "waitMean"}}}
+        """
+        return {
+            "timestamp": time.time(),
+            "inFlight": self.inFlight,
+            "waiting": len(self._waiting),
+            "priorities": {
+                priority.name: counters.asdict()
+                for priority, counters in self._priorities.items()
+            },
+        }
+
+    def to_prometheus(
+        self, prefix: str = "sbc_opcua", labels: dict | None = None
+    ) -> str:
+        """export snapshot of counters in prometheus text format
+
+        Args:
+            prefix (str, optional): metric name prefix. Defaults to "sbc_opcua".
+            labels (dict | None, optional): additional labels, e.g. {"asset": "Robot1"}. Defaults to None.
+
+        Returns:
+            str: prometheus text exposition
+        """
+        snapshot = self.snapshot()
+        baseLabels = dict(labels) if labels else {}
+        labelText = _prometheusLabels(baseLabels)
+        lines = [
+            f"# HELP {prefix}_scheduler_in_flight requests in flight",
+            f"# TYPE {prefix}_scheduler_in_flight gauge",
+            f"{prefix}_scheduler_in_flight{labelText} {snapshot['inFlight']}",
+            f"# HELP {prefix}_scheduler_waiting requests waiting for a free slot",
+            f"# TYPE {prefix}_scheduler_waiting gauge",
+            f"{prefix}_scheduler_waiting{labelText} {snapshot['waiting']}",
+        ]
+        series = [
+            (
+                "scheduler_requests_total",
+                "requests",
+                "counter",
+                "count of scheduled requests",
+            ),
+            (
+                "scheduler_queued_total",
+                "queued",
+                "counter",
+                "count of requests waiting for a free slot",
+            ),
+            (
+                "scheduler_wait_seconds_sum",
+                "waitSum",
+                "counter",
+                "sum of wait times for a free slot",
+            ),
+            (
+                "scheduler_wait_seconds_max",
+                "waitMax",
+                "gauge",
+                "maximal wait time for a free slot",
+            ),
+        ]
+        for name, key, metricType, helpText in series:
+            metric = f"{prefix}_{name}"
+            lines.append(f"# HELP {metric} {helpText}")
+            lines.append(f"# TYPE {metric} {metricType}")
+            for priority, counters in snapshot["priorities"].items():
+                labelText = _prometheusLabels(baseLabels, priority=priority)
+                lines.append(f"{metric}{labelText} {counters[key]}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """reset all counters, requests in flight and waiting are kept"""
+        for priority in self._priorities:
+            self._priorities[priority] = _PriorityCounters()
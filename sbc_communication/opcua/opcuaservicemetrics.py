@@ -0,0 +1,306 @@
+import bisect
+import contextvars
+import functools
+import threading
+import time
+from asyncua.ua.ua_binary import struct_to_binary
+
+# name of skill the actual opc ua request is sent for, set in caller thread.
+# context is copied into the asyncio task of the opc ua client, see ThreadLoop.post
+opcUaRequestSkillName: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "opcUaRequestSkillName", default=None
+)
+
+# upper bounds of latency histogram buckets in seconds
+OPC_UA_SERVICE_LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# request parameter attributes holding the nodes of a service call
+_SERVICE_NODE_ATTRIBUTES = (
+    "NodesToRead",
+    "NodesToWrite",
+    "NodesToBrowse",
+    "BrowsePaths",
+    "ContinuationPoints",
+    "MethodsToCall",
+    "ItemsToCreate",
+    "NodesToRegister",
+    "NodesToUnregister",
+)
+
+
+def skillRequestContext(method):
+    """decorator for methods of AssetSkillsCommunication_OPCUA, with skill name as first argument.
+    Assigns all opc ua requests sent inside the method to this skill.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if args:
+            skillName = args[0]
+        else:
+            skillName = kwargs.get("skillName", kwargs.get("skillname"))
+        token = opcUaRequestSkillName.set(skillName)
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            opcUaRequestSkillName.reset(token)
+
+    return wrapper
+
+
+def get_ServiceName(request) -> str:
+    """get opc ua service name of request object, e.g. "Read" for ReadRequest
+
+    Args:
+        request (): asyncua request object
+
+    Returns:
+        str: service name
+    """
+    serviceName = type(request).__name__
+    if serviceName.endswith("Request"):
+        serviceName = serviceName[: -len("Request")]
+    return serviceName
+
+
+def get_ServiceNodeCount(request) -> int:
+    """get count of nodes in opc ua request, e.g. NodesToRead of ReadRequest
+
+    Args:
+        request (): asyncua request object
+
+    Returns:
+        int: count of nodes, 0 if service has no nodes
+    """
+    parameters = getattr(request, "Parameters", None)
+    if parameters is None:
+        return 0
+    for attribute in _SERVICE_NODE_ATTRIBUTES:
+        nodes = getattr(parameters, attribute, None)
+        if nodes is not None:
+            return len(nodes)
+    else:
+        return 0
+
+
+class _ServiceCounters:
+    """counters and latency histogram of one service type"""
+
+    __slots__ = (
+        "requests",
+        "errors",
+        "nodes",
+        "requestBytes",
+        "responseBytes",
+        "latencySum",
+        "latencyBuckets",
+    )
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.nodes = 0
+        self.requestBytes = 0
+        self.responseBytes = 0
+        self.latencySum = 0.0
+        # last bucket counts latencies above OPC_UA_SERVICE_LATENCY_BUCKETS
+        self.latencyBuckets = [0] * (len(OPC_UA_SERVICE_LATENCY_BUCKETS) + 1)
+
+    def asdict(self, measureRequestBytes: bool = True) -> dict:
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip(
+            OPC_UA_SERVICE_LATENCY_BUCKETS + ("+Inf",), self.latencyBuckets
+        ):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "nodes": self.nodes,
+            # not measured: None, not 0
+            "requestBytes": self.requestBytes if measureRequestBytes else None,
+            "responseBytes": self.responseBytes,
+            "latencySum": self.latencySum,
+            "latencyMean": (
+                self.latencySum / self.requests if self.requests > 0 else None
+            ),
+            "latencyBuckets": buckets,
+        }
+
+
+class OpcUaServiceMetrics:
+    """counts opc ua requests, nodes and bytes and measures round trip latency per service type and per skill.
+    Fed by AssetSkillsCommunication_OPCUA for every request of its opc ua client.
+    Observations are O(1) (fixed latency buckets), snapshots can be exported as dict or prometheus text format.
+    Response bytes are always counted (received binary data). Request bytes need measureRequestBytes,
+    else they are None in snapshots and not exported to prometheus.
+    """
+
+    def __init__(self, measureRequestBytes: bool = False):
+        """generate OpcUaServiceMetrics object
+
+        Args:
+            measureRequestBytes (bool, optional): measure request size, serializes each request a second time.
+                Without, requestBytes is None in snapshots. Defaults to False.
+        """
+        self.measureRequestBytes = measureRequestBytes
+        self._lock = threading.Lock()
+        self._services: dict[str, _ServiceCounters] = {}
+        self._skillServices: dict[tuple[str, str], _ServiceCounters] = {}
+
+    def observe(
+        self,
+        request,
+        responseData,
+        latency: float,
+        error: bool = False,
+    ) -> None:
+        """add observation of one finished request
+
+        Args:
+            request (): asyncua request object
+            responseData (): binary response data or None on error
+            latency (float): round trip time in seconds
+            error (bool, optional): request failed. Defaults to False.
+        """
+        serviceName = get_ServiceName(request)
+        skillName = opcUaRequestSkillName.get()
+        nodes = get_ServiceNodeCount(request)
+        requestBytes = len(struct_to_binary(request)) if self.measureRequestBytes else 0
+        responseBytes = len(responseData) if responseData is not None else 0
+        bucket = bisect.bisect_left(OPC_UA_SERVICE_LATENCY_BUCKETS, latency)
+        with self._lock:
+            serviceCounters = self._services.get(serviceName)
+            if serviceCounters is None:
+                serviceCounters = self._services[serviceName] = _ServiceCounters()
+            counters = [serviceCounters]
+            if skillName is not None:
+                skillCounters = self._skillServices.get((skillName, serviceName))
+                if skillCounters is None:
+                    skillCounters = _ServiceCounters()
+                    self._skillServices[(skillName, serviceName)] = skillCounters
+                counters.append(skillCounters)
+            for counter in counters:
+                counter.requests += 1
+                counter.nodes += nodes
+                counter.requestBytes += requestBytes
+                counter.responseBytes += responseBytes
+                counter.latencySum += latency
+                counter.latencyBuckets[bucket] += 1
+                if error:
+                    counter.errors += 1
+
+    def snapshot(self) -> dict:
+        """get snapshot of all counters
+
+        Returns:
+            dict: {"timestamp": float, "services": {service: {...}}, "skills": {skill: {service: {...}}}},
+                requestBytes is None, if not measured (see measureRequestBytes)
+        """
+        measureRequestBytes = self.measureRequestBytes
+        with self._lock:
+            services = {
+                serviceName: counters.asdict(measureRequestBytes)
+                for serviceName, counters in self._services.items()
+            }
+            skills: dict[str, dict] = {}
+            for (skillName, serviceName), counters in self._skillServices.items():
+                skills.setdefault(skillName, {})[serviceName] = counters.asdict(
+                    measureRequestBytes
+                )
+        return {"timestamp": time.time(), "services": services, "skills": skills}
+
+    def to_prometheus(
+        self, prefix: str = "sbc_opcua", labels: dict | None = None
+    ) -> str:
+        """export snapshot of counters in prometheus text format.
+        Request bytes are only exported, if measured (see measureRequestBytes).
+
+        Args:
+            prefix (str, optional): metric name prefix. Defaults to "sbc_opcua".
+            labels (dict | None, optional): additional labels, e.g. {"asset": "Robot1"}. Defaults to None.
+
+        Returns:
+            str: prometheus text exposition
+        """
+        snapshot = self.snapshot()
+        baseLabels = dict(labels) if labels else {}
+        lines = []
+        counterSeries = [
+            ("requests", "requests", "count of opc ua requests"),
+            ("errors", "errors", "count of failed opc ua requests"),
+            ("nodes", "nodes", "count of nodes in opc ua requests"),
+            ("request_bytes", "requestBytes", "bytes of opc ua requests"),
+            ("response_bytes", "responseBytes", "bytes of opc ua responses"),
+        ]
+        if not self.measureRequestBytes:
+            counterSeries = [
+                series for series in counterSeries if series[1] != "requestBytes"
+            ]
+        for name, key, helpText in counterSeries:
+            metric = f"{prefix}_{name}_total"
+            lines.append(f"# HELP {metric} {helpText}")
+            lines.append(f"# TYPE {metric} counter")
+            for serviceName, counters in snapshot["services"].items():
+                lines.append(
+                    f"{metric}{_prometheusLabels(baseLabels, service=serviceName)} {counters[key]}"
+                )
+            metric = f"{prefix}_skill_{name}_total"
+            lines.append(f"# HELP {metric} {helpText} per skill")
+            lines.append(f"# TYPE {metric} counter")
+            for skillName, services in snapshot["skills"].items():
+                for serviceName, counters in services.items():
+                    labelText = _prometheusLabels(
+                        baseLabels, service=serviceName, skill=skillName
+                    )
+                    lines.append(f"{metric}{labelText} {counters[key]}")
+        metric = f"{prefix}_request_latency_seconds"
+        lines.append(f"# HELP {metric} round trip time of opc ua requests")
+        lines.append(f"# TYPE {metric} histogram")
+        for serviceName, counters in snapshot["services"].items():
+            for bound, count in counters["latencyBuckets"].items():
+                labelText = _prometheusLabels(baseLabels, service=serviceName, le=bound)
+                lines.append(f"{metric}_bucket{labelText} {count}")
+            labelText = _prometheusLabels(baseLabels, service=serviceName)
+            lines.append(f"{metric}_sum{labelText} {counters['latencySum']}")
+            lines.append(f"{metric}_count{labelText} {counters['requests']}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """reset all counters"""
+        with self._lock:
+            self._services.clear()
+            self._skillServices.clear()
+
+
+def _prometheusLabels(baseLabels: dict, **labels) -> str:
+    allLabels = {**baseLabels, **labels}
+    if not allLabels:
+        return ""
+    return (
+        "{"
+        + ",".join(
+            f'{key}="{_escapePrometheusLabelValue(value)}"'
+            for key, value in allLabels.items()
+        )
+        + "}"
+    )
+
+
+def _escapePrometheusLabelValue(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,201 @@
+import copy
+import functools
+import threading
+import time
+from typing import Callable, Hashable
+from ..requestpriority import get_RequestPriority
+from .opcuaservicemetrics import _prometheusLabels
+
+# operations of AssetSkillsCommunication_OPCUA coalesced by default, see singleFlightRequest
+SINGLE_FLIGHT_OPERATIONS_DEFAULT = frozenset(
+    {"read_stSkillState", "read_stSkillState_member", "read_stSkillState_eActiveState"}
+)
+
+
+class OpcUaSingleFlight_Error(Exception):
+    """exception of a call in flight shared with a waiting call, if the exception cant be copied"""
+
+
+def _copy_Error(error: BaseException) -> BaseException:
+    """get new exception instance for a waiting call, same type and arguments as exception of the call in flight.
+    So tracebacks of waiting threads dont pile up on one shared instance.
+
+    Args:
+        error (BaseException): exception of call in flight
+
+    Returns:
+        BaseException: copy of error or OpcUaSingleFlight_Error
+    """
+    try:
+        return copy.copy(error)
+    except Exception:
+        return OpcUaSingleFlight_Error(f"shared call failed: {error!r}")
+
+
+class _Flight:
+    """one call in flight, its result is shared with waiting calls of same key"""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: BaseException | None = None
+
+
+class _FlightCounters:
+    """counters of one operation type"""
+
+    __slots__ = ("calls", "sharedCalls")
+
+    def __init__(self):
+        self.calls = 0  # executed calls
+        self.sharedCalls = 0  # calls served by result of a call in flight
+
+    def asdict(self) -> dict:
+        totalCalls = self.calls + self.sharedCalls
+        return {
+            "calls": self.calls,
+            "sharedCalls": self.sharedCalls,
+            "coalescingRatio": (
+                self.sharedCalls / totalCalls if totalCalls > 0 else None
+            ),
+        }
+
+
+class SingleFlight:
+    """coalesces concurrent calls with same key, e.g. reads of the same node from several threads.
+    While a call is in flight, further calls of the key wait for it and share its result or exception.
+    Each waiting call raises its own copy of the exception, chained to the exception of the call in flight.
+    Calls of the key after it finished are executed again, no result is cached.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: dict[Hashable, _Flight] = {}
+        self._operations: dict[str, _FlightCounters] = {}
+
+    def do(self, key: Hashable, function: Callable[[], object], operation: str = ""):
+        """call function, or wait for the call of same key in flight and share its result
+
+        Args:
+            key (Hashable): key of call, e.g. (operation, skillName)
+            function (Callable[[], object]): called, if no call of key is in flight
+            operation (str, optional): operation type in metrics, e.g. "read_stSkillState". Defaults to "".
+
+        Raises:
+            exception of function, in waiting calls a copy raised from it (OpcUaSingleFlight_Error, if not copyable)
+
+        Returns:
+            object: result of function
+        """
+        with self._lock:
+            counters = self._operations.get(operation)
+            if counters is None:
+                counters = self._operations[operation] = _FlightCounters()
+            flight = self._flights.get(key)
+            isLeader = flight is None
+            if isLeader:
+                flight = self._flights[key] = _Flight()
+                counters.calls += 1
+            else:
+                counters.sharedCalls += 1
+        if not isLeader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise _copy_Error(flight.error) from flight.error
+            return flight.result
+        try:
+            flight.result = function()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result
+
+    def snapshot(self) -> dict:
+        """get snapshot of counters per operation type
+
+        Returns:
+            dict: {"timestamp": float, "operations": {operation: {"calls", "sharedCalls", "coalescingRatio"}}}
+        """
+        with self._lock:
+            operations = {
+                operation: counters.asdict()
+                for operation, counters in self._operations.items()
+            }
+        return {"timestamp": time.time(), "operations": operations}
+
+    def to_prometheus(
+        self, prefix: str = "sbc_opcua", labels: dict | None = None
+    ) -> str:
+        """export snapshot of counters in prometheus text format
+
+        Args:
+            prefix (str, optional): metric name prefix. Defaults to "sbc_opcua".
+            labels (dict | None, optional): additional labels, e.g. {"asset": "Robot1"}. Defaults to None.
+
+        Returns:
+            str: prometheus text exposition
+        """
+        snapshot = self.snapshot()
+        baseLabels = dict(labels) if labels else {}
+        lines = []
+        series = [
+            ("singleflight_calls_total", "calls", "counter", "count of executed calls"),
+            (
+                "singleflight_shared_calls_total",
+                "sharedCalls",
+                "counter",
+                "count of calls served by a call in flight",
+            ),
+            (
+                "singleflight_coalescing_ratio",
+                "coalescingRatio",
+                "gauge",
+                "shared calls per call",
+            ),
+        ]
+        for name, key, metricType, helpText in series:
+            metric = f"{prefix}_{name}"
+            lines.append(f"# HELP {metric} {helpText}")
+            lines.append(f"# TYPE {metric} {metricType}")
+            for operation, counters in snapshot["operations"].items():
+                if counters[key] is None:
+                    continue
+                labelText = _prometheusLabels(baseLabels, operation=operation)
+                lines.append(f"{metric}{labelText} {counters[key]}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """reset all counters, calls in flight are kept"""
+        with self._lock:
+            self._operations.clear()
+
+
+def singleFlightRequest(method):
+    """decorator for read methods of AssetSkillsCommunication_OPCUA.
+    Concurrent calls with same arguments share one call by self.singleFlight,
+    if method name is in self.singleFlightOperations.
+    Calls of different request priority are not coalesced, so executions never wait for polling reads.
+    """
+    operation = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.singleFlight is None or operation not in self.singleFlightOperations:
+            return method(self, *args, **kwargs)
+        key = (
+            operation,
+            get_RequestPriority(),
+            args,
+            tuple(sorted(kwargs.items())),
+        )
+        return self.singleFlight.do(
+            key, lambda: method(self, *args, **kwargs), operation
+        )
+
+    return wrapper
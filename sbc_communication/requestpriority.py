@@ -0,0 +1,43 @@
+import contextlib
+import contextvars
+import enum
+
+
+class RequestPriority(enum.IntEnum):
+    """Enum for priority classes of requests to the asset, lower value is sent first"""
+
+    Command = 0  # skill commands, e.g. Start, Reset
+    Execution = 1  # reads and writes of skill executions, e.g. by SkillExecutionHandler
+    Polling = 2  # background reads, e.g. hmi pollers
+
+
+# priority of the actual request, set in caller thread.
+# None: not set, requests are sent with RequestPriority.Polling
+requestPriority: contextvars.ContextVar[RequestPriority | None] = (
+    contextvars.ContextVar("requestPriority", default=None)
+)
+
+
+def get_RequestPriority() -> RequestPriority:
+    """get priority of requests sent in actual context
+
+    Returns:
+        RequestPriority: priority set by requestPriorityContext, else RequestPriority.Polling
+    """
+    priority = requestPriority.get()
+    return RequestPriority.Polling if priority is None else priority
+
+
+@contextlib.contextmanager
+def requestPriorityContext(priority: RequestPriority):
+    """send all requests inside context with priority, if more urgent than priority of outer context.
+    Also usable as decorator, e.g. @requestPriorityContext(RequestPriority.Command)
+
+    Args:
+        priority (RequestPriority): priority of requests inside context
+    """
+    token = requestPriority.set(min(get_RequestPriority(), priority))
+    try:
+        yield
+    finally:
+        requestPriority.reset(token)
@@ -0,0 +1,11 @@
+import enum
+
+
+class ServerTypes(enum.IntEnum):
+    """Enum for representing different server types for asset skill communication"""
+
+    OPC_UA_Beckhoff = 0
+    OPC_UA_Siemens = 1
+    OPC_UA_Python_Asyncua = 2
+    OPC_UA_BundR = 3
+    Memory = 4  # in memory simulated asset, for tests and benchmarks
@@ -0,0 +1,182 @@
+import copy
+import typing
+from dataclasses import dataclass, field
+from typing import Callable
+from sbc_statemachine.skilldatatypes import ST_SkillData, ST_SkillState
+from sbc_statemachine.skillstatemachinetypes import ESkillModes, ESkillStates
+
+
+@dataclass
+class SimulatedSkill:
+    """dataclass describing one simulated skill"""
+
+    name: str = ""
+    parameterNames: list[str] = field(default_factory=list)  # input parameters
+    returnParameterNames: list[str] = field(default_factory=list)  # e.g. "Result"
+    # maps input parameter values {strName: strValue} to return parameter values
+    function: Callable[[dict[str, str]], dict[str, str]] | None = None
+    executionTime: float | None = None  # None: SimulatedSkillsConfig.executionTime
+    # default strValue by parameter name, e.g. "0.0" (type of parameter codec), else ""
+    parameterDefaults: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class SimulatedSkillsConfig:
+    """dataclass storing skills and timing of a skill simulation"""
+
+    testSkills: bool = True  # AddSkill, MultiReturnSkill, NoParamSkill
+    skills: list[SimulatedSkill] = field(default_factory=list)  # additional skills
+    generatedSkillCount: int = 0  # count of generated skills "SimSkill0000", ...
+    generatedParameterCount: int = 2  # input parameters of generated skills
+    generatedReturnParameterCount: int = 1  # return parameters of generated skills
+    executionTime: float = 0.0  # seconds in Execute state
+    transitionTime: float = 0.0  # seconds in Starting, Completing, Resetting states
+
+
+RESETTABLE_STATE_VALUES = tuple(
+    ESkillStates[name].value
+    for name in ("Completed", "Stopped", "Aborted")
+    if name in ESkillStates.__members__
+)
+ACTIVE_STATE_VALUES = tuple(
+    state.value
+    for state in ESkillStates
+    if state.value not in RESETTABLE_STATE_VALUES + (ESkillStates.Idle.value,)
+)
+
+
+def get_SimulatedSkills(config: SimulatedSkillsConfig) -> list[SimulatedSkill]:
+    """get all skills of simulation configuration
+
+    Args:
+        config (SimulatedSkillsConfig): simulation configuration
+
+    Returns:
+        list[SimulatedSkill]: test skills, additional skills and generated skills
+    """
+    skills: list[SimulatedSkill] = []
+    if config.testSkills:
+        skills.append(
+            SimulatedSkill(
+                name="AddSkill",
+                parameterNames=["Operant1", "Operant2"],
+                returnParameterNames=["Result"],
+                function=lambda inputs: {
+                    "Result": float(inputs["Operant1"]) + float(inputs["Operant2"])
+                },
+            )
+        )
+        skills.append(
+            SimulatedSkill(
+                name="MultiReturnSkill",
+                returnParameterNames=["Result1", "Result2", "Result3"],
+                function=lambda inputs: {"Result1": 1, "Result2": 2, "Result3": 3},
+            )
+        )
+        skills.append(SimulatedSkill(name="NoParamSkill"))
+    skills.extend(config.skills)
+    for i in range(config.generatedSkillCount):
+        parameterNames = [
+            f"Parameter{j}" for j in range(config.generatedParameterCount)
+        ]
+        returnParameterNames = [
+            f"Result{j}" for j in range(config.generatedReturnParameterCount)
+        ]
+        skills.append(
+            SimulatedSkill(
+                name=f"SimSkill{i:04d}",
+                parameterNames=parameterNames,
+                returnParameterNames=returnParameterNames,
+                function=create_EchoSkillFunction(parameterNames, returnParameterNames),
+            )
+        )
+    return skills
+
+
+def create_EchoSkillFunction(
+    parameterNames: list[str], returnParameterNames: list[str]
+) -> Callable[[dict[str, str]], dict[str, str]]:
+    """get skill function, returning the input parameter values as return parameter values
+
+    Args:
+        parameterNames (list[str]): input parameter names
+        returnParameterNames (list[str]): return parameter names
+
+    Returns:
+        Callable[[dict[str, str]], dict[str, str]]: skill function
+    """
+
+    def echo(inputs: dict[str, str]) -> dict[str, str]:
+        return {
+            returnName: inputs.get(parameterName, "")
+            for parameterName, returnName in zip(parameterNames, returnParameterNames)
+        }
+
+    return echo
+
+
+def create_SkillData(skill: SimulatedSkill) -> ST_SkillData:
+    """create skill data with input and return parameters of simulated skill
+
+    Args:
+        skill (SimulatedSkill): simulated skill
+
+    Returns:
+        ST_SkillData: skill data with default parameter values
+    """
+    stSkillData = ST_SkillData()
+    stSkillData.strName = skill.name
+    parameterNames = skill.parameterNames + skill.returnParameterNames
+    stSkillData.iParameterCount = len(parameterNames)
+    astParameters = []
+    for parameterName in parameterNames:
+        parameter = copy.deepcopy(_get_DefaultParameter(stSkillData))
+        parameter.strName = parameterName
+        parameter.strValue = skill.parameterDefaults.get(parameterName, "")
+        astParameters.append(parameter)
+    stSkillData.astParameters = astParameters
+    return stSkillData
+
+
+def _get_DefaultParameter(stSkillData: ST_SkillData):
+    try:
+        elementTypes = typing.get_args(
+            typing.get_type_hints(type(stSkillData)).get("astParameters")
+        )
+    except Exception:
+        elementTypes = ()
+    if elementTypes:
+        return elementTypes[0]()
+    return stSkillData.astParameters[0]
+
+
+def create_SkillState(state: ESkillStates) -> ST_SkillState:
+    """create skill state in Automatic_External mode
+
+    Args:
+        state (ESkillStates): active state
+
+    Returns:
+        ST_SkillState: skill state with enabled commands of state
+    """
+    stSkillState = ST_SkillState()
+    set_SkillState(stSkillState, state)
+    stSkillState.eActiveMode = ESkillModes.Automatic_External.value
+    stSkillState.strActiveMode = ESkillModes.Automatic_External.name
+    return stSkillState
+
+
+def set_SkillState(stSkillState, state: ESkillStates) -> None:
+    """set active state and enabled commands of ST_SkillState or opc ua ST_SkillState"""
+    stSkillState.eActiveState = state.value
+    stSkillState.strActiveState = state.name
+    stCommandEnabled = stSkillState.stCommandEnabled
+    for name, value in vars(stCommandEnabled).items():
+        if isinstance(value, bool):
+            setattr(stCommandEnabled, name, False)
+    stCommandEnabled.StartEnabled = state.value == ESkillStates.Idle.value
+    stCommandEnabled.ResetEnabled = state.value in RESETTABLE_STATE_VALUES
+    if hasattr(stCommandEnabled, "StopEnabled"):
+        stCommandEnabled.StopEnabled = state.value in ACTIVE_STATE_VALUES
+    if hasattr(stCommandEnabled, "AbortEnabled"):
+        stCommandEnabled.AbortEnabled = state.value != ESkillStates.Aborted.value
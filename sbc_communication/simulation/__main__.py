@@ -0,0 +1,95 @@
+import argparse
+import logging
+from .simulatedskillserver import (
+    SimulatedSkillServer,
+    SimulatedSkillServerConfig,
+    SIMULATED_SKILL_SERVER_PORT_DEFAULT,
+    SERVER_TYPE_NAMES,
+)
+
+
+def main(args: list[str] | None = None) -> None:
+    """run simulated skill server from command line, e.g.
+    python -m sbc_communication.simulation --server-type beckhoff --skills 100 --execution-time 0.01
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m sbc_communication.simulation",
+        description="simulated opc ua skill server for tests and benchmarks",
+    )
+    parser.add_argument(
+        "--server-type",
+        choices=SERVER_TYPE_NAMES.keys(),
+        default="python_asyncua",
+        help="vendor flavour of node layout",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=SIMULATED_SKILL_SERVER_PORT_DEFAULT)
+    parser.add_argument(
+        "--skills", type=int, default=0, help="count of generated skills"
+    )
+    parser.add_argument(
+        "--parameters",
+        type=int,
+        default=2,
+        help="input parameters of generated skills",
+    )
+    parser.add_argument(
+        "--return-parameters",
+        type=int,
+        default=1,
+        help="return parameters of generated skills",
+    )
+    parser.add_argument(
+        "--plc-parameter-list-length",
+        type=int,
+        default=0,
+        help="length of astParameters arrays, if greater than parameter count",
+    )
+    parser.add_argument(
+        "--execution-time", type=float, default=0.0, help="seconds in Execute state"
+    )
+    parser.add_argument(
+        "--transition-time",
+        type=float,
+        default=0.0,
+        help="seconds in Starting, Completing and Resetting states",
+    )
+    parser.add_argument(
+        "--browse-depth",
+        type=int,
+        default=1,
+        help="count of folders between Objects and skill nodes",
+    )
+    parser.add_argument(
+        "--no-test-skills",
+        action="store_true",
+        help="without AddSkill, MultiReturnSkill and NoParamSkill",
+    )
+    parsedArgs = parser.parse_args(args)
+    logging.basicConfig(level=logging.WARNING)
+
+    config = SimulatedSkillServerConfig(
+        serverType=SERVER_TYPE_NAMES[parsedArgs.server_type],
+        host=parsedArgs.host,
+        port=parsedArgs.port,
+        testSkills=not parsedArgs.no_test_skills,
+        generatedSkillCount=parsedArgs.skills,
+        generatedParameterCount=parsedArgs.parameters,
+        generatedReturnParameterCount=parsedArgs.return_parameters,
+        executionTime=parsedArgs.execution_time,
+        transitionTime=parsedArgs.transition_time,
+        browseDepth=parsedArgs.browse_depth,
+        plcParameterListLength=parsedArgs.plc_parameter_list_length,
+    )
+    server = SimulatedSkillServer(config)
+    connectionInfo = server.connectionInfo
+    print(
+        f"SimulatedSkillServer ({config.serverType.name}) with {len(server.skills)} skills on {server.url}, "
+        f"rootNodeId: {connectionInfo.rootNodeId}, searchSkillsBrowseDepthMax: {connectionInfo.searchSkillsBrowseDepthMax}"
+    )
+    print("press Ctrl+C to stop")
+    server.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,695 @@
+import asyncio
+import copy
+import datetime
+import enum
+import logging
+import threading
+import typing
+from dataclasses import dataclass, field
+from asyncua import Server, ua
+from asyncua.common.callback import CallbackType
+from asyncua.common.structures import load_type_definitions
+from asyncua.common.structures104 import (
+    load_data_type_definitions,
+    new_struct,
+    new_struct_field,
+)
+from asyncua.common.type_dictionary_builder import DataTypeDictionaryBuilder
+from sbc_statemachine.skilldatatypes import (
+    ST_SkillData,
+    ST_SkillCommand,
+    ST_SkillState,
+)
+from sbc_statemachine.skillstatemachinetypes import ESkillModes, ESkillStates
+from ..opcua.opcuaconnectioninfo import OpcUaConnectionInfo
+from ..servertypes import ServerTypes
+from ..simulatedskills import (
+    ACTIVE_STATE_VALUES,
+    RESETTABLE_STATE_VALUES,
+    SimulatedSkill,
+    SimulatedSkillsConfig,
+    create_SkillData,
+    create_SkillState,
+    get_SimulatedSkills,
+    set_SkillState,
+)
+
+SIMULATED_SKILL_SERVER_PORT_DEFAULT = 4841
+
+# server type names for command line, e.g. "beckhoff" for ServerTypes.OPC_UA_Beckhoff
+SERVER_TYPE_NAMES = {
+    serverType.name.removeprefix("OPC_UA_").lower(): serverType
+    for serverType in ServerTypes
+    if serverType.name.startswith("OPC_UA_")
+}
+
+# skill structs of one skill, in order of creation
+SIMULATED_SKILL_STRUCTS = (
+    "stSkillState",
+    "stSkillCommand",
+    "stSkillDataDefault",
+    "stSkillDataCommand",
+)
+
+# opc ua variant types of python values in skill structs
+_PYTHON_TYPES_TO_VARIANT_TYPES = (
+    (bool, ua.VariantType.Boolean),
+    (int, ua.VariantType.Int32),
+    (float, ua.VariantType.Double),
+    (str, ua.VariantType.String),
+)
+
+_logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SimulatedSkillServerConfig(SimulatedSkillsConfig):
+    """dataclass storing the configuration of the simulated skill server, see SimulatedSkillsConfig for skills and timing"""
+
+    serverType: ServerTypes = ServerTypes.OPC_UA_Python_Asyncua  # node layout flavour
+    host: str = "127.0.0.1"
+    port: int = SIMULATED_SKILL_SERVER_PORT_DEFAULT
+    browseDepth: int = 1  # count of folders between Objects and skill nodes
+    # length of astParameters arrays, if greater than parameter count (plc arrays)
+    plcParameterListLength: int = 0
+
+
+class SimulatedSkillServer:
+    """asyncua server simulating an asset with skills (SkillBasedControlFramework).
+    Provides ST_SkillData, ST_SkillState and ST_SkillCommand structs and a state machine per skill,
+    with vendor flavoured node layouts of ServerTypes:
+
+    * OPC_UA_Python_Asyncua: struct variables only, browse names in namespace 0
+    * OPC_UA_Beckhoff: struct member nodes, node ids "Level1.AddSkill.stSkillState", namespace 4
+    * OPC_UA_Siemens: struct member nodes, data block "AddSkill_DB" with Inputs / Outputs folders, namespace 3
+    * OPC_UA_BundR: struct member nodes, namespace 6, types in legacy type dictionary
+
+    Runs in own thread with start() / stop() or as context manager, or blocking with run().
+    """
+
+    def __init__(self, config: SimulatedSkillServerConfig | None = None):
+        """generate SimulatedSkillServer object
+
+        Args:
+            config (SimulatedSkillServerConfig | None, optional): server configuration. Defaults to None.
+        """
+        self.config = config if config is not None else SimulatedSkillServerConfig()
+        self.skills: dict[str, SimulatedSkill] = {
+            skill.name: skill for skill in get_SimulatedSkills(self.config)
+        }
+        self.server: Server | None = None
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._started = threading.Event()
+        self._stopEvent: asyncio.Event | None = None
+        self._startError: BaseException | None = None
+        self._uaTypes: dict[str, type] = {}
+        self._uaDataTypes: dict[str, ua.NodeId] = {}
+        self._skillStates: dict[str, _SimulatedSkillState] = {}
+        # node id -> (skill name, struct name, member path)
+        self._nodeMembers: dict[ua.NodeId, tuple[str, str, tuple[str, ...]]] = {}
+        self._rootNodeId: str = "i=85"
+
+    @property
+    def url(self) -> str:
+        return f"opc.tcp://{self.config.host}:{self.config.port}"
+
+    @property
+    def connectionInfo(self) -> OpcUaConnectionInfo:
+        """connection info with root node and browse depth of skills"""
+        browseDepthMax = max(self.config.browseDepth, 1)
+        if self.config.serverType == ServerTypes.OPC_UA_Siemens:
+            browseDepthMax += 1
+        return OpcUaConnectionInfo(
+            opc_url=self.url,
+            rootNodeId=self._rootNodeId,
+            searchSkillsBrowseDepthMax=browseDepthMax,
+        )
+
+    def start(self, timeout: float = 10.0) -> "SimulatedSkillServer":
+        """start server in own thread, returns after server is started
+
+        Args:
+            timeout (float, optional): maximal startup time in seconds. Defaults to 10.0.
+
+        Raises:
+            TimeoutError: server not started in time
+
+        Returns:
+            SimulatedSkillServer: self
+        """
+        self._started.clear()
+        self._startError = None
+        self._thread = threading.Thread(target=self._run_Thread, daemon=True)
+        self._thread.start()
+        if not self._started.wait(timeout):
+            raise TimeoutError(f"SimulatedSkillServer not started after {timeout}s")
+        if self._startError is not None:
+            raise self._startError
+        return self
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """stop server started by start()
+
+        Args:
+            timeout (float, optional): maximal shutdown time in seconds. Defaults to 10.0.
+        """
+        if self.loop is not None and self._stopEvent is not None:
+            self.loop.call_soon_threadsafe(self._stopEvent.set)
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run_Thread(self) -> None:
+        try:
+            asyncio.run(self.run_async())
+        except Exception as e:
+            # startup errors are raised by start()
+            if self._startError is None:
+                _logger.exception(f"SimulatedSkillServer stopped with error: {e}")
+
+    def __enter__(self) -> "SimulatedSkillServer":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def run(self) -> None:
+        """run server blocking, until KeyboardInterrupt"""
+        try:
+            asyncio.run(self.run_async())
+        except KeyboardInterrupt:
+            pass
+
+    async def run_async(self) -> None:
+        """run server in actual event loop until stop()"""
+        self.loop = asyncio.get_running_loop()
+        self._stopEvent = asyncio.Event()
+        try:
+            await self._init_Server()
+            await self.server.start()
+        except BaseException as e:
+            self._startError = e
+            self._started.set()
+            raise
+        try:
+            self._started.set()
+            await self._stopEvent.wait()
+        finally:
+            for skillState in self._skillStates.values():
+                skillState.cancel_Task()
+            await self.server.stop()
+
+    async def _init_Server(self) -> None:
+        self.server = Server()
+        await self.server.init()
+        self.server.set_endpoint(self.url)
+        self.server.set_server_name("SBC Simulated Skill Server")
+        self.server.set_security_policy([ua.SecurityPolicyType.NoSecurity])
+        await self.server.set_build_info(
+            "urn:sbc:simulation",
+            _MANUFACTURER_NAMES[self.config.serverType],
+            "SBC Simulated Skill Server",
+            "1.0",
+            "0",
+            datetime.datetime.now(),
+        )
+        # vendor namespace indexes, e.g. 3 (Siemens), 4 (Beckhoff), 6 (B&R)
+        idx = await self.server.register_namespace("urn:sbc:simulation:types")
+        while idx < max(_NODE_ID_NAMESPACES[self.config.serverType], 2):
+            idx = await self.server.register_namespace(
+                f"urn:sbc:simulation:ns{idx + 1}"
+            )
+        await self._init_SkillTypes()
+        await self._init_SkillNodes()
+        self.server.subscribe_server_callback(
+            CallbackType.PostWrite, self._on_PostWrite
+        )
+        if self.config.serverType != ServerTypes.OPC_UA_Python_Asyncua:
+            # plc servers support IndexRange on arrays, python asyncua server not
+            self._enable_IndexRangeReads()
+
+    async def _init_SkillTypes(self) -> None:
+        """create opc ua struct types reflected from sbc_statemachine skill data types"""
+        structs: dict[str, list[tuple[str, object, bool]]] = {}
+        for obj in (ST_SkillState(), ST_SkillCommand(), ST_SkillData()):
+            _reflect_Struct(obj, structs)
+        if self.config.serverType == ServerTypes.OPC_UA_BundR:
+            # B&R client loads types from legacy type dictionary
+            builder = DataTypeDictionaryBuilder(
+                self.server, 2, "urn:sbc:simulation:types", "SkillTypes"
+            )
+            await builder.init()
+            for name, structFields in structs.items():
+                dataType = await builder.create_data_type(name)
+                self._uaDataTypes[name] = dataType.data_type
+                for fieldName, fieldType, isArray in structFields:
+                    typeName = (
+                        fieldType if isinstance(fieldType, str) else fieldType.name
+                    )
+                    builder.add_field(typeName, fieldName, name, is_array=isArray)
+            await builder.set_dict_byte_string()
+            self._uaTypes = (await load_type_definitions(self.server))[1]
+        else:
+            for name, structFields in structs.items():
+                dataTypeNode, _ = await new_struct(
+                    self.server,
+                    2,
+                    name,
+                    [
+                        new_struct_field(
+                            fieldName,
+                            (
+                                self._uaDataTypes[fieldType]
+                                if isinstance(fieldType, str)
+                                else fieldType
+                            ),
+                            array=isArray,
+                        )
+                        for fieldName, fieldType, isArray in structFields
+                    ],
+                )
+                self._uaDataTypes[name] = dataTypeNode.nodeid
+            # overwrite types of servers started before in this process
+            self._uaTypes = await load_data_type_definitions(
+                self.server, overwrite_existing=True
+            )
+
+    async def _init_SkillNodes(self) -> None:
+        serverType = self.config.serverType
+        ns = _NODE_ID_NAMESPACES[serverType]
+        browseNs = _BROWSE_NAMESPACES[serverType]
+        parent = self.server.nodes.objects
+        folderPath: list[str] = []
+        for level in range(1, self.config.browseDepth + 1):
+            folderPath.append(f"Level{level}")
+            folderId = _get_FolderIdentifier(serverType, folderPath)
+            parent = await parent.add_folder(
+                ua.NodeId(folderId, ns), ua.QualifiedName(f"Level{level}", browseNs)
+            )
+            if level == 1:
+                self._rootNodeId = parent.nodeid.to_string()
+        for skill in self.skills.values():
+            skillState = _SimulatedSkillState(self, skill)
+            skillState.uaStructs = {
+                "stSkillState": self._to_UaType(create_SkillState(ESkillStates.Idle)),
+                "stSkillCommand": self._to_UaType(ST_SkillCommand()),
+                "stSkillDataDefault": self._to_UaType(create_SkillData(skill)),
+                "stSkillDataCommand": self._to_UaType(create_SkillData(skill)),
+            }
+            self._pad_ParameterLists(skillState)
+            self._skillStates[skill.name] = skillState
+            skillIdentifier = _get_SkillIdentifier(serverType, folderPath, skill.name)
+            skillNode = await parent.add_object(
+                ua.NodeId(skillIdentifier, ns),
+                ua.QualifiedName(skill.name, browseNs),
+            )
+            structParents = {
+                structName: skillNode for structName in SIMULATED_SKILL_STRUCTS
+            }
+            if serverType == ServerTypes.OPC_UA_Siemens:
+                inputsNode = await skillNode.add_object(
+                    ua.NodeId(f"{skillIdentifier}.Inputs", ns),
+                    ua.QualifiedName("Inputs", browseNs),
+                )
+                outputsNode = await skillNode.add_object(
+                    ua.NodeId(f"{skillIdentifier}.Outputs", ns),
+                    ua.QualifiedName("Outputs", browseNs),
+                )
+                structParents["stSkillCommand"] = inputsNode
+                structParents["stSkillDataCommand"] = inputsNode
+                structParents["stSkillState"] = outputsNode
+                structParents["stSkillDataDefault"] = outputsNode
+            for structName in SIMULATED_SKILL_STRUCTS:
+                await self._add_StructNode(
+                    structParents[structName],
+                    skill.name,
+                    structName,
+                    _get_MemberIdentifier(serverType, skillIdentifier, structName),
+                    skillState.uaStructs[structName],
+                    (),
+                    withMembers=serverType != ServerTypes.OPC_UA_Python_Asyncua,
+                )
+
+    async def _add_StructNode(
+        self,
+        parent,
+        skillName: str,
+        structName: str,
+        identifier: str,
+        value,
+        path: tuple[str, ...],
+        withMembers: bool,
+    ) -> None:
+        serverType = self.config.serverType
+        browseName = path[-1] if path else structName
+        node = await parent.add_variable(
+            ua.NodeId(identifier, _NODE_ID_NAMESPACES[serverType]),
+            ua.QualifiedName(browseName, _BROWSE_NAMESPACES[serverType]),
+            self._to_Variant(value),
+            datatype=self._get_DataType(value),
+        )
+        await node.set_writable()
+        self._nodeMembers[node.nodeid] = (skillName, structName, path)
+        self._skillStates[skillName].nodes.setdefault(structName, []).append(
+            (node.nodeid, path)
+        )
+        if not withMembers or not hasattr(value, "__dict__"):
+            return
+        for memberName, memberValue in vars(value).items():
+            await self._add_StructNode(
+                node,
+                skillName,
+                structName,
+                _get_MemberIdentifier(serverType, identifier, memberName),
+                memberValue,
+                path + (memberName,),
+                withMembers,
+            )
+
+    def _to_UaType(self, obj):
+        """convert sbc_statemachine object to opc ua struct object of server types"""
+        if isinstance(obj, enum.Enum):
+            return obj.value
+        if isinstance(obj, list):
+            return [self._to_UaType(element) for element in obj]
+        if not hasattr(obj, "__dict__"):
+            return obj
+        uaObj = self._uaTypes[type(obj).__name__]()
+        for memberName, memberValue in vars(obj).items():
+            setattr(uaObj, memberName, self._to_UaType(memberValue))
+        return uaObj
+
+    def _to_Variant(self, value) -> ua.Variant:
+        if isinstance(value, list):
+            if len(value) > 0:
+                return ua.Variant(copy.deepcopy(value), _get_VariantType(value[0]))
+            return ua.Variant([], ua.VariantType.ExtensionObject)
+        return ua.Variant(copy.deepcopy(value), _get_VariantType(value))
+
+    def _get_DataType(self, value) -> ua.NodeId:
+        if isinstance(value, list):
+            # arrays of skill structs only contain structs, e.g. astParameters
+            value = value[0] if len(value) > 0 else self._uaTypes["ST_Parameter"]()
+        if hasattr(value, "__dict__"):
+            return self._uaDataTypes[type(value).__name__]
+        return ua.NodeId(_get_VariantType(value).value, 0)
+
+    def _pad_ParameterLists(self, skillState: "_SimulatedSkillState") -> None:
+        for structName in ("stSkillDataDefault", "stSkillDataCommand"):
+            astParameters = skillState.uaStructs[structName].astParameters
+            if len(astParameters) == 0:
+                # opc ua array needs an element for its data type
+                astParameters.append(self._uaTypes["ST_Parameter"]())
+            while len(astParameters) < self.config.plcParameterListLength:
+                astParameters.append(self._uaTypes["ST_Parameter"]())
+
+    async def publish(self, skillName: str, structName: str) -> None:
+        """write actual struct of skill to its struct node and member nodes
+
+        Args:
+            skillName (str): name of skill
+            structName (str): name of struct, see SIMULATED_SKILL_STRUCTS
+        """
+        uaStruct = self._skillStates[skillName].uaStructs[structName]
+        for nodeId, path in self._skillStates[skillName].nodes[structName]:
+            value = uaStruct
+            for memberName in path:
+                value = getattr(value, memberName)
+            await self.server.write_attribute_value(
+                nodeId, ua.DataValue(self._to_Variant(value))
+            )
+
+    async def _on_PostWrite(self, event, dispatcher) -> None:
+        """take over values written by clients to skill structs, then process skill commands"""
+        changedStructs: list[tuple[str, str]] = []
+        for writeValue, statusCode in zip(
+            event.request_params.NodesToWrite, event.response_params
+        ):
+            member = self._nodeMembers.get(writeValue.NodeId)
+            if member is None or not statusCode.is_good():
+                continue
+            skillName, structName, path = member
+            value = copy.deepcopy(writeValue.Value.Value.Value)
+            skillState = self._skillStates[skillName]
+            if len(path) == 0:
+                skillState.uaStructs[structName] = value
+            else:
+                parent = skillState.uaStructs[structName]
+                for memberName in path[:-1]:
+                    parent = getattr(parent, memberName)
+                setattr(parent, path[-1], value)
+            if (skillName, structName) not in changedStructs:
+                changedStructs.append((skillName, structName))
+        for skillName, structName in changedStructs:
+            if structName == "stSkillCommand":
+                await self._skillStates[skillName].process_Commands()
+            else:
+                await self.publish(skillName, structName)
+
+    def _enable_IndexRangeReads(self) -> None:
+        """read service of asyncua server ignores IndexRange, apply IndexRange on array values"""
+        attributeService = self.server.iserver.attribute_service
+        read = attributeService.read
+
+        def _read(params: ua.ReadParameters) -> list[ua.DataValue]:
+            results = read(params)
+            for i, readValue in enumerate(params.NodesToRead):
+                if readValue.IndexRange:
+                    results[i] = _apply_IndexRange(results[i], readValue.IndexRange)
+            return results
+
+        attributeService.read = _read
+
+
+class _SimulatedSkillState:
+    """runtime data and state machine of one simulated skill"""
+
+    def __init__(self, server: SimulatedSkillServer, skill: SimulatedSkill):
+        self.server = server
+        self.skill = skill
+        self.uaStructs: dict[str, object] = {}
+        # struct name -> list of (node id, member path)
+        self.nodes: dict[str, list[tuple[ua.NodeId, tuple[str, ...]]]] = {}
+        self.task: asyncio.Task | None = None
+
+    @property
+    def activeState(self) -> int:
+        return self.uaStructs["stSkillState"].eActiveState
+
+    async def set_State(self, state: ESkillStates) -> None:
+        """set active state, enabled commands and publish stSkillState"""
+        stSkillState = self.uaStructs["stSkillState"]
+        set_SkillState(stSkillState, state)
+        await self.server.publish(self.skill.name, "stSkillState")
+
+    async def process_Commands(self) -> None:
+        """execute commands set by client and reset them, like a plc does"""
+        stSkillCommand = self.uaStructs["stSkillCommand"]
+        commands = [
+            (group, name)
+            for group in ("stCommand_Mode", "stCommand_State")
+            for name, value in vars(getattr(stSkillCommand, group)).items()
+            if value is True
+        ]
+        for group, name in commands:
+            setattr(getattr(stSkillCommand, group), name, False)
+        await self.server.publish(self.skill.name, "stSkillCommand")
+        for group, name in commands:
+            if group == "stCommand_Mode":
+                await self.set_Mode(name)
+            else:
+                await self.handle_StateCommand(name)
+
+    async def set_Mode(self, modeName: str) -> None:
+        if modeName not in ESkillModes.__members__:
+            return
+        stSkillState = self.uaStructs["stSkillState"]
+        stSkillState.eActiveMode = ESkillModes[modeName].value
+        stSkillState.strActiveMode = modeName
+        await self.server.publish(self.skill.name, "stSkillState")
+
+    async def handle_StateCommand(self, command: str) -> None:
+        activeState = self.activeState
+        if command == "Start" and activeState == ESkillStates.Idle.value:
+            self.start_Task(self._execute())
+        elif command == "Reset" and activeState in RESETTABLE_STATE_VALUES:
+            self.start_Task(self._reset())
+        elif command == "Stop" and activeState in ACTIVE_STATE_VALUES:
+            self.cancel_Task()
+            await self.set_State(ESkillStates.Stopped)
+        elif command == "Abort" and activeState != ESkillStates.Aborted.value:
+            self.cancel_Task()
+            await self.set_State(ESkillStates.Aborted)
+
+    def start_Task(self, coroutine) -> None:
+        self.cancel_Task()
+        self.task = asyncio.create_task(coroutine)
+
+    def cancel_Task(self) -> None:
+        if self.task is not None and not self.task.done():
+            self.task.cancel()
+        self.task = None
+
+    async def _transition(self, stateName: str) -> None:
+        state = ESkillStates.__members__.get(stateName)
+        if state is None:
+            return
+        await self.set_State(state)
+        if self.server.config.transitionTime > 0:
+            await asyncio.sleep(self.server.config.transitionTime)
+
+    async def _execute(self) -> None:
+        await self._transition("Starting")
+        await self._transition("Execute")
+        executionTime = self.skill.executionTime
+        if executionTime is None:
+            executionTime = self.server.config.executionTime
+        stSkillDataCommand = self.uaStructs["stSkillDataCommand"]
+        parameters = stSkillDataCommand.astParameters[
+            : stSkillDataCommand.iParameterCount
+        ]
+        inputs = {parameter.strName: parameter.strValue for parameter in parameters}
+        try:
+            outputs = self.skill.function(inputs) if self.skill.function else {}
+        except Exception as e:
+            _logger.info(f"SimulatedSkill {self.skill.name} aborted: {e}")
+            await self.set_State(ESkillStates.Aborted)
+            return
+        if executionTime > 0:
+            await asyncio.sleep(executionTime)
+        for parameter in parameters:
+            if parameter.strName in outputs:
+                parameter.strValue = str(outputs[parameter.strName])
+        await self.server.publish(self.skill.name, "stSkillDataCommand")
+        await self._transition("Completing")
+        await self.set_State(ESkillStates.Completed)
+
+    async def _reset(self) -> None:
+        await self._transition("Resetting")
+        await self.set_State(ESkillStates.Idle)
+
+
+_MANUFACTURER_NAMES = {
+    ServerTypes.OPC_UA_Beckhoff: "Beckhoff Automation (simulated)",
+    ServerTypes.OPC_UA_Siemens: "Siemens AG (simulated)",
+    ServerTypes.OPC_UA_Python_Asyncua: "FreeOpcUa (simulated)",
+    ServerTypes.OPC_UA_BundR: "B&R Industrial Automation (simulated)",
+}
+
+# namespace index of skill node ids and browse names, see AssetSkillsCommunication_OPCUA.opcUaNameSpaceIndex
+_NODE_ID_NAMESPACES = {
+    ServerTypes.OPC_UA_Beckhoff: 4,
+    ServerTypes.OPC_UA_Siemens: 3,
+    ServerTypes.OPC_UA_Python_Asyncua: 2,
+    ServerTypes.OPC_UA_BundR: 6,
+}
+_BROWSE_NAMESPACES = {
+    ServerTypes.OPC_UA_Beckhoff: 4,
+    ServerTypes.OPC_UA_Siemens: 4,
+    ServerTypes.OPC_UA_Python_Asyncua: 0,
+    ServerTypes.OPC_UA_BundR: 6,
+}
+
+
+def _get_FolderIdentifier(serverType: ServerTypes, folderPath: list[str]) -> str:
+    if serverType == ServerTypes.OPC_UA_BundR:
+        return "::" + ":".join(folderPath)
+    return ".".join(folderPath)
+
+
+def _get_SkillIdentifier(
+    serverType: ServerTypes, folderPath: list[str], skillName: str
+) -> str:
+    if serverType == ServerTypes.OPC_UA_Siemens:
+        return f'"{skillName}_DB"'
+    if serverType == ServerTypes.OPC_UA_BundR:
+        return f"{_get_FolderIdentifier(serverType, folderPath)}:{skillName}"
+    return ".".join(folderPath + [skillName])
+
+
+def _get_MemberIdentifier(
+    serverType: ServerTypes, parentIdentifier: str, memberName: str
+) -> str:
+    if serverType == ServerTypes.OPC_UA_Siemens:
+        return f'{parentIdentifier}."{memberName}"'
+    return f"{parentIdentifier}.{memberName}"
+
+
+def _get_VariantType(value) -> ua.VariantType:
+    for pythonType, variantType in _PYTHON_TYPES_TO_VARIANT_TYPES:
+        if isinstance(value, pythonType):
+            return variantType
+    return ua.VariantType.ExtensionObject
+
+
+def _reflect_Struct(obj, structs: dict[str, list[tuple[str, object, bool]]]) -> str:
+    """reflect struct layout of sbc_statemachine object, nested structs first
+
+    Args:
+        obj (): instance of sbc_statemachine skill data type
+        structs (dict[str, list[tuple[str, object, bool]]]): struct name -> list of (field name, variant type or struct name, is array)
+
+    Returns:
+        str: struct name
+    """
+    structName = type(obj).__name__
+    if structName in structs:
+        return structName
+    try:
+        typeHints = typing.get_type_hints(type(obj))
+    except Exception:
+        typeHints = {}
+    structFields: list[tuple[str, object, bool]] = []
+    for memberName, memberValue in vars(obj).items():
+        isArray = isinstance(memberValue, list)
+        if isArray:
+            elementTypes = typing.get_args(typeHints.get(memberName))
+            if elementTypes:
+                memberValue = elementTypes[0]()
+            elif len(memberValue) > 0:
+                memberValue = memberValue[0]
+            else:
+                raise TypeError(
+                    f"Cant reflect element type of {structName}.{memberName}"
+                )
+        if isinstance(memberValue, enum.Enum):
+            memberValue = memberValue.value
+        if hasattr(memberValue, "__dict__"):
+            fieldType = _reflect_Struct(memberValue, structs)
+        else:
+            fieldType = _get_VariantType(memberValue)
+            if fieldType == ua.VariantType.ExtensionObject:
+                raise TypeError(f"Cant reflect type of {structName}.{memberName}")
+        structFields.append((memberName, fieldType, isArray))
+    structs[structName] = structFields
+    return structName
+
+
+def _apply_IndexRange(dataValue: ua.DataValue, indexRange: str) -> ua.DataValue:
+    """apply one dimensional IndexRange "a" or "a:b" on array value"""
+    variant = dataValue.Value
+    if variant is None or not isinstance(variant.Value, list):
+        return ua.DataValue(
+            StatusCode_=ua.StatusCode(ua.StatusCodes.BadIndexRangeInvalid)
+        )
+    try:
+        bounds = [int(bound) for bound in indexRange.split(":")]
+    except ValueError:
+        return ua.DataValue(
+            StatusCode_=ua.StatusCode(ua.StatusCodes.BadIndexRangeInvalid)
+        )
+    start, end = bounds[0], bounds[-1]
+    if len(bounds) > 2 or start < 0 or end < start:
+        return ua.DataValue(
+            StatusCode_=ua.StatusCode(ua.StatusCodes.BadIndexRangeInvalid)
+        )
+    if start >= len(variant.Value):
+        return ua.DataValue(
+            StatusCode_=ua.StatusCode(ua.StatusCodes.BadIndexRangeNoData)
+        )
+    return ua.DataValue(
+        ua.Variant(variant.Value[start : end + 1], variant.VariantType),
+        SourceTimestamp=dataValue.SourceTimestamp,
+        ServerTimestamp=dataValue.ServerTimestamp,
+    )
@@ -1,13 +1,40 @@
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Generator, Iterable
 from sbc_statemachine.skilldatatypes import (
     ST_SkillState,
     ST_Parameter,
 )
 from sbc_statemachine.skillstatemachinetypes import ESkillModes, ESkillStates
 from .assetskillscommunication import AssetSkillsCommunication
+from .requestpriority import RequestPriority, requestPriorityContext
+from .skillparametercodec import EncodedParameters
+from .skillparameterindex import SKILL_RETURN_PARAMETERS_PATTERN
+from .skillexecutionmetrics import (
+    ExecutionRequestCounter,
+    RollingHistogram,
+    SkillExecutionMetrics,
+    SkillExecutionPhaseRecord,
+    SkillExecutionPhaseTimer,
+    executionRequestCounter,
+)
+
+# adaptive wait for skill execution, see SkillExecutionHandler adaptiveWait
+ADAPTIVE_WAIT_WINDOW = 50  # count of latest execution durations per skill
+ADAPTIVE_WAIT_SAMPLES_MIN = 3  # executions with fixed polling, before waiting adaptive
+ADAPTIVE_WAIT_EARLY_FACTOR = 0.9  # sleep until factor * short execution duration (p5)
+ADAPTIVE_WAIT_DENSE_POLLS = 5  # polls from early wake up to long duration (p95)
+ADAPTIVE_WAIT_POLL_MIN = 0.001  # minimal seconds between dense polls
 
+# end marker of parameter sets in executeMany
+_NO_PARAMETER_SET = object()
 
-SKILL_RETURN_PARAMETERS_PATTERN = ["return", "result"]
+# timeout of background resets in seconds, if skillResettingTimeout is 0.0 (no timeout)
+EAGER_RESET_TIMEOUT_DEFAULT = 10.0
+
+# background resets of all handlers, see SkillExecutionHandler eagerReset
+_eagerResetExecutor = ThreadPoolExecutor(thread_name_prefix="SkillEagerReset")
 
 
 class SkillExecution_Error(Exception): ...
@@ -43,7 +70,9 @@ class WrongSkillParameter(SkillExecution_Error):
 
 
 class SkillExecutionHandler:
-    """handles the execution of specific skill in assetskilsshandle"""
+    """handles the execution of specific skill in assetskilsshandle.
+    Requests of executions are sent with RequestPriority.Execution, ahead of background polling.
+    """
 
     def __init__(
         self,
@@ -51,6 +80,11 @@ class SkillExecutionHandler:
         assetSkillsCycleTime: float = 0.1,
         skillExecutionTimeout: float = 0.0,
         skillResettingTimeout: float = 0.0,
+        recordPhaseMetrics: bool = False,
+        phaseMetricsCallback: Callable[[SkillExecutionPhaseRecord], None] | None = None,
+        eagerReset: bool = False,
+        adaptiveWait: bool = False,
+        typedResults: bool = False,
     ) -> None:
         """generate SkillExecutionHandler object
 
@@ -59,11 +93,29 @@ class SkillExecutionHandler:
             assetSkillsCycleTime (float, optional): cycle time of asset skills in seconds. Defaults to 0.1.
             skillExecutionTimeout (float, optional): skill execution timeout value in seconds. Defaults to 0.0.
             skillResettingTimeout (float, optional): skill resetting timeout value in seconds. Defaults to 0.0.
+            recordPhaseMetrics (bool, optional): record phase durations and request counts in self.skillExecutionMetrics. Defaults to False.
+            phaseMetricsCallback (Callable[[SkillExecutionPhaseRecord], None] | None, optional): called with phase record after each execution. Defaults to None.
+            eagerReset (bool, optional): reset skill in background after return parameters are read, next execution finds skill Idle. Defaults to False.
+            adaptiveWait (bool, optional): learn execution durations per skill, sleep until shortly before expected completion, then poll eActiveState densely. Defaults to False.
+            typedResults (bool, optional): return parameters converted by parameter codec of skill (str, int, float, bool), not as strValue strings. Defaults to False.
         """
         self.skillcom = skillcom
         self.assetSkillsCycleTime = assetSkillsCycleTime
         self.skillResettingTimeout = skillResettingTimeout
         self.skillExecutionTimeout = skillExecutionTimeout
+        # per phase latency instrumentation, off if not recorded and no callback
+        self.recordPhaseMetrics = recordPhaseMetrics
+        self.phaseMetricsCallback = phaseMetricsCallback
+        self.skillExecutionMetrics = SkillExecutionMetrics()
+        # background resets after execution, errors are raised on next call of skill
+        self.eagerReset = eagerReset
+        self._eagerResets: dict[str, Future] = {}
+        self._eagerResetStop = threading.Event()
+        # learned durations from Start command to Completed per skill
+        self.adaptiveWait = adaptiveWait
+        self.skillDurations: dict[str, RollingHistogram] = {}
+        # return parameters converted by types of skill parameters, see AssetSkillsCommunication.get_SkillParameterCodec
+        self.typedResults = typedResults
 
     def executeSkill(
         self,
@@ -74,7 +126,7 @@ class SkillExecutionHandler:
         **kwargs,
     ) -> None | str | tuple[str, ...] | dict[str, str]:
         """execute single skill, specified by skillName.
-        0. read skill state and check for automatic external mode
+        0. read skill state and check for automatic external mode, wait for eager reset of previous execution
         1. reset skill
         2. set and write skill parameters from parameters or **kwargs
         3. write start command
@@ -86,47 +138,248 @@ class SkillExecutionHandler:
             parameters (list[ST_Parameter] | None, optional): list of typed skill parameters. Defaults to None.
             stSkillState (ST_SkillState | None, optional): skill state structure if already read. Defaults to None.
             return_as_dict (bool, optional): return "result" parameters as dict, not as str or tuple. Defaults to False.
-            **kwargs(any, optional): skill parameters as keyword arguments: <parameterName> = <parameterValue>
+            **kwargs(any, optional): skill parameters as keyword arguments: <parameterName> = <parameterValue>, converted and checked by parameter codec of skill
 
         Returns:
             None | str | tuple[str, ...] | dict[str, str]: return/result parameters if available
         """
+        returnParameters, stSkillState = self._executeSkill(
+            skillName, parameters, stSkillState, return_as_dict, kwargs
+        )
+        if self.eagerReset:
+            self._start_EagerReset(skillName, stSkillState)
+        return returnParameters
+
+    def executeMany(
+        self,
+        skillName: str,
+        parameterSets: Iterable[
+            dict[str, Any] | list[ST_Parameter] | EncodedParameters
+        ],
+        return_as_dict: bool = False,
+    ) -> Generator[None | str | tuple[str, ...] | dict[str, str], None, None]:
+        """execute skill once per parameter set, yield return parameters as each execution completes.
+        Pipelined: the completed skill state of one execution is reused for the next one (no extra state read).
+        With eagerReset, the reset for the next execution runs in background while the caller processes the yielded result.
+        Parameter sets are taken lazily from parameterSets, one ahead of the running execution.
+        Cancel early by break or close() of the generator, a pending background reset is cancelled, a running one awaited.
+        Errors of an execution are raised and end the generator.
+
+        Args:
+            skillName (str): name of skill to execute
+            parameterSets (Iterable[dict[str, Any] | list[ST_Parameter] | EncodedParameters]): skill parameters per execution, as keyword arguments dict, list of typed skill parameters or encoded by parameter codec of skill
+            return_as_dict (bool, optional): return "result" parameters as dict, not as str or tuple. Defaults to False.
+
+        Yields:
+            None | str | tuple[str, ...] | dict[str, str]: return/result parameters of each execution, in order of parameterSets
+        """
+        parameterSetIterator = iter(parameterSets)
+        parameterSet = next(parameterSetIterator, _NO_PARAMETER_SET)
+        stSkillState = None
+        completed = False
+        try:
+            while parameterSet is not _NO_PARAMETER_SET:
+                if isinstance(parameterSet, (dict, EncodedParameters)):
+                    parameters, kwargs = None, parameterSet
+                else:
+                    parameters, kwargs = parameterSet, {}
+                # completed state of previous execution, replaced by state after its reset
+                returnParameters, stSkillState = self._executeSkill(
+                    skillName, parameters, stSkillState, return_as_dict, kwargs
+                )
+                parameterSet = next(parameterSetIterator, _NO_PARAMETER_SET)
+                # reset for next execution while caller processes result
+                if self.eagerReset:
+                    self._start_EagerReset(skillName, stSkillState)
+                yield returnParameters
+            completed = True
+        finally:
+            if not completed:
+                self._cancel_EagerReset(skillName)
+
+    @requestPriorityContext(RequestPriority.Execution)
+    def _executeSkill(
+        self,
+        skillName: str,
+        parameters: list[ST_Parameter] | None,
+        stSkillState: ST_SkillState | None,
+        return_as_dict: bool,
+        kwargs: dict[str, Any] | EncodedParameters,
+    ) -> tuple[None | str | tuple[str, ...] | dict[str, str], ST_SkillState]:
+        """execute skill, steps 0 to 5 of executeSkill
+
+        Returns:
+            tuple[None | str | tuple[str, ...] | dict[str, str], ST_SkillState]: return/result parameters, Completed skill state
+        """
+        if self.recordPhaseMetrics or self.phaseMetricsCallback is not None:
+            # count only requests of this execution, not of other threads sharing the connection
+            requestCounter = ExecutionRequestCounter()
+            token = executionRequestCounter.set(requestCounter)
+            try:
+                phaseTimer = SkillExecutionPhaseTimer(
+                    skillName, requestCounter.get_Count
+                )
+                return self._executeSkillPhases(
+                    skillName,
+                    parameters,
+                    stSkillState,
+                    return_as_dict,
+                    kwargs,
+                    phaseTimer,
+                )
+            finally:
+                executionRequestCounter.reset(token)
+        return self._executeSkillPhases(
+            skillName, parameters, stSkillState, return_as_dict, kwargs, None
+        )
+
+    def _executeSkillPhases(
+        self,
+        skillName: str,
+        parameters: list[ST_Parameter] | None,
+        stSkillState: ST_SkillState | None,
+        return_as_dict: bool,
+        kwargs: dict[str, Any] | EncodedParameters,
+        phaseTimer: SkillExecutionPhaseTimer | None,
+    ) -> tuple[None | str | tuple[str, ...] | dict[str, str], ST_SkillState]:
+        # check parameters before any request
+        encodedParameters = self._encodeSkillParameters(skillName, parameters, kwargs)
+
+        # state after eager reset of previous execution is newer than given state
+        stSkillState = self._wait_for_EagerReset(skillName) or stSkillState
         if not stSkillState:
             stSkillState = self.skillcom.read_stSkillState(skillName)
 
         # 0: check Automatic_Extern mode
         self._checkAutoamticExternalMode(skillName, stSkillState)
+        if phaseTimer:
+            phaseTimer.mark()
 
-        # 1: reset skill
-        self.resetSkill(skillName, stSkillState)
+        # 1: reset skill, read states are snapshots: continue with latest state
+        stSkillState = self._resetSkill(skillName, stSkillState)
 
         # check Start command enabled
         if not stSkillState.stCommandEnabled.StartEnabled:
             raise SkillCommandNotEnabled_Error(
                 f"Start command is not enabled in skill {skillName}!"
             )
+        if phaseTimer:
+            phaseTimer.mark()
 
         # 2: set and write skill parameters
-        self._2writeSkillParameters(skillName, parameters, **kwargs)
+        self._2writeSkillParameters(skillName, parameters, encodedParameters)
+        if phaseTimer:
+            phaseTimer.mark()
 
         # 3: write start command
         self.skillcom.write_SingleSkillCommand(skillName, "Start")
+        startTime = time.perf_counter()
+        if phaseTimer:
+            phaseTimer.mark()
 
         # 4: wait for Completed or other held, Stopped, ABorted...
-        self._4waitForSkillExecution(skillName, stSkillState)
+        stSkillState = self._4waitForSkillExecution(skillName, stSkillState, startTime)
+        if phaseTimer:
+            phaseTimer.mark()
 
         # 5: get sill return / result parameters
-        return self._5getSkillReturnParameters(skillName, return_as_dict)
+        returnParameters = self._5getSkillReturnParameters(skillName, return_as_dict)
+        if phaseTimer:
+            phaseTimer.mark()
+            self._addPhaseRecord(phaseTimer.record)
+        return returnParameters, stSkillState
+
+    def _addPhaseRecord(self, record: SkillExecutionPhaseRecord) -> None:
+        if self.recordPhaseMetrics:
+            self.skillExecutionMetrics.add_Record(record)
+        if self.phaseMetricsCallback is not None:
+            self.phaseMetricsCallback(record)
 
     def resetSkill(
         self, skillName: str, stSkillState: ST_SkillState | None = None
-    ) -> None:
+    ) -> ST_SkillState:
         """resets skill, if skill is in completed, stopped or aborted state.
+        Waits for eager reset of previous execution and raises its error.
 
         Args:
             skillName (str): name of skill to reset
             stSkillState (ST_SkillState | None, optional): skill state if already read. Defaults to None.
+
+        Returns:
+            ST_SkillState: latest read skill state, Idle
+        """
+        stSkillState = self._wait_for_EagerReset(skillName) or stSkillState
+        return self._resetSkill(skillName, stSkillState)
+
+    def _get_EagerResetTimeout(self) -> float:
+        """timeout of background resets, never unlimited: skillResettingTimeout or EAGER_RESET_TIMEOUT_DEFAULT"""
+        return self.skillResettingTimeout or EAGER_RESET_TIMEOUT_DEFAULT
+
+    def _start_EagerReset(self, skillName: str, stSkillState: ST_SkillState) -> None:
+        """reset skill in background thread with finite timeout, see _wait_for_EagerReset"""
+        self._eagerResets[skillName] = _eagerResetExecutor.submit(
+            self._resetSkill,
+            skillName,
+            stSkillState,
+            self._get_EagerResetTimeout(),
+            self._eagerResetStop,
+        )
+
+    def _cancel_EagerReset(self, skillName: str) -> None:
+        """cancel eager reset of skill, if not yet running, else wait until it finished, at most its timeout.
+        Errors of a finished eager reset are raised by the next call of the skill, see _wait_for_EagerReset.
+
+        Args:
+            skillName (str): name of skill
+        """
+        eagerReset = self._eagerResets.get(skillName)
+        if eagerReset is None:
+            return
+        if eagerReset.cancel():
+            self._eagerResets.pop(skillName, None)
+        else:
+            wait((eagerReset,), timeout=self._get_EagerResetTimeout())
+
+    def cancel_EagerResets(self) -> None:
+        """cancel all eager resets, e.g. before disconnect: pending resets are cancelled,
+        running resets are stopped while waiting for Idle state. Errors of eager resets are discarded.
         """
+        eagerResets = list(self._eagerResets.values())
+        self._eagerResets.clear()
+        self._eagerResetStop.set()
+        try:
+            for eagerReset in eagerResets:
+                eagerReset.cancel()
+            # running resets end with their next poll
+            wait(eagerResets, timeout=self._get_EagerResetTimeout())
+        finally:
+            self._eagerResetStop.clear()
+
+    def _wait_for_EagerReset(self, skillName: str) -> ST_SkillState | None:
+        """wait for eager reset of skill, if started
+
+        Args:
+            skillName (str): name of skill
+
+        Raises:
+            SkillExecution_Error: error of eager reset, e.g. SkillStateCommandTimeout_Error
+
+        Returns:
+            ST_SkillState | None: Idle skill state after eager reset, None if no eager reset started
+        """
+        eagerReset = self._eagerResets.pop(skillName, None)
+        if eagerReset is None:
+            return None
+        return eagerReset.result()
+
+    @requestPriorityContext(RequestPriority.Execution)
+    def _resetSkill(
+        self,
+        skillName: str,
+        stSkillState: ST_SkillState | None = None,
+        timeout: float | None = None,
+        stopEvent: threading.Event | None = None,
+    ) -> ST_SkillState:
         # get actual SkillState
         if not stSkillState:
             stSkillState = self.skillcom.read_stSkillState(skillName)
@@ -136,7 +389,7 @@ class SkillExecutionHandler:
 
         # check already resetted, idle state
         if stSkillState.eActiveState == ESkillStates.Idle.value:
-            return
+            return stSkillState
 
         # check Completed, Stopped or Aborted state
         if not (
@@ -156,8 +409,12 @@ class SkillExecutionHandler:
         # write reset command
         self.skillcom.write_SingleSkillCommand(skillName, "Reset")
         # wait for idle
-        self._wait_for_skillStates(
-            skillName, [ESkillStates.Idle], stSkillState, self.skillResettingTimeout
+        return self._wait_for_skillStates(
+            skillName,
+            [ESkillStates.Idle],
+            stSkillState,
+            self.skillResettingTimeout if timeout is None else timeout,
+            stopEvent=stopEvent,
         )
 
     def _checkAutoamticExternalMode(
@@ -179,24 +436,156 @@ class SkillExecutionHandler:
         skillStates: list[ESkillStates],
         stSkillState: ST_SkillState | None = None,
         timeout: float = 0.0,
-    ) -> None:
+        pollTimes: list[float] | None = None,
+        stopEvent: threading.Event | None = None,
+    ) -> ST_SkillState:
+        """poll skill state until it is in one of skillStates.
+        Polls only eActiveState (read_stSkillState_eActiveState), complete skill state is read once at the end.
+
+        Args:
+            skillName (str): name of skill
+            skillStates (list[ESkillStates]): awaited states
+            stSkillState (ST_SkillState | None, optional): skill state if already read. Defaults to None.
+            timeout (float, optional): timeout in seconds, 0: no timeout. Defaults to 0.0.
+            pollTimes (list[float] | None, optional): filled with time.perf_counter() of last poll not in skillStates and of detecting poll. Defaults to None.
+            stopEvent (threading.Event | None, optional): stops waiting, if set. Defaults to None.
+
+        Raises:
+            SkillStateCommandTimeout_Error: skill not in skillStates after timeout
+            SkillExecution_Error: waiting stopped by stopEvent
+
+        Returns:
+            ST_SkillState: latest read skill state, in one of skillStates
+        """
         if not stSkillState:
             stSkillState: ST_SkillState = self.skillcom.read_stSkillState(skillName)
         skillStatesValues = [skillState.value for skillState in skillStates]
         resetStartTime = time.perf_counter()
-        checkState = stSkillState.eActiveState in skillStatesValues
-        while not checkState:
-            time.sleep(self.assetSkillsCycleTime)
-            stSkillState: ST_SkillState = self.skillcom.read_stSkillState(skillName)
-            checkState = stSkillState.eActiveState in skillStatesValues
-            if timeout > 0 and time.perf_counter() - resetStartTime > timeout:
+        pollTime = lastPollTime = resetStartTime
+        eActiveState = stSkillState.eActiveState
+        while eActiveState not in skillStatesValues:
+            if stopEvent is None:
+                time.sleep(self.assetSkillsCycleTime)
+            elif stopEvent.wait(self.assetSkillsCycleTime):
+                raise SkillExecution_Error(
+                    f"Waiting for {skillStates} state in skill {skillName} stopped"
+                )
+            lastPollTime, pollTime = pollTime, time.perf_counter()
+            eActiveState = self.skillcom.read_stSkillState_eActiveState(skillName)
+            if eActiveState in skillStatesValues:
+                # complete state for checks of caller, e.g. enabled commands
+                stSkillState = self.skillcom.read_stSkillState(skillName)
+                eActiveState = stSkillState.eActiveState
+            if (
+                eActiveState not in skillStatesValues
+                and timeout > 0
+                and time.perf_counter() - resetStartTime > timeout
+            ):
+                raise SkillStateCommandTimeout_Error(
+                    f"Timout while waiting for {skillStates} state in skill {skillName}, after {timeout} seconds skill is in {eActiveState} state"
+                )
+        if pollTimes is not None:
+            pollTimes[:] = [lastPollTime, pollTime]
+        return stSkillState
+
+    def _wait_for_skillStates_adaptive(
+        self,
+        skillName: str,
+        skillStates: list[ESkillStates],
+        startTime: float,
+        durations: RollingHistogram,
+        timeout: float = 0.0,
+        pollTimes: list[float] | None = None,
+    ) -> ST_SkillState:
+        """sleep until shortly before expected end of execution by learned durations,
+        then poll eActiveState of skill densely until it is in one of skillStates.
+        After the expected end (p95), poll with assetSkillsCycleTime.
+
+        Args:
+            skillName (str): name of skill
+            skillStates (list[ESkillStates]): awaited states
+            startTime (float): time.perf_counter() after Start command
+            durations (RollingHistogram): learned durations from Start command to Completed
+            timeout (float, optional): timeout in seconds since startTime, 0: no timeout. Defaults to 0.0.
+            pollTimes (list[float] | None, optional): filled with time.perf_counter() of last poll not in skillStates (startTime before first poll) and of detecting poll. Defaults to None.
+
+        Raises:
+            SkillStateCommandTimeout_Error: skill not in skillStates after timeout
+
+        Returns:
+            ST_SkillState: skill state, in one of skillStates
+        """
+        earlyDuration = ADAPTIVE_WAIT_EARLY_FACTOR * durations.percentile(5)
+        longDuration = durations.percentile(95)
+        densePollTime = min(
+            max(
+                (longDuration - earlyDuration) / ADAPTIVE_WAIT_DENSE_POLLS,
+                ADAPTIVE_WAIT_POLL_MIN,
+            ),
+            self.assetSkillsCycleTime,
+        )
+        time.sleep(max(startTime + earlyDuration - time.perf_counter(), 0.0))
+        skillStatesValues = [skillState.value for skillState in skillStates]
+        pollTime = startTime
+        while True:
+            lastPollTime, pollTime = pollTime, time.perf_counter()
+            eActiveState = self.skillcom.read_stSkillState_eActiveState(skillName)
+            if eActiveState in skillStatesValues:
+                # complete state for checks of caller, e.g. enabled commands
+                stSkillState = self.skillcom.read_stSkillState(skillName)
+                if stSkillState.eActiveState in skillStatesValues:
+                    if pollTimes is not None:
+                        pollTimes[:] = [lastPollTime, pollTime]
+                    return stSkillState
+                eActiveState = stSkillState.eActiveState
+            duration = time.perf_counter() - startTime
+            if timeout > 0 and duration > timeout:
                 raise SkillStateCommandTimeout_Error(
-                    f"Timout while waiting for {skillStates} state in skill {skillName}, after {timeout} seconds skill is in {stSkillState.eActiveState} state"
+                    f"Timout while waiting for {skillStates} state in skill {skillName}, after {timeout} seconds skill is in {eActiveState} state"
                 )
+            time.sleep(
+                densePollTime if duration < longDuration else self.assetSkillsCycleTime
+            )
+
+    def _encodeSkillParameters(
+        self,
+        skillName: str,
+        parameters: list[ST_Parameter] | None,
+        kwargs: dict[str, Any] | EncodedParameters,
+    ) -> list[tuple[int, str]]:
+        """check parameters and convert kwargs parameter values by parameter codec (schema) of skill, without requests.
+        kwargs already encoded by the codec (EncodedParameters) are returned unchanged.
+
+        Raises:
+            WrongSkillParameter: invalid explicit types, unknown parameter names, too many parameters or values not convertible to type of parameter
+
+        Returns:
+            list[tuple[int, str]]: (index in astParameters, strValue) per kwargs parameter
+        """
+        if not parameters and not kwargs:
+            return []
+        if isinstance(kwargs, EncodedParameters):
+            return kwargs
+        try:
+            # compiled on first use, raises ValueError for invalid explicit types
+            codec = self.skillcom.get_SkillParameterCodec(skillName)
+            if parameters:
+                codec.check_Parameters(parameters)
+            return codec.encode_Parameters(kwargs)
+        except ValueError as e:
+            raise WrongSkillParameter(
+                f"Cant set parameters to skill {skillName}: {e}"
+            ) from e
 
     def _2writeSkillParameters(
-        self, skillName: str, parameters: list[ST_Parameter] | None = None, **kwargs
+        self,
+        skillName: str,
+        parameters: list[ST_Parameter] | None = None,
+        encodedParameters: list[tuple[int, str]] | None = None,
     ):
+        # read parameter buffer on first use of skill (lazySkillDataCommand)
+        if self.skillcom.load_stSkillDataCommand(skillName) is None:
+            raise WrongSkillParameter(f"Cant read parameters of skill {skillName}")
         if parameters:
             if not self.skillcom.set_stSkillData_astParameters(
                 skillName, parameters=parameters
@@ -204,30 +593,70 @@ class SkillExecutionHandler:
                 raise WrongSkillParameter(
                     f"Cant set parameters to skill {skillName}: {parameters=}"
                 )
-        # iterate kwargs parameters
-        for key, value in kwargs.items():
-            param = self.skillcom.skillDataHandles[skillName].get_Parameter_byName(
-                parameterName=key, fromSkillDataDefault=False
+        # set and write parameter buffer of skill without other threads in between
+        with self.skillcom.get_SkillLock(skillName):
+            # set encoded kwargs parameters at position of parameter index
+            if encodedParameters:
+                astParameters = self.skillcom.skillDataHandles[
+                    skillName
+                ].stSkillDataCommand.astParameters
+                for index, strValue in encodedParameters:
+                    if index < len(astParameters):
+                        astParameters[index].strValue = strValue
+            if not self.skillcom.write_stSkillData_astParameters(skillName):
+                raise WrongSkillParameter(
+                    f"Cant write parameters to skill {skillName}: {parameters=}"
+                )
+
+    def _4waitForSkillExecution(
+        self,
+        skillName: str,
+        stSkillState: ST_SkillState,
+        startTime: float | None = None,
+    ) -> ST_SkillState:
+        skillStates = [
+            ESkillStates.Completed,
+            ESkillStates.Aborted,
+            ESkillStates.Stopped,
+            ESkillStates.Held,
+        ]
+        durations = self.skillDurations.get(skillName)
+        pollTimes: list[float] = []
+        if (
+            self.adaptiveWait
+            and startTime is not None
+            and durations is not None
+            and len(durations) >= ADAPTIVE_WAIT_SAMPLES_MIN
+        ):
+            stSkillState = self._wait_for_skillStates_adaptive(
+                skillName,
+                skillStates,
+                startTime,
+                durations,
+                self.skillExecutionTimeout,
+                pollTimes,
             )
-            if param is not None:
-                param.strValue = str(value)
-        if not self.skillcom.write_stSkillData_astParameters(skillName):
-            raise WrongSkillParameter(
-                f"Cant write parameters to skill {skillName}: {parameters=}"
+        else:
+            stSkillState = self._wait_for_skillStates(
+                skillName,
+                skillStates,
+                stSkillState,
+                self.skillExecutionTimeout,
+                pollTimes,
             )
-
-    def _4waitForSkillExecution(self, skillName: str, stSkillState: ST_SkillState):
-        self._wait_for_skillStates(
-            skillName,
-            [
-                ESkillStates.Completed,
-                ESkillStates.Aborted,
-                ESkillStates.Stopped,
-                ESkillStates.Held,
-            ],
-            stSkillState,
-            self.skillExecutionTimeout,
-        )
+        # learn duration of completed executions
+        if (
+            self.adaptiveWait
+            and startTime is not None
+            and stSkillState.eActiveState == ESkillStates.Completed.value
+        ):
+            if durations is None:
+                durations = self.skillDurations.setdefault(
+                    skillName, RollingHistogram(ADAPTIVE_WAIT_WINDOW)
+                )
+            # Completed between last poll and detecting poll: middle of poll interval, not detection delay
+            lastPollTime, pollTime = pollTimes or (startTime, time.perf_counter())
+            durations.add(max((lastPollTime + pollTime) / 2 - startTime, 0.0))
         # check held, stopped, aborted, completed
         match stSkillState.eActiveState:
             case ESkillStates.Aborted.value:
@@ -249,37 +678,37 @@ class SkillExecutionHandler:
                 )
             case ESkillStates.Completed.value:
                 # execution finished
-                return
+                return stSkillState
 
     def _5getSkillReturnParameters(
         self,
         skillName: str,
         return_as_dict: bool = False,
-    ) -> None | str | tuple[str, ...] | dict[str, str]:
-        # first look for SKILL_RETURN_PARAMETERS_PATTERN in default parameters
-        return_parameter_exists = False
-        for param in self.skillcom.skillDataHandles[
-            skillName
-        ].stSkillDataDefault.astParameters:
-            for pattern in SKILL_RETURN_PARAMETERS_PATTERN:
-                if pattern in param.strName.lower():
-                    return_parameter_exists = True
-                    break
-            if return_parameter_exists:
-                break
+    ) -> None | Any | tuple[Any, ...] | dict[str, Any]:
+        # return parameter indexes are precomputed in parameter index of skill
+        returnIndexes = self.skillcom.get_SkillParameterIndex(skillName).returnIndexes
         # no parameters found -> return None
-        if not return_parameter_exists:
+        if not returnIndexes:
             return None
         # parameters found
         return_parameters = {}
-        # read parameters
-        stSkillData = self.skillcom.read_stSkillData(
-            skillName=skillName, useSkillDataDefault=False
+        # read only return parameters of stSkillDataCommand
+        returnParameters = self.skillcom.read_stSkillData_astParameters_byIndexes(
+            skillName, returnIndexes, useSkillDataDefault=False
         )
-        for param in stSkillData.astParameters:
-            for pattern in SKILL_RETURN_PARAMETERS_PATTERN:
-                if pattern in param.strName.lower():
-                    return_parameters[param.strName] = param.strValue
+        if self.typedResults:
+            # convert by types of parameter codec of skill
+            try:
+                return_parameters = self.skillcom.get_SkillParameterCodec(
+                    skillName
+                ).decode_Parameters(returnParameters)
+            except ValueError as e:
+                raise WrongSkillParameter(
+                    f"Cant convert return parameters of skill {skillName}: {e}"
+                ) from e
+        else:
+            for param in returnParameters:
+                return_parameters[param.strName] = param.strValue
         # return None, str, tuple, dict based on return parameter count and return_as_dict
         return_parameter_count = len(return_parameters)
         if return_parameter_count == 0:
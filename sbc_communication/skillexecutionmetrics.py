@@ -0,0 +1,254 @@
+import collections
+import contextvars
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+# phases of SkillExecutionHandler.executeSkill
+SKILL_EXECUTION_PHASES = (
+    "0_checkMode",
+    "1_reset",
+    "2_writeParameters",
+    "3_start",
+    "4_waitForExecution",
+    "5_readReturnParameters",
+)
+
+SKILL_EXECUTION_METRICS_WINDOW_DEFAULT = 1000
+
+
+class RollingHistogram:
+    """rolling window of samples, evaluates percentiles on demand"""
+
+    def __init__(self, windowSize: int = SKILL_EXECUTION_METRICS_WINDOW_DEFAULT):
+        """generate RollingHistogram object
+
+        Args:
+            windowSize (int, optional): count of latest samples kept. Defaults to SKILL_EXECUTION_METRICS_WINDOW_DEFAULT.
+        """
+        self.samples: collections.deque[float] = collections.deque(maxlen=windowSize)
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def add(self, value: float) -> None:
+        """add sample, drops oldest sample if window is full
+
+        Args:
+            value (float): sample value
+        """
+        self.samples.append(value)
+
+    def percentile(self, percent: float) -> float | None:
+        """get percentile of samples in window (nearest rank)
+
+        Args:
+            percent (float): percentile in range 0..100
+
+        Returns:
+            float | None: percentile value or None, if no samples
+        """
+        if not self.samples:
+            return None
+        return self._percentile(sorted(self.samples), percent)
+
+    def summary(self) -> dict[str, float | int | None]:
+        """get count, mean, max, p50, p95 and p99 of samples in window
+
+        Returns:
+            dict[str, float | int | None]: summary of samples
+        """
+        samples = sorted(self.samples)
+        if not samples:
+            return {
+                "count": 0,
+                "mean": None,
+                "max": None,
+                "p50": None,
+                "p95": None,
+                "p99": None,
+            }
+        return {
+            "count": len(samples),
+            "mean": sum(samples) / len(samples),
+            "max": samples[-1],
+            "p50": self._percentile(samples, 50),
+            "p95": self._percentile(samples, 95),
+            "p99": self._percentile(samples, 99),
+        }
+
+    @staticmethod
+    def _percentile(sortedSamples: list[float], percent: float) -> float:
+        rank = max(math.ceil(percent / 100 * len(sortedSamples)), 1)
+        return sortedSamples[min(rank, len(sortedSamples)) - 1]
+
+
+@dataclass
+class SkillExecutionPhaseRecord:
+    """dataclass storing durations and request counts of the phases of one skill execution"""
+
+    skillName: str = ""
+    startTime: float = 0.0  # time.time() at execution start
+    phaseDurations: list[float] = field(default_factory=list)  # seconds per phase
+    phaseRequestCounts: list[int] = field(default_factory=list)  # requests per phase
+
+    @property
+    def totalDuration(self) -> float:
+        return sum(self.phaseDurations)
+
+    def asdict(self) -> dict:
+        return {
+            "skillName": self.skillName,
+            "startTime": self.startTime,
+            "totalDuration": self.totalDuration,
+            "phases": {
+                phase: {"duration": duration, "requests": requests}
+                for phase, duration, requests in zip(
+                    SKILL_EXECUTION_PHASES,
+                    self.phaseDurations,
+                    self.phaseRequestCounts,
+                )
+            },
+        }
+
+
+class ExecutionRequestCounter:
+    """count of requests sent for one skill execution, see executionRequestCounter"""
+
+    __slots__ = ("count",)
+
+    def __init__(self):
+        self.count = 0
+
+    def get_Count(self) -> int:
+        return self.count
+
+
+# request counter of the actual skill execution, set in caller thread.
+# copied into the asyncio task of the opc ua client, so requests of other threads and of the client itself are not counted
+executionRequestCounter: contextvars.ContextVar[ExecutionRequestCounter | None] = (
+    contextvars.ContextVar("executionRequestCounter", default=None)
+)
+
+
+def count_ExecutionRequest() -> None:
+    """count request in counter of actual skill execution, if any. Called by communication implementation per request."""
+    counter = executionRequestCounter.get()
+    if counter is not None:
+        counter.count += 1
+
+
+class SkillExecutionPhaseTimer:
+    """records timestamps and request counts at the end of each execution phase"""
+
+    __slots__ = ("record", "_getRequestCount", "_lastTime", "_lastRequestCount")
+
+    def __init__(self, skillName: str, getRequestCount: Callable[[], int]):
+        """start timer of one skill execution
+
+        Args:
+            skillName (str): name of executed skill
+            getRequestCount (Callable[[], int]): returns count of requests sent for execution so far, e.g. ExecutionRequestCounter.get_Count
+        """
+        self.record = SkillExecutionPhaseRecord(skillName, time.time())
+        self._getRequestCount = getRequestCount
+        self._lastTime = time.perf_counter()
+        self._lastRequestCount = getRequestCount()
+
+    def mark(self) -> None:
+        """end actual phase and start next phase"""
+        now = time.perf_counter()
+        requestCount = self._getRequestCount()
+        self.record.phaseDurations.append(now - self._lastTime)
+        self.record.phaseRequestCounts.append(requestCount - self._lastRequestCount)
+        self._lastTime = now
+        self._lastRequestCount = requestCount
+
+
+class _SkillPhaseHistograms:
+    """rolling histograms of phase durations and request counts of one skill"""
+
+    def __init__(self, windowSize: int):
+        self.total = RollingHistogram(windowSize)
+        self.durations = [RollingHistogram(windowSize) for _ in SKILL_EXECUTION_PHASES]
+        self.requests = [RollingHistogram(windowSize) for _ in SKILL_EXECUTION_PHASES]
+
+
+class SkillExecutionMetrics:
+    """per skill rolling histograms of execution phase durations and request counts"""
+
+    def __init__(self, windowSize: int = SKILL_EXECUTION_METRICS_WINDOW_DEFAULT):
+        """generate SkillExecutionMetrics object
+
+        Args:
+            windowSize (int, optional): count of latest executions kept per skill. Defaults to SKILL_EXECUTION_METRICS_WINDOW_DEFAULT.
+        """
+        self.windowSize = windowSize
+        self._skillHistograms: dict[str, _SkillPhaseHistograms] = {}
+
+    def add_Record(self, record: SkillExecutionPhaseRecord) -> None:
+        """add phase record of one skill execution
+
+        Args:
+            record (SkillExecutionPhaseRecord): phase record of execution
+        """
+        histograms = self._skillHistograms.get(record.skillName)
+        if histograms is None:
+            histograms = _SkillPhaseHistograms(self.windowSize)
+            self._skillHistograms[record.skillName] = histograms
+        histograms.total.add(record.totalDuration)
+        for i, (duration, requests) in enumerate(
+            zip(record.phaseDurations, record.phaseRequestCounts)
+        ):
+            histograms.durations[i].add(duration)
+            histograms.requests[i].add(requests)
+
+    def get_SkillNames(self) -> list[str]:
+        """get names of skills with recorded executions
+
+        Returns:
+            list[str]: skill names
+        """
+        return list(self._skillHistograms.keys())
+
+    def get_Summary(self, skillName: str | None = None) -> dict:
+        """get p50/p95/p99 summary of phase durations (seconds) and request counts
+
+        Args:
+            skillName (str | None, optional): summary of single skill, else all skills. Defaults to None.
+
+        Returns:
+            dict: {skillName: {"total": {...}, "phases": {phase: {"duration": {...}, "requests": {...}}}}}
+        """
+        if skillName is None:
+            skillNames = self.get_SkillNames()
+        elif skillName in self._skillHistograms:
+            skillNames = [skillName]
+        else:
+            skillNames = []
+        summary = {}
+        for name in skillNames:
+            histograms = self._skillHistograms[name]
+            summary[name] = {
+                "total": histograms.total.summary(),
+                "phases": {
+                    phase: {
+                        "duration": histograms.durations[i].summary(),
+                        "requests": histograms.requests[i].summary(),
+                    }
+                    for i, phase in enumerate(SKILL_EXECUTION_PHASES)
+                },
+            }
+        return summary
+
+    def reset(self, skillName: str | None = None) -> None:
+        """drop recorded executions
+
+        Args:
+            skillName (str | None, optional): drop single skill, else all skills. Defaults to None.
+        """
+        if skillName is None:
+            self._skillHistograms.clear()
+        else:
+            self._skillHistograms.pop(skillName, None)
@@ -0,0 +1,380 @@
+import math
+import operator
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable
+from sbc_statemachine.skilldatatypes import ST_Parameter, ST_SkillData
+from .skillparameterindex import SkillParameterIndex
+
+# python types of skill parameter values, strValue on the wire
+SKILL_PARAMETER_TYPES = (str, int, float, bool)
+SKILL_PARAMETER_TRUE_VALUES = frozenset({"true", "1"})
+SKILL_PARAMETER_FALSE_VALUES = frozenset({"false", "0"})
+
+# finite decimal numbers, no nan, inf or underscores as accepted by float() and int()
+_NUMBER_PATTERN = re.compile(r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$")
+_INTEGER_PATTERN = re.compile(r"^[+-]?\d+$")
+
+
+def infer_ParameterType(strValue: str) -> type:
+    """infer type of skill parameter from its default value in stSkillDataDefault.
+    Numbers are inferred as float, their wire format is kept, so integer plc parameters work as well.
+    Inferred types are conversion hints only, values are checked by explicit types (see SkillParameterCodec).
+
+    Args:
+        strValue (str): default value of parameter
+
+    Returns:
+        type: bool for "true" / "false", float for numbers, else str
+    """
+    strValue = strValue.strip()
+    if strValue.lower() in ("true", "false"):
+        return bool
+    if _NUMBER_PATTERN.match(strValue):
+        return float
+    return str
+
+
+def _encode_str(value: Any) -> str:
+    return str(value)
+
+
+def _encode_int(value: Any) -> str:
+    if isinstance(value, str):
+        return str(_decode_int(value))
+    if isinstance(value, float):
+        if not value.is_integer():
+            raise ValueError(f"{value!r} is not integral")
+        return str(int(value))
+    # int, numpy integers, no bool
+    if isinstance(value, bool):
+        raise ValueError(f"{value!r} is bool, not int")
+    return str(operator.index(value))
+
+
+def _encode_float(value: Any) -> str:
+    if isinstance(value, bool):
+        raise ValueError(f"{value!r} is bool, not float")
+    if isinstance(value, str):
+        # keep format of value, e.g. "1" for integer plc parameters
+        _decode_float(value)
+        return value.strip()
+    if not math.isfinite(value):
+        raise ValueError(f"{value!r} is not finite")
+    return str(value)
+
+
+def _create_BoolEncoder(strTrue: str, strFalse: str) -> Callable[[Any], str]:
+    """get bool encoder writing strTrue / strFalse, e.g. in case of the default value"""
+
+    def encode(value: Any) -> str:
+        if isinstance(value, str):
+            lowerValue = value.strip().lower()
+            if lowerValue in SKILL_PARAMETER_TRUE_VALUES:
+                return strTrue
+            if lowerValue in SKILL_PARAMETER_FALSE_VALUES:
+                return strFalse
+        elif value in (True, False):
+            # bool, 0, 1, numpy bool
+            return strTrue if value else strFalse
+        raise ValueError(f"{value!r} is not bool")
+
+    return encode
+
+
+def _decode_bool(strValue: str) -> bool:
+    lowerValue = strValue.strip().lower()
+    if lowerValue in SKILL_PARAMETER_TRUE_VALUES:
+        return True
+    if lowerValue in SKILL_PARAMETER_FALSE_VALUES:
+        return False
+    raise ValueError(f"{strValue!r} is not bool")
+
+
+def _decode_float(strValue: str) -> float:
+    if not _NUMBER_PATTERN.match(strValue.strip()):
+        raise ValueError(f"{strValue!r} is not a finite decimal number")
+    return float(strValue)
+
+
+def _decode_int(strValue: str) -> int:
+    if _INTEGER_PATTERN.match(strValue.strip()):
+        return int(strValue)
+    value = _decode_float(strValue)
+    if not value.is_integer():
+        raise ValueError(f"{strValue!r} is not integral")
+    return int(value)
+
+
+def _create_HintEncoder(encoder: Callable[[Any], str]) -> Callable[[Any], str]:
+    """get encoder of inferred type: strings are passed unchanged, other values converted by encoder or str()"""
+
+    def encode(value: Any) -> str:
+        if isinstance(value, str):
+            return value
+        try:
+            return encoder(value)
+        except (TypeError, ValueError):
+            return str(value)
+
+    return encode
+
+
+def _create_HintDecoder(decoder: Callable[[str], Any]) -> Callable[[str], Any]:
+    """get decoder of inferred type: strings not convertible by decoder are returned unchanged"""
+
+    def decode(strValue: str) -> Any:
+        try:
+            return decoder(strValue)
+        except ValueError:
+            return strValue
+
+    return decode
+
+
+class EncodedParameters(list):
+    """parameter set encoded by SkillParameterCodec: (index in astParameters, strValue) per parameter.
+    Passed to SkillExecutionHandler.executeMany without encoding again, e.g. rows of sweepSkill.
+    """
+
+
+_DECODERS: dict[type, Callable[[str], Any]] = {
+    str: str,
+    int: _decode_int,
+    float: _decode_float,
+    bool: _decode_bool,
+}
+
+
+@dataclass
+class SkillParameterCodec:
+    """dataclass converting python values (also numpy scalars) of one skill to strValue strings and back.
+    Compiled once per skill from stSkillDataDefault (see infer_ParameterType) and explicit parameter types,
+    so executions only call the prepared encoders and decoders.
+    Only explicit types are enforced, inferred types are conversion hints: strings are passed unchanged,
+    other values are converted by the inferred type, else by str() like untyped parameters.
+    Also the parameter schema of the skill: names, count and value formats of explicit types are checked without requests.
+    """
+
+    parameterIndex: SkillParameterIndex = field(default_factory=SkillParameterIndex)
+    parameterCount: int = 0  # length of astParameters of stSkillDataDefault
+    types: dict[str, type] = field(default_factory=dict)
+    encoders: dict[str, Callable[[Any], str]] = field(default_factory=dict)
+    decoders: dict[str, Callable[[str], Any]] = field(default_factory=dict)
+    explicitTypeNames: set[str] = field(default_factory=set)  # enforced types
+
+    @staticmethod
+    def fromSkillData(
+        stSkillData: ST_SkillData,
+        parameterIndex: SkillParameterIndex,
+        parameterTypes: dict[str, type] | None = None,
+    ) -> "SkillParameterCodec":
+        """compile codec from skill data structure, e.g. stSkillDataDefault
+
+        Args:
+            stSkillData (ST_SkillData): skill data structure with default values
+            parameterIndex (SkillParameterIndex): parameter index of skill data structure
+            parameterTypes (dict[str, type] | None, optional): explicit types by parameter name, overrule inferred types. Defaults to None.
+
+        Raises:
+            ValueError: type not in SKILL_PARAMETER_TYPES
+
+        Returns:
+            SkillParameterCodec: codec of skill
+        """
+        parameterTypes = parameterTypes or {}
+        codec = SkillParameterCodec(
+            parameterIndex=parameterIndex,
+            parameterCount=len(stSkillData.astParameters),
+        )
+        for name, index in parameterIndex.indexByName.items():
+            strValue = stSkillData.astParameters[index].strValue
+            parameterType = parameterTypes.get(name) or infer_ParameterType(strValue)
+            if parameterType not in SKILL_PARAMETER_TYPES:
+                raise ValueError(
+                    f"type of parameter {name} must be one of {SKILL_PARAMETER_TYPES}, not {parameterType}"
+                )
+            codec.types[name] = parameterType
+            if parameterType is bool:
+                # write bools in notation of default value, e.g. TRUE
+                if strValue.strip().isupper():
+                    encoder = _create_BoolEncoder("TRUE", "FALSE")
+                elif strValue.strip().islower():
+                    encoder = _create_BoolEncoder("true", "false")
+                else:
+                    encoder = _create_BoolEncoder("True", "False")
+            else:
+                encoder = {str: _encode_str, int: _encode_int, float: _encode_float}[
+                    parameterType
+                ]
+            decoder = _DECODERS[parameterType]
+            if name in parameterTypes:
+                codec.explicitTypeNames.add(name)
+            elif parameterType is not str:
+                encoder = _create_HintEncoder(encoder)
+                decoder = _create_HintDecoder(decoder)
+            codec.encoders[name] = encoder
+            codec.decoders[name] = decoder
+        return codec
+
+    def encode_Parameters(self, values: dict[str, Any]) -> list[tuple[int, str]]:
+        """convert parameter values to strValue strings, all values are checked before any is returned.
+        Empty strings are passed for all types (unset value). Values of inferred types are not rejected.
+
+        Args:
+            values (dict[str, Any]): values by parameter name
+
+        Raises:
+            ValueError: unknown parameter names or values not convertible to explicit type of parameter, all errors in message
+
+        Returns:
+            list[tuple[int, str]]: (index in astParameters, strValue) per parameter
+        """
+        encoded: list[tuple[int, str]] = []
+        errors: list[str] = []
+        indexByName = self.parameterIndex.indexByName
+        for name, value in values.items():
+            index = indexByName.get(name)
+            if index is None:
+                errors.append(f"unknown parameter {name}")
+                continue
+            if isinstance(value, str) and value == "":
+                encoded.append((index, value))
+                continue
+            try:
+                encoded.append((index, self.encoders[name](value)))
+            except (TypeError, ValueError) as e:
+                errors.append(f"{name}={value!r} ({self.types[name].__name__}): {e}")
+        if errors:
+            raise ValueError("invalid parameters: " + ", ".join(errors))
+        return encoded
+
+    def encode_Column(self, name: str, column: Any) -> list[str]:
+        """convert column of values of one parameter to strValue strings, all values are checked before any is returned.
+        Numpy arrays of numbers and bools are checked and formatted once per array (vectorized),
+        other columns (e.g. python lists, numpy arrays of strings) value by value like encode_Parameters.
+
+        Args:
+            name (str): name of parameter
+            column (Any): values of parameter, sequence or numpy array
+
+        Raises:
+            ValueError: unknown parameter name or values not convertible to explicit type of parameter, all errors in message
+
+        Returns:
+            list[str]: strValue per value of column
+        """
+        if name not in self.encoders:
+            raise ValueError(f"invalid parameters: unknown parameter {name}")
+        dtype = getattr(column, "dtype", None)
+        if dtype is not None and dtype.kind in "biuf":
+            return self._encode_NumberColumn(name, column)
+        encoder = self.encoders[name]
+        strValues: list[str] = []
+        errors: list[str] = []
+        for value in column:
+            if isinstance(value, str) and value == "":
+                strValues.append(value)
+                continue
+            try:
+                strValues.append(encoder(value))
+            except (TypeError, ValueError) as e:
+                errors.append(f"{name}={value!r} ({self.types[name].__name__}): {e}")
+        if errors:
+            raise ValueError("invalid parameters: " + ", ".join(errors))
+        return strValues
+
+    def _encode_NumberColumn(self, name: str, column: Any) -> list[str]:
+        """encode numpy array of numbers or bools vectorized, same strValues as encoders of parameter per value"""
+        import numpy  # column is numpy array, numpy is installed
+
+        parameterType = self.types[name]
+        kind = column.dtype.kind
+        if parameterType is str:
+            return column.astype(str).tolist()
+        if parameterType is bool:
+            # bool, 0 and 1 in notation of default value
+            if kind == "b" or ((column == 0) | (column == 1)).all():
+                encoder = self.encoders[name]
+                return numpy.where(column, encoder(True), encoder(False)).tolist()
+            error = "values are not bool"
+        elif kind == "b":
+            error = f"values are bool, not {parameterType.__name__}"
+        elif kind == "f" and not numpy.isfinite(column).all():
+            error = "values are not finite"
+        elif parameterType is int and kind == "f":
+            if (column == numpy.trunc(column)).all():
+                return column.astype(numpy.int64).astype(str).tolist()
+            error = "values are not integral"
+        else:
+            return column.astype(str).tolist()
+        if name in self.explicitTypeNames:
+            raise ValueError(
+                f"invalid parameters: {name} ({parameterType.__name__}): {error}"
+            )
+        # inferred type is a hint only: converted by str() like untyped parameters
+        return column.astype(str).tolist()
+
+    def check_Parameters(self, parameters: list[ST_Parameter]) -> None:
+        """check list of typed skill parameters, e.g. for set_stSkillData_astParameters:
+        count, unknown and duplicate names and format of strValue by explicit type of parameter
+
+        Args:
+            parameters (list[ST_Parameter]): skill parameters
+
+        Raises:
+            ValueError: invalid parameters, all errors in message
+        """
+        errors: list[str] = []
+        if len(parameters) > self.parameterCount:
+            errors.append(
+                f"{len(parameters)} parameters, skill has {self.parameterCount}"
+            )
+        names: set[str] = set()
+        for parameter in parameters:
+            name, strValue = parameter.strName, parameter.strValue
+            if name not in self.decoders:
+                errors.append(f"unknown parameter {name}")
+                continue
+            if name in names:
+                errors.append(f"duplicate parameter {name}")
+            names.add(name)
+            if strValue == "":
+                continue
+            try:
+                self.decoders[name](strValue)
+            except ValueError as e:
+                errors.append(f"{name}={strValue!r} ({self.types[name].__name__}): {e}")
+        if errors:
+            raise ValueError("invalid parameters: " + ", ".join(errors))
+
+    def decode_Parameters(self, parameters: list[ST_Parameter]) -> dict[str, Any]:
+        """convert strValue strings of parameters to python values by type of parameter.
+        Empty strings are decoded as None for types other than str.
+        Strings not convertible to inferred type are returned unchanged.
+
+        Args:
+            parameters (list[ST_Parameter]): read parameters, e.g. return parameters
+
+        Raises:
+            ValueError: strValue not convertible to explicit type of parameter
+
+        Returns:
+            dict[str, Any]: values by parameter name
+        """
+        values: dict[str, Any] = {}
+        for parameter in parameters:
+            name, strValue = parameter.strName, parameter.strValue
+            decoder = self.decoders.get(name, str)
+            if decoder is str:
+                values[name] = strValue
+            elif strValue == "":
+                values[name] = None
+            else:
+                try:
+                    values[name] = decoder(strValue)
+                except ValueError as e:
+                    raise ValueError(
+                        f"invalid value of parameter {name}={strValue!r} ({self.types[name].__name__}): {e}"
+                    ) from e
+        return values
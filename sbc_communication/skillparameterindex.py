@@ -0,0 +1,65 @@
+from dataclasses import dataclass, field
+from sbc_statemachine.skilldatatypes import ST_SkillData
+
+SKILL_RETURN_PARAMETERS_PATTERN = ["return", "result"]
+
+
+def isReturnParameterName(parameterName: str) -> bool:
+    """check parameter name for SKILL_RETURN_PARAMETERS_PATTERN
+
+    Args:
+        parameterName (str): strName of skill parameter
+
+    Returns:
+        bool: True, if parameter is a return / result parameter
+    """
+    parameterName = parameterName.lower()
+    for pattern in SKILL_RETURN_PARAMETERS_PATTERN:
+        if pattern in parameterName:
+            return True
+    else:
+        return False
+
+
+@dataclass
+class SkillParameterIndex:
+    """dataclass mapping parameter names of one skill to their position in astParameters.
+    Built once when skill data is read, so parameter access needs no scan of astParameters.
+    """
+
+    indexByName: dict[str, int] = field(default_factory=dict)
+    returnIndexes: tuple[int, ...] = ()  # indexes of return / result parameters
+
+    @staticmethod
+    def fromSkillData(stSkillData: ST_SkillData) -> "SkillParameterIndex":
+        """build parameter index from skill data structure, e.g. stSkillDataDefault
+
+        Args:
+            stSkillData (ST_SkillData): skill data structure
+
+        Returns:
+            SkillParameterIndex: parameter index of skill
+        """
+        indexByName: dict[str, int] = {}
+        returnIndexes: list[int] = []
+        for index, parameter in enumerate(stSkillData.astParameters):
+            # first parameter wins on duplicate names
+            if parameter.strName in indexByName:
+                continue
+            indexByName[parameter.strName] = index
+            if isReturnParameterName(parameter.strName):
+                returnIndexes.append(index)
+        return SkillParameterIndex(
+            indexByName=indexByName, returnIndexes=tuple(returnIndexes)
+        )
+
+    def get_Index(self, parameterName: str) -> int | None:
+        """get index of parameter in astParameters by name
+
+        Args:
+            parameterName (str): strName of skill parameter
+
+        Returns:
+            int | None: index in astParameters or None, if parameter not exists
+        """
+        return self.indexByName.get(parameterName)
@@ -0,0 +1,150 @@
+from typing import Any, Iterator, Mapping
+from .skillexecutionhandler import SkillExecutionHandler, WrongSkillParameter
+from .skillparametercodec import EncodedParameters, SkillParameterCodec
+
+
+def _import_Numpy():
+    """import optional numpy on first sweep, not with sbc_communication (cold start)
+
+    Returns:
+        module | None: numpy, None if not installed: columns are python sequences and results are lists
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def get_SweepColumns(columns: Any) -> dict[str, Any]:
+    """get parameter columns by name, numpy structured arrays are split into field columns
+
+    Args:
+        columns (Any): numpy structured array or dict of columns (sequences or numpy arrays), keyed by parameter name
+
+    Raises:
+        TypeError: columns neither structured array nor dict
+        ValueError: columns of different length
+
+    Returns:
+        dict[str, Any]: column per parameter name, numpy arrays are kept
+    """
+    dtypeNames = getattr(getattr(columns, "dtype", None), "names", None)
+    if dtypeNames is not None:
+        # structured array: one column per field
+        columns = {name: columns[name] for name in dtypeNames}
+    elif not isinstance(columns, Mapping):
+        raise TypeError(
+            f"columns must be numpy structured array or dict of columns, not {type(columns).__name__}"
+        )
+    lengths = {name: len(column) for name, column in columns.items()}
+    if len(set(lengths.values())) > 1:
+        raise ValueError(f"columns must have same length, lengths are {lengths}")
+    return dict(columns)
+
+
+def encode_SweepColumns(
+    codec: SkillParameterCodec, columns: dict[str, Any]
+) -> dict[str, list[str]]:
+    """convert parameter columns to strValue strings by parameter codec of skill, see SkillParameterCodec.encode_Column.
+    Numpy columns of numbers and bools are checked and formatted once per column (vectorized), python lists per value.
+
+    Args:
+        codec (SkillParameterCodec): parameter codec of skill
+        columns (dict[str, Any]): column per parameter name, see get_SweepColumns
+
+    Raises:
+        ValueError: unknown parameter names or values not convertible to explicit type of parameter
+
+    Returns:
+        dict[str, list[str]]: strValue strings per parameter name
+    """
+    return {name: codec.encode_Column(name, column) for name, column in columns.items()}
+
+
+def _iterate_Rows(
+    codec: SkillParameterCodec, strColumns: dict[str, list[str]]
+) -> Iterator[EncodedParameters]:
+    indexes = [codec.parameterIndex.indexByName[name] for name in strColumns]
+    for row in zip(*strColumns.values()):
+        yield EncodedParameters(zip(indexes, row))
+
+
+def _convert_ResultColumn(column: list[Any], resultType: Any, numpy) -> Any:
+    """convert result column to result type, missing results (None, e.g. empty strValue with typedResults) stay missing
+
+    Args:
+        column (list[Any]): results of one result parameter, strValue strings or values decoded by typedResults
+        resultType (Any): type of result parameter, numpy dtype if numpy is installed
+        numpy (module | None): numpy, None if not installed
+
+    Returns:
+        Any: numpy array, masked array if results are missing, list with None if numpy is not installed
+    """
+    if numpy is None:
+        return [None if value is None else resultType(value) for value in column]
+    dtype = numpy.dtype(resultType)
+    values = numpy.asarray(column, dtype=object)
+    missing = numpy.equal(values, None)
+    if not missing.any():
+        return values.astype(dtype)
+    # fill value of dtype for conversion, masked in result
+    values[missing] = dtype.type()
+    return numpy.ma.masked_array(values.astype(dtype), mask=missing)
+
+
+def sweepSkill(
+    skillExecHandler: SkillExecutionHandler,
+    skillName: str,
+    columns: Any,
+    resultTypes: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """execute skill once per row of parameter columns by executeMany, return results as columns.
+    All values are converted to strValue strings and checked by the parameter codec of the skill before the first execution,
+    numpy columns of numbers and bools vectorized per column. Rows are passed encoded to executeMany.
+
+    Args:
+        skillExecHandler (SkillExecutionHandler): execution handler of asset
+        skillName (str): name of skill to execute
+        columns (Any): numpy structured array or dict of columns (sequences or numpy arrays), keyed by parameter name
+        resultTypes (dict[str, Any] | None, optional): type per result parameter name, e.g. {"Result": float}, numpy dtypes if numpy is installed. Defaults to None: str.
+
+    Raises:
+        WrongSkillParameter: unknown parameter names or values not convertible to explicit type of parameter
+
+    Returns:
+        dict[str, Any]: column per result parameter name, numpy arrays if numpy is installed (masked arrays, if results are missing), else lists
+    """
+    columns = get_SweepColumns(columns)
+    try:
+        codec = skillExecHandler.skillcom.get_SkillParameterCodec(skillName)
+        strColumns = encode_SweepColumns(codec, columns)
+    except ValueError as e:
+        raise WrongSkillParameter(
+            f"Cant set parameters to skill {skillName}: {e}"
+        ) from e
+    resultColumns: dict[str, list[Any]] = {}
+    for index, ret in enumerate(
+        skillExecHandler.executeMany(
+            skillName, _iterate_Rows(codec, strColumns), return_as_dict=True
+        )
+    ):
+        if index == 0:
+            resultColumns = {name: [] for name in ret or {}}
+        for name, column in resultColumns.items():
+            column.append(ret[name])
+    resultTypes = resultTypes or {}
+    numpy = _import_Numpy()
+    if numpy is None:
+        return {
+            name: (
+                _convert_ResultColumn(column, resultTypes[name], None)
+                if name in resultTypes
+                else column
+            )
+            for name, column in resultColumns.items()
+        }
+    return {
+        name: _convert_ResultColumn(column, resultTypes.get(name, str), numpy)
+        for name, column in resultColumns.items()
+    }
@@ -39,6 +39,15 @@ class Test_assetskillscommunication_opcua(unittest.TestCase):
 
         self.assertGreater(self.comm.searchfor_Skills(), 0)
         self.assertGreater(len(self.comm.skillDataHandles), 0)
+        # stSkillDataDefault of bulk read in search is cached
+        self.assertTrue(self.comm.is_SkillDataDefaultCached(self.testSkillName))
+        # compact per skill record, only NodeId strings are stored
+        skillConnectionNodes = self.comm.skillConnectionNodes[self.testSkillName]
+        self.assertFalse(hasattr(skillConnectionNodes, "__dict__"))
+        self.assertEqual(
+            skillConnectionNodes.skillStateNode.nodeid.to_string(),
+            skillConnectionNodes.skillStateNodeId,
+        )
         self.assertTrue(self.comm.read_SkillDatas())
         firstSkill = list(self.comm.skillDataHandles.keys())[0]
         self.assertGreater(
@@ -59,6 +68,10 @@ class Test_assetskillscommunication_opcua(unittest.TestCase):
                 str,
             )
         )
+        self.assertEqual(
+            self.comm.read_stSkillState_eActiveState(self.testSkillName),
+            self.comm.read_stSkillState(self.testSkillName).eActiveState,
+        )
         self.assertTrue(self.comm.write_SingleSkillCommand(self.testSkillName, "Reset"))
         time.sleep(1.0)
         self.assertTrue(self.comm.reset_SkillDataCommand(self.testSkillName))
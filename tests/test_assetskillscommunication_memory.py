@@ -0,0 +1,412 @@
+import threading
+import time
+import unittest
+from functools import partial
+from sbc_statemachine.skillstatemachinetypes import ESkillStates
+from sbc_communication.assetskillscommunication_factory import (
+    createAssetSkillCommunication,
+    createAssetSkillCommunication_byConfigDict,
+    ServerTypes,
+)
+from sbc_communication.assetskillshandle import AssetSkillsHandle
+from sbc_communication.memory.assetskillscommunication_memory import (
+    AssetSkillsCommunication_Memory,
+    MemoryConnectionInfo,
+)
+from sbc_communication import skillexecutionhandler
+from sbc_communication.simulatedskills import SimulatedSkill
+from sbc_communication.skillexecutionhandler import (
+    SkillExecutionHandler,
+    SkillStateCommandTimeout_Error,
+    WrongSkillMode_Error,
+    WrongSkillState_Error,
+)
+
+
+def _raise(inputs: dict[str, str]) -> dict[str, str]:
+    raise ValueError("simulated skill error")
+
+
+class Test_AssetSkillsCommunication_Memory(unittest.TestCase):
+    def _create_AssetHandle(self, **connectionInfoKwargs) -> AssetSkillsHandle:
+        assetHandle = AssetSkillsHandle(
+            assetName="Test",
+            assetSkillCommunication=createAssetSkillCommunication(
+                ServerTypes.Memory, MemoryConnectionInfo(**connectionInfoKwargs)
+            ),
+            skillExecutionHandlerClass=partial(
+                SkillExecutionHandler, assetSkillsCycleTime=0.001
+            ),
+        )
+        assetHandle.read_availableSkills()
+        return assetHandle
+
+    def test_executeSkill(self):
+        assetHandle = self._create_AssetHandle(generatedSkillCount=2)
+        self.assertIsInstance(assetHandle.skillCom, AssetSkillsCommunication_Memory)
+        self.assertEqual(len(assetHandle.skillCom.skillDataHandles), 5)
+        ret = assetHandle.executeSkill("AddSkill", Operant1="1.25", Operant2="2.5")
+        self.assertEqual(float(ret), 3.75)
+        ret = assetHandle.executeSkill("MultiReturnSkill", return_as_dict=True)
+        self.assertEqual(ret, {"Result1": "1", "Result2": "2", "Result3": "3"})
+        self.assertIsNone(assetHandle.executeSkill("NoParamSkill"))
+        ret = assetHandle.executeSkill("SimSkill0001", Parameter0="a", Parameter1="b")
+        self.assertEqual(ret, "a")
+        # second execution resets skill from Completed state
+        ret = assetHandle.executeSkill("SimSkill0001", Parameter0="c")
+        self.assertEqual(ret, "c")
+
+    def test_timing(self):
+        assetHandle = self._create_AssetHandle(executionTime=0.05, transitionTime=0.01)
+        skillCom = assetHandle.skillCom
+        skillCom.write_SingleSkillCommand("NoParamSkill", "Start")
+        self.assertNotEqual(
+            skillCom.read_stSkillState("NoParamSkill").eActiveState,
+            ESkillStates.Completed.value,
+        )
+        startTime = time.perf_counter()
+        assetHandle.skillExecHandler._4waitForSkillExecution(
+            "NoParamSkill", skillCom.read_stSkillState("NoParamSkill")
+        )
+        self.assertGreater(time.perf_counter() - startTime, 0.03)
+        self.assertEqual(
+            skillCom.read_stSkillState_member("NoParamSkill", "eActiveState"),
+            ESkillStates.Completed.value,
+        )
+
+    def test_abort_stop(self):
+        assetHandle = self._create_AssetHandle(
+            skills=[SimulatedSkill(name="FailingSkill", function=_raise)],
+            executionTime=10.0,
+        )
+        with self.assertRaises(WrongSkillState_Error):
+            assetHandle.executeSkill("FailingSkill")
+        assetHandle.resetSkill("FailingSkill")
+        skillCom = assetHandle.skillCom
+        skillCom.write_SingleSkillCommand("NoParamSkill", "Start")
+        skillCom.write_SingleSkillCommand("NoParamSkill", "Stop")
+        self.assertEqual(
+            skillCom.read_stSkillState("NoParamSkill").eActiveState,
+            ESkillStates.Stopped.value,
+        )
+        self.assertFalse(skillCom.write_SingleSkillCommand("NoParamSkill", "Unknown"))
+
+    def test_snapshots(self):
+        assetHandle = self._create_AssetHandle()
+        skillCom = assetHandle.skillCom
+        idleState = skillCom.read_stSkillState("NoParamSkill")
+        skillCom.write_SingleSkillCommand("NoParamSkill", "Start")
+        startedState = skillCom.read_stSkillState("NoParamSkill")
+        # reads return new objects, earlier snapshots stay unchanged
+        self.assertIsNot(idleState, startedState)
+        self.assertEqual(idleState.eActiveState, ESkillStates.Idle.value)
+        self.assertNotEqual(startedState.eActiveState, ESkillStates.Idle.value)
+        self.assertIs(
+            skillCom.skillDataHandles["NoParamSkill"].stSkillState, startedState
+        )
+        skillCom.read_stSkillState_member("NoParamSkill", "eActiveState")
+        self.assertIsNot(
+            skillCom.skillDataHandles["NoParamSkill"].stSkillState, startedState
+        )
+
+    def test_eActiveStateProbe(self):
+        assetHandle = self._create_AssetHandle(executionTime=0.05)
+        skillCom = assetHandle.skillCom
+        startedState = skillCom.read_stSkillState("NoParamSkill")
+        skillCom.write_SingleSkillCommand("NoParamSkill", "Start")
+        self.assertEqual(
+            skillCom.read_stSkillState_eActiveState("NoParamSkill"),
+            ESkillStates.Execute.value,
+        )
+        # probe doesnt replace snapshot in skill data handle
+        self.assertIs(
+            skillCom.skillDataHandles["NoParamSkill"].stSkillState, startedState
+        )
+        # wait polls probe, then reads complete state once
+        requestCount = skillCom.requestCount
+        stSkillState = assetHandle.skillExecHandler._4waitForSkillExecution(
+            "NoParamSkill", startedState
+        )
+        self.assertEqual(stSkillState.eActiveState, ESkillStates.Completed.value)
+        self.assertIs(
+            skillCom.skillDataHandles["NoParamSkill"].stSkillState, stSkillState
+        )
+        self.assertGreater(skillCom.requestCount - requestCount, 2)
+
+    def test_skillDataDefaultCache(self):
+        assetHandle = self._create_AssetHandle()
+        skillCom = assetHandle.skillCom
+        self.assertTrue(skillCom.is_SkillDataDefaultCached("AddSkill"))
+        version = skillCom.skillDataDefaultVersions["AddSkill"]
+        codec = skillCom.get_SkillParameterCodec("AddSkill")
+        # resets use cached stSkillDataDefault without requests
+        requestCount = skillCom.requestCount
+        for i in range(3):
+            self.assertTrue(skillCom.reset_SkillDataCommand("AddSkill"))
+        self.assertEqual(skillCom.requestCount, requestCount)
+        # unchanged defaults keep version and codec
+        skillCom.invalidate_SkillDataDefaults()
+        self.assertFalse(skillCom.is_SkillDataDefaultCached("AddSkill"))
+        skillCom.reset_SkillDataCommand("AddSkill")
+        self.assertEqual(skillCom.requestCount, requestCount + 1)
+        self.assertEqual(skillCom.skillDataDefaultVersions["AddSkill"], version)
+        self.assertIs(skillCom.get_SkillParameterCodec("AddSkill"), codec)
+        # written defaults are cached with new version
+        skillCom.get_stSkillData("AddSkill", useSkillDataDefault=True).astParameters[
+            0
+        ].strValue = "1.5"
+        skillCom.write_stSkillData("AddSkill", useSkillDataDefault=True)
+        self.assertTrue(skillCom.is_SkillDataDefaultCached("AddSkill"))
+        skillCom.invalidate_SkillDataDefaults("AddSkill")
+        stSkillDataDefault = skillCom.read_stSkillDataDefault_cached("AddSkill")
+        self.assertEqual(stSkillDataDefault.astParameters[0].strValue, "1.5")
+        self.assertEqual(skillCom.skillDataDefaultVersions["AddSkill"], version + 1)
+        self.assertIsNot(skillCom.get_SkillParameterCodec("AddSkill"), codec)
+        # maximal age
+        skillCom.skillDataDefaultMaxAge = 0.01
+        time.sleep(0.02)
+        self.assertFalse(skillCom.is_SkillDataDefaultCached("AddSkill"))
+        skillCom.skillDataDefaultMaxAge = None
+        # defaults changed on asset: not validated by executions, by read_availableSkills
+        skillCom.read_stSkillDataDefault_cached("AddSkill")
+        skillCom.memorySkills["AddSkill"].stSkillDataDefault.astParameters[
+            0
+        ].strValue = "2.5"
+        skillCom.reset_SkillDataCommand("AddSkill")
+        self.assertEqual(
+            skillCom.get_stSkillData("AddSkill").astParameters[0].strValue, "1.5"
+        )
+        assetHandle.read_availableSkills()
+        skillCom.reset_SkillDataCommand("AddSkill")
+        self.assertEqual(
+            skillCom.get_stSkillData("AddSkill").astParameters[0].strValue, "2.5"
+        )
+
+    def test_lazySkillDataCommand(self):
+        skillCom = createAssetSkillCommunication(
+            ServerTypes.Memory, MemoryConnectionInfo(generatedSkillCount=10)
+        )
+        skillCom.lazySkillDataCommand = True
+        assetHandle = AssetSkillsHandle(
+            assetName="Test",
+            assetSkillCommunication=skillCom,
+            skillExecutionHandlerClass=partial(
+                SkillExecutionHandler, assetSkillsCycleTime=0.001
+            ),
+        )
+        assetHandle.read_availableSkills()
+        # search and defaults only
+        self.assertEqual(skillCom.requestCount, 1 + len(skillCom.skillDataHandles))
+        self.assertEqual(skillCom.skillDataCommandsLoaded, set())
+        # loaded on first use or access
+        ret = assetHandle.executeSkill("AddSkill", Operant1="1.25", Operant2="2.5")
+        self.assertEqual(float(ret), 3.75)
+        self.assertEqual(skillCom.skillDataCommandsLoaded, {"AddSkill"})
+        stSkillDataCommand = skillCom.get_stSkillData("SimSkill0001")
+        self.assertEqual(stSkillDataCommand.astParameters[0].strName, "Parameter0")
+        self.assertTrue(skillCom.is_SkillDataCommandLoaded("SimSkill0001"))
+        requestCount = skillCom.requestCount
+        skillCom.get_stSkillData("SimSkill0001")
+        self.assertEqual(skillCom.requestCount, requestCount)
+        # only loaded skills are read again
+        skillCom.read_SkillDatas()
+        self.assertEqual(skillCom.requestCount, requestCount + 2)
+        self.assertTrue(skillCom.reset_SkillDataCommand("NoParamSkill"))
+        self.assertTrue(skillCom.is_SkillDataCommandLoaded("NoParamSkill"))
+
+    def test_eagerReset(self):
+        assetHandle = self._create_AssetHandle(transitionTime=0.05)
+        skillCom = assetHandle.skillCom
+        handler = SkillExecutionHandler(
+            skillCom, assetSkillsCycleTime=0.001, eagerReset=True
+        )
+        ret = handler.executeSkill("AddSkill", Operant1="1", Operant2="2")
+        self.assertEqual(float(ret), 3.0)
+        # reset runs in background after results are read
+        self.assertIn("AddSkill", handler._eagerResets)
+        time.sleep(0.2)
+        self.assertEqual(
+            skillCom.read_stSkillState("AddSkill").eActiveState,
+            ESkillStates.Idle.value,
+        )
+        # next execution starts without reset
+        startTime = time.perf_counter()
+        ret = handler.executeSkill("AddSkill", Operant1="2", Operant2="2")
+        self.assertEqual(float(ret), 4.0)
+        self.assertLess(time.perf_counter() - startTime, 0.2)
+        self.assertEqual(
+            handler.resetSkill("AddSkill").eActiveState, ESkillStates.Idle.value
+        )
+
+    def test_eagerReset_error(self):
+        assetHandle = self._create_AssetHandle(transitionTime=0.05)
+        handler = SkillExecutionHandler(
+            assetHandle.skillCom,
+            assetSkillsCycleTime=0.001,
+            skillResettingTimeout=0.01,
+            eagerReset=True,
+        )
+        handler.executeSkill("NoParamSkill")
+        # reset timeout surfaces on next call of skill
+        with self.assertRaises(SkillStateCommandTimeout_Error):
+            handler.executeSkill("NoParamSkill")
+        handler.skillResettingTimeout = 0.0
+        time.sleep(0.2)
+        self.assertIsNone(handler.executeSkill("NoParamSkill"))
+
+    def test_eagerReset_stuck(self):
+        assetHandle = self._create_AssetHandle(transitionTime=0.01)
+        skillCom = assetHandle.skillCom
+        handler = assetHandle.skillExecHandler
+        assetHandle.executeSkill("NoParamSkill")
+        assetHandle.executeSkill("AddSkill", Operant1="1", Operant2="1")
+        # skills stuck in Resetting, skillResettingTimeout 0.0
+        skillCom.connectionInfo.transitionTime = 60.0
+        # background reset never waits unlimited
+        eagerResetTimeout = skillexecutionhandler.EAGER_RESET_TIMEOUT_DEFAULT
+        skillexecutionhandler.EAGER_RESET_TIMEOUT_DEFAULT = 0.2
+        try:
+            handler._start_EagerReset(
+                "NoParamSkill", skillCom.read_stSkillState("NoParamSkill")
+            )
+            with self.assertRaises(SkillStateCommandTimeout_Error):
+                handler._wait_for_EagerReset("NoParamSkill")
+        finally:
+            skillexecutionhandler.EAGER_RESET_TIMEOUT_DEFAULT = eagerResetTimeout
+        # running background reset is stopped by disconnect
+        handler._start_EagerReset("AddSkill", skillCom.read_stSkillState("AddSkill"))
+        eagerReset = handler._eagerResets["AddSkill"]
+        time.sleep(0.05)
+        startTime = time.perf_counter()
+        assetHandle.disconnect()
+        self.assertLess(time.perf_counter() - startTime, 0.5)
+        self.assertTrue(eagerReset.done())
+        self.assertEqual(handler._eagerResets, {})
+
+    def test_adaptiveWait(self):
+        assetHandle = self._create_AssetHandle(executionTime=0.2)
+        skillCom = assetHandle.skillCom
+        handler = SkillExecutionHandler(
+            skillCom, assetSkillsCycleTime=0.01, adaptiveWait=True
+        )
+        requestCounts = []
+        for i in range(6):
+            requestCount = skillCom.requestCount
+            handler.executeSkill("NoParamSkill")
+            requestCounts.append(skillCom.requestCount - requestCount)
+        durations = handler.skillDurations["NoParamSkill"]
+        self.assertEqual(len(durations), 6)
+        # within half a poll interval of execution time
+        self.assertGreaterEqual(durations.percentile(5), 0.2 - 0.01)
+        self.assertLess(durations.percentile(95), 0.2 + 0.01)
+        # learned after 3 executions: sleep, then few polls of eActiveState
+        self.assertLess(max(requestCounts[3:]), min(requestCounts[:3]))
+        # without detection delay of polling: completed between polls at 0.2 and 0.3 seconds
+        assetHandle = self._create_AssetHandle(executionTime=0.25)
+        handler = SkillExecutionHandler(
+            assetHandle.skillCom, assetSkillsCycleTime=0.1, adaptiveWait=True
+        )
+        handler.executeSkill("NoParamSkill")
+        self.assertAlmostEqual(
+            handler.skillDurations["NoParamSkill"].percentile(50), 0.25, delta=0.02
+        )
+
+    def test_executeMany(self):
+        assetHandle = self._create_AssetHandle(transitionTime=0.05)
+        parameterSets = [{"Operant1": i, "Operant2": 1} for i in range(5)]
+        startTime = time.perf_counter()
+        for parameterSet in parameterSets:
+            assetHandle.executeSkill("AddSkill", **parameterSet)
+            time.sleep(0.05)  # processing of result
+        loopTime = time.perf_counter() - startTime
+        # without eagerReset: completed state reused, no background reset
+        results = []
+        for ret in assetHandle.executeMany("AddSkill", parameterSets):
+            results.append(float(ret))
+            self.assertNotIn("AddSkill", assetHandle.skillExecHandler._eagerResets)
+        self.assertEqual(results, [1, 2, 3, 4, 5])
+        assetHandle.skillExecHandler.eagerReset = True
+        startTime = time.perf_counter()
+        results = []
+        for ret in assetHandle.executeMany("AddSkill", parameterSets):
+            results.append(float(ret))
+            time.sleep(0.05)  # processing of result, skill resets meanwhile
+        self.assertLess(time.perf_counter() - startTime, loopTime - 0.1)
+        self.assertEqual(results, [1, 2, 3, 4, 5])
+        # early cancellation, parameter sets are taken one ahead
+        taken = []
+
+        def generate():
+            for i in range(10):
+                taken.append(i)
+                yield {"Operant1": i, "Operant2": 2}
+
+        executions = assetHandle.executeMany("AddSkill", generate())
+        for ret in executions:
+            if float(ret) == 3.0:
+                break
+        executions.close()
+        self.assertEqual(taken, [0, 1, 2])
+        # background reset is cancelled or finished on close of generator
+        eagerReset = assetHandle.skillExecHandler._eagerResets.get("AddSkill")
+        self.assertTrue(eagerReset is None or eagerReset.done())
+        ret = assetHandle.executeSkill("AddSkill", Operant1="1", Operant2="1")
+        self.assertEqual(float(ret), 2.0)
+        # errors end the generator
+        assetHandle.skillCom.write_SingleSkillCommand("NoParamSkill", "Offline")
+        with self.assertRaises(WrongSkillMode_Error):
+            list(assetHandle.executeMany("NoParamSkill", [{}]))
+
+    def test_threads(self):
+        assetHandle = self._create_AssetHandle(generatedSkillCount=8)
+        errors = []
+        running = threading.Event()
+        running.set()
+
+        def poll():
+            # e.g. hmi poller, sharing skill communication with executing threads
+            while running.is_set():
+                for skillName in list(assetHandle.skillCom.get_SkillNames()):
+                    assetHandle.skillCom.read_stSkillState(skillName)
+                    assetHandle.skillCom.read_stSkillData(skillName, False)
+
+        def execute(skillName: str):
+            try:
+                for i in range(20):
+                    ret = assetHandle.executeSkill(skillName, Parameter0=str(i))
+                    if ret != str(i):
+                        errors.append((skillName, i, ret))
+            except Exception as e:
+                errors.append((skillName, e))
+
+        threads = [
+            threading.Thread(target=execute, args=(f"SimSkill{i:04d}",))
+            for i in range(8)
+        ]
+        poller = threading.Thread(target=poll)
+        poller.start()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        running.clear()
+        poller.join()
+        self.assertEqual(errors, [])
+
+    def test_createAssetSkillCommunication_byConfigDict(self):
+        skillCom = createAssetSkillCommunication_byConfigDict(
+            {
+                "serverType": ServerTypes.Memory,
+                "testSkills": False,
+                "generatedSkillCount": 3,
+                "executionTime": 0.5,
+            }
+        )
+        self.assertIsInstance(skillCom, AssetSkillsCommunication_Memory)
+        self.assertEqual(skillCom.connectionInfo.executionTime, 0.5)
+        self.assertTrue(skillCom.connect())
+        self.assertEqual(skillCom.searchfor_Skills(), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+from sbc_communication.assetskillscommunication_factory import (
+    ServerTypes,
+    ServerTypesToClass,
+)
+from sbc_communication.opcua.assetskillscommunication_opcua_beckhoff import (
+    AssetSkillsCommunication_OPCUA_Beckhoff,
+)
+
+# run in fresh interpreter, prints loaded modules of interest after imports
+LAZY_IMPORT_SCRIPT = """
+import json, sys
+{imports}
+print(json.dumps({{
+    "asyncua": "asyncua" in sys.modules,
+    "beckhoff": "sbc_communication.opcua.assetskillscommunication_opcua_beckhoff" in sys.modules,
+}}))
+"""
+
+
+def _run_Imports(imports: str) -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(path for path in sys.path if path)
+    completed = subprocess.run(
+        [sys.executable, "-c", LAZY_IMPORT_SCRIPT.format(imports=imports)],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return json.loads(completed.stdout.splitlines()[-1])
+
+
+class Test_LazyImports(unittest.TestCase):
+    def test_import_withoutAsyncua(self):
+        loaded = _run_Imports(
+            "import sbc_communication\n"
+            "import sbc_communication.assetConnectionInfo\n"
+            "import sbc_communication.assetskillshandle\n"
+            "from sbc_communication.assetskillscommunication_factory import ServerTypes, ServerTypesToClass\n"
+            "assert ServerTypes.OPC_UA_Beckhoff in ServerTypesToClass\n"
+        )
+        self.assertEqual(loaded, {"asyncua": False, "beckhoff": False})
+
+    def test_memoryBackend_withoutAsyncua(self):
+        loaded = _run_Imports(
+            "from sbc_communication.assetskillscommunication_factory import createAssetSkillCommunication_byConfigDict\n"
+            "comm = createAssetSkillCommunication_byConfigDict({'serverType': 4})\n"
+            "comm.connect()\n"
+            "assert comm.searchfor_Skills() == 3\n"
+        )
+        self.assertFalse(loaded["asyncua"])
+
+    def test_submodule_onAttributeAccess(self):
+        loaded = _run_Imports(
+            "import sbc_communication\n"
+            "sbc_communication.opcua.assetskillscommunication_opcua_beckhoff\n"
+        )
+        self.assertEqual(loaded, {"asyncua": True, "beckhoff": True})
+        import sbc_communication
+
+        with self.assertRaises(AttributeError):
+            sbc_communication.noSubmodule
+
+    def test_serverTypesToClass(self):
+        self.assertIs(
+            ServerTypesToClass[ServerTypes.OPC_UA_Beckhoff],
+            AssetSkillsCommunication_OPCUA_Beckhoff,
+        )
+        self.assertEqual(list(ServerTypesToClass), list(ServerTypes))
+        self.assertEqual(len(dict(ServerTypesToClass.items())), len(ServerTypes))
+        with self.assertRaises(KeyError):
+            ServerTypesToClass[99]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+from dataclasses import dataclass, field
+from sbc_communication.mapVar import mapList, mapObject, mapVar
+
+
+@dataclass
+class _Limits:
+    fMin: float = 0.0
+    fMax: float = 0.0
+
+
+@dataclass
+class _Parameter:
+    strName: str = ""
+    strValue: str = ""
+    stLimits: _Limits = field(default_factory=_Limits)
+
+
+@dataclass
+class _SkillData:
+    strName: str = ""
+    iParameterCount: int = 0
+    astParameters: list[_Parameter] = field(default_factory=lambda: [_Parameter()])
+
+
+class _PlainParameter:
+    def __init__(self, strName: str = "", strValue: str = ""):
+        self.strName = strName
+        self.strValue = strValue
+        self.stLimits = _Limits()
+
+
+def _createSkillData(parameterCount: int) -> _SkillData:
+    return _SkillData(
+        strName="Skill",
+        iParameterCount=parameterCount,
+        astParameters=[
+            _Parameter(f"Parameter{i}", str(i), _Limits(-i, i))
+            for i in range(parameterCount)
+        ],
+    )
+
+
+class Test_mapVar(unittest.TestCase):
+    def test_mapObject_nested(self):
+        source = _Parameter("Operant1", "1.5", _Limits(0.0, 10.0))
+        target = _Parameter()
+        mapObject(source, target)
+        self.assertEqual(source, target)
+        source.stLimits.fMax = 20.0
+        self.assertEqual(target.stLimits.fMax, 10.0)
+
+    def test_mapObject_ignorekeys_plainObject(self):
+        source = _PlainParameter("Operant1", "1.5")
+        target = _Parameter("Old", "Old")
+        mapObject(source, target, ignorekeys=["strName"])
+        self.assertEqual(target.strName, "Old")
+        self.assertEqual(target.strValue, "1.5")
+
+    def test_mapList_maxListLength(self):
+        source = _createSkillData(5).astParameters
+        target = [_Parameter()]
+        mapList(source, target)
+        self.assertEqual(len(target), 1)
+        mapList(source, target, maxListLength=3)
+        self.assertEqual(target, source[:3])
+        target = _createSkillData(10).astParameters
+        mapList(_createSkillData(2).astParameters, target)
+        # longer target keeps its additional elements
+        self.assertEqual(len(target), 10)
+
+    def test_mapVar_scaling(self):
+        for parameterCount in (1, 10, 100, 500):
+            with self.subTest(parameterCount=parameterCount):
+                source = _createSkillData(parameterCount)
+                target = _SkillData(
+                    astParameters=[_Parameter() for i in range(parameterCount)]
+                )
+                mapVar(source, target, maxListLength=parameterCount)
+                self.assertEqual(source, target)
+                # target list grows from one element
+                target = _SkillData()
+                mapVar(source, target, maxListLength=parameterCount)
+                self.assertEqual(source, target)
@@ -0,0 +1,218 @@
+import asyncio
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from asyncua import ua
+from sbc_communication.assetskillscommunication_factory import (
+    createAssetSkillCommunication_byConfigDict,
+    ServerTypes,
+)
+from sbc_communication.opcua.opcuaservicemetrics import opcUaRequestSkillName
+from sbc_communication.opcua.opcuaratelimiter import (
+    OpcUaRateLimiter,
+    OpcUaRateLimit_Error,
+    TokenBucket,
+    rateLimitExemptContext,
+)
+from sbc_communication.requestpriority import RequestPriority, requestPriorityContext
+from sbc_communication.simulation.simulatedskillserver import (
+    SimulatedSkillServer,
+    SimulatedSkillServerConfig,
+)
+
+test_port = 4849
+
+
+def _create_ReadRequest(nodeCount: int) -> ua.ReadRequest:
+    request = ua.ReadRequest()
+    request.Parameters.NodesToRead = [ua.ReadValueId() for i in range(nodeCount)]
+    return request
+
+
+class Test_OpcUaRateLimiter(unittest.TestCase):
+    def test_tokenBucket(self):
+        bucket = TokenBucket(rate=10.0)
+        now = bucket.timestamp
+        self.assertEqual(bucket.get_Wait(10, now), 0.0)
+        bucket.reserve(10)
+        self.assertAlmostEqual(bucket.get_Wait(1, now), 0.1)
+        # refilled up to one second of rate
+        self.assertEqual(bucket.get_Wait(10, now + 5.0), 0.0)
+        self.assertEqual(bucket.tokens, 10.0)
+        # costs above capacity wait for full bucket only
+        self.assertEqual(bucket.get_Wait(100, now + 5.0), 0.0)
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0.0)
+
+    def test_boundedWait(self):
+        async def run(rateLimiter: OpcUaRateLimiter):
+            # burst of one second, then delayed by rate
+            for i in range(5):
+                await rateLimiter.acquire(_create_ReadRequest(1))
+            startTime = time.perf_counter()
+            await rateLimiter.acquire(_create_ReadRequest(1))
+            self.assertGreater(time.perf_counter() - startTime, 0.1)
+
+        rateLimiter = OpcUaRateLimiter(maxRequestsPerSecond=5.0, maxWait=0.5)
+        asyncio.run(run(rateLimiter))
+        snapshot = rateLimiter.snapshot()
+        self.assertEqual((snapshot["requests"], snapshot["delayed"]), (6, 1))
+        self.assertTrue(rateLimiter.is_Limited(_create_ReadRequest(1)))
+        self.assertFalse(rateLimiter.is_Limited(ua.PublishRequest()))
+        self.assertFalse(rateLimiter.is_Limited(ua.ActivateSessionRequest()))
+        self.assertFalse(OpcUaRateLimiter().is_Limited(_create_ReadRequest(1)))
+        with rateLimitExemptContext():
+            self.assertFalse(rateLimiter.is_Limited(_create_ReadRequest(1)))
+        self.assertTrue(rateLimiter.is_Limited(_create_ReadRequest(1)))
+
+    def test_rejectNodes(self):
+        async def run(rateLimiter: OpcUaRateLimiter):
+            await rateLimiter.acquire(_create_ReadRequest(50))
+            # wait above maxWait is rejected for skill requests, without taking tokens
+            token = opcUaRequestSkillName.set("AddSkill")
+            try:
+                with self.assertRaises(OpcUaRateLimit_Error):
+                    await rateLimiter.acquire(_create_ReadRequest(50))
+            finally:
+                opcUaRequestSkillName.reset(token)
+            await asyncio.wait_for(rateLimiter.acquire(ua.BrowseNextRequest()), 0.05)
+            # commands take tokens without waiting
+            with requestPriorityContext(RequestPriority.Command):
+                await asyncio.wait_for(
+                    rateLimiter.acquire(_create_ReadRequest(50)), 0.05
+                )
+
+        rateLimiter = OpcUaRateLimiter(maxNodesPerSecond=50.0, maxWait=0.5)
+        asyncio.run(run(rateLimiter))
+        self.assertEqual(rateLimiter.snapshot()["rejected"], 1)
+        self.assertIn(
+            "sbc_opcua_ratelimit_rejected_total 1", rateLimiter.to_prometheus()
+        )
+
+        async def runClient(rateLimiter: OpcUaRateLimiter):
+            await rateLimiter.acquire(_create_ReadRequest(50))
+            # requests of client wait at most maxWait, not rejected, tokens are charged
+            startTime = time.perf_counter()
+            await rateLimiter.acquire(_create_ReadRequest(50))
+            self.assertLess(time.perf_counter() - startTime, 0.4)
+            self.assertLess(rateLimiter.nodeBucket.tokens, 0)
+
+        rateLimiter = OpcUaRateLimiter(maxNodesPerSecond=50.0, maxWait=0.2)
+        asyncio.run(runClient(rateLimiter))
+        self.assertEqual(rateLimiter.snapshot()["rejected"], 0)
+
+    def test_backpressure(self):
+        serverType = ServerTypes.OPC_UA_Python_Asyncua
+        config = SimulatedSkillServerConfig(serverType=serverType, port=test_port)
+        with SimulatedSkillServer(config) as server:
+            skillCom = createAssetSkillCommunication_byConfigDict(
+                {
+                    "serverType": serverType,
+                    "opc_url": server.connectionInfo.opc_url,
+                    "maxRequestsPerSecond": 50.0,
+                    "rateLimitMaxWait": 10.0,
+                }
+            )
+            self.assertEqual(skillCom.rateLimiter.requestBucket.rate, 50.0)
+            skillCom.connect()
+            try:
+                skillCom.searchfor_Skills()
+                # burst of pollers, queued longer than maxWait
+                skillCom.rateLimiter.maxWait = 0.1
+                skillCom.singleFlight = None
+
+                def read(i: int):
+                    try:
+                        skillCom.read_stSkillState("AddSkill")
+                    except OpcUaRateLimit_Error:
+                        return False
+                    return True
+
+                with ThreadPoolExecutor(max_workers=64) as executor:
+                    results = list(executor.map(read, range(256)))
+                self.assertIn(False, results)
+                self.assertIn(True, results)
+                # commands are not rejected
+                self.assertTrue(skillCom.write_SingleSkillCommand("AddSkill", "Reset"))
+                self.assertGreater(skillCom.rateLimiter.snapshot()["rejected"], 0)
+                # connection is alive
+                time.sleep(1.0)
+                self.assertTrue(skillCom.checkComm())
+            finally:
+                skillCom.disconnect()
+
+    def test_connect_flood(self):
+        serverType = ServerTypes.OPC_UA_Python_Asyncua
+        config = SimulatedSkillServerConfig(serverType=serverType, port=test_port)
+        with SimulatedSkillServer(config) as server:
+            skillCom = createAssetSkillCommunication_byConfigDict(
+                {
+                    "serverType": serverType,
+                    "opc_url": server.connectionInfo.opc_url,
+                    "maxRequestsPerSecond": 20.0,
+                    "maxNodesPerSecond": 50.0,
+                    "rateLimitMaxWait": 0.2,
+                }
+            )
+            # connect and type loading are not limited, search waits bounded
+            self.assertTrue(skillCom.connect())
+            try:
+                self.assertGreater(skillCom.searchfor_Skills(), 0)
+                skillCom.singleFlight = None
+
+                def read(i: int):
+                    try:
+                        skillCom.read_stSkillState("AddSkill")
+                    except OpcUaRateLimit_Error:
+                        return False
+                    return True
+
+                # flood of pollers for longer than watchdog interval
+                startTime = time.perf_counter()
+                results = []
+                with ThreadPoolExecutor(max_workers=40) as executor:
+                    while time.perf_counter() - startTime < 2.5:
+                        results.extend(executor.map(read, range(40)))
+                self.assertIn(False, results)
+                # health check and session are not affected by backpressure
+                self.assertTrue(skillCom.checkComm())
+                time.sleep(1.5)
+                self.assertTrue(skillCom.checkComm())
+                self.assertIsNotNone(skillCom.read_stSkillState("AddSkill"))
+            finally:
+                skillCom.disconnect()
+
+    def test_searchfor_Skills(self):
+        serverType = ServerTypes.OPC_UA_Python_Asyncua
+        config = SimulatedSkillServerConfig(serverType=serverType, port=test_port)
+        with SimulatedSkillServer(config) as server:
+            skillCom = createAssetSkillCommunication_byConfigDict(
+                {
+                    "serverType": serverType,
+                    "opc_url": server.connectionInfo.opc_url,
+                    "maxNodesPerSecond": 20.0,
+                    "rateLimitMaxWait": 0.2,
+                }
+            )
+            skillCom.connect()
+            try:
+                # connect is not charged
+                self.assertEqual(skillCom.rateLimiter.snapshot()["requests"], 0)
+                self.assertGreater(skillCom.searchfor_Skills(), 0)
+                # rediscovery drains node bucket
+                snapshot = skillCom.rateLimiter.snapshot()
+                self.assertGreater(snapshot["requests"], 0)
+                self.assertEqual(snapshot["rejected"], 0)
+                self.assertLess(skillCom.rateLimiter.nodeBucket.tokens, 1.0)
+                # skill reads right after rediscovery wait for tokens
+                skillCom.read_stSkillData("AddSkill")
+                self.assertGreater(
+                    skillCom.rateLimiter.snapshot()["delayed"], snapshot["delayed"]
+                )
+                self.assertTrue(skillCom.checkComm())
+            finally:
+                skillCom.disconnect()
+
+
+if __name__ == "__main__":
+    unittest.main()
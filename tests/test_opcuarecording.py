@@ -0,0 +1,119 @@
+import asyncio
+import json
+import os
+import tempfile
+import time
+import unittest
+from functools import partial
+from sbc_communication.assetskillscommunication_factory import (
+    createAssetSkillCommunication,
+    ServerTypes,
+)
+from sbc_communication.assetskillshandle import AssetSkillsHandle
+from sbc_communication.opcua.opcuarecording import (
+    OPC_UA_RECORDING_FORMAT,
+    OpcUaRecordingEntry,
+    OpcUaReplay,
+    OpcUaReplay_Error,
+    read_Recording,
+)
+from sbc_communication.simulation.simulatedskillserver import (
+    SimulatedSkillServer,
+    SimulatedSkillServerConfig,
+)
+from sbc_communication.skillexecutionhandler import SkillExecutionHandler
+
+test_port = 4846
+
+
+class Test_OpcUaRecording(unittest.TestCase):
+    def _executeSession(self, skillCom) -> list:
+        assetHandle = AssetSkillsHandle(
+            assetName="Test",
+            assetSkillCommunication=skillCom,
+            skillExecutionHandlerClass=partial(
+                SkillExecutionHandler, assetSkillsCycleTime=0.01
+            ),
+        )
+        assetHandle.connect()
+        try:
+            assetHandle.read_availableSkills()
+            return [
+                assetHandle.executeSkill("AddSkill", Operant1="1.5", Operant2="2"),
+                assetHandle.executeSkill("MultiReturnSkill", return_as_dict=True),
+                sorted(skillCom.skillDataHandles),
+            ]
+        finally:
+            assetHandle.disconnect()
+
+    def test_record_replay(self):
+        serverType = ServerTypes.OPC_UA_Beckhoff
+        with tempfile.TemporaryDirectory() as directory:
+            filePath = os.path.join(directory, "session.jsonl")
+            config = SimulatedSkillServerConfig(
+                serverType=serverType, port=test_port, generatedSkillCount=2
+            )
+            with SimulatedSkillServer(config) as server:
+                connectionInfo = server.connectionInfo
+                skillCom = createAssetSkillCommunication(serverType, connectionInfo)
+                skillCom.start_OpcUaRecording(filePath)
+                recordedResults = self._executeSession(skillCom)
+                requestCount = skillCom.requestCount
+                skillCom.stop_OpcUaRecording()
+            header, entries = read_Recording(filePath)
+            self.assertEqual(header["opc_url"], connectionInfo.opc_url)
+            self.assertGreater(len(entries), requestCount - 1)
+
+            # server is stopped, replay as fast as possible
+            skillCom = createAssetSkillCommunication(serverType, connectionInfo)
+            skillCom.set_OpcUaReplay(filePath)
+            self.assertEqual(self._executeSession(skillCom), recordedResults)
+            self.assertEqual(skillCom.requestCount, requestCount)
+            self.assertEqual(skillCom.opcUaReplay.replayedCount, len(entries))
+            self.assertGreater(
+                skillCom.serviceMetrics.snapshot()["services"]["Read"]["requests"], 0
+            )
+
+            # recording exhausted
+            replay = OpcUaReplay(filePath)
+            for entry in entries:
+                self.assertEqual(replay.next_Entry(entry.service, entry.key), entry)
+            with self.assertRaises(OpcUaReplay_Error):
+                replay.next_Entry("Read")
+
+    def test_replayTiming(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filePath = os.path.join(directory, "session.jsonl")
+            with open(filePath, "w") as recordingFile:
+                recordingFile.write(json.dumps({"format": OPC_UA_RECORDING_FORMAT}))
+                for offset in (1.0, 1.4):
+                    entry = OpcUaRecordingEntry(
+                        offset=offset, service="Read", latency=0.05, response=b""
+                    )
+                    recordingFile.write("\n" + json.dumps(entry.asdict()))
+
+            async def replayEntries(replay: OpcUaReplay) -> float:
+                startTime = time.perf_counter()
+                for i in range(2):
+                    await replay.wait_Response(replay.next_Entry("Read"))
+                return time.perf_counter() - startTime
+
+            # second request at recorded offset 0.4 s from replay start plus latency
+            duration = asyncio.run(replayEntries(OpcUaReplay(filePath, speed=1.0)))
+            self.assertGreater(duration, 0.42)
+            self.assertLess(duration, 0.6)
+            duration = asyncio.run(replayEntries(OpcUaReplay(filePath, speed=2.0)))
+            self.assertGreater(duration, 0.2)
+            self.assertLess(duration, 0.35)
+            # latencies only
+            replay = OpcUaReplay(filePath, speed=1.0, latencyOnly=True)
+            duration = asyncio.run(replayEntries(replay))
+            self.assertGreater(duration, 0.08)
+            self.assertLess(duration, 0.3)
+            # as fast as possible
+            duration = asyncio.run(replayEntries(OpcUaReplay(filePath)))
+            self.assertLess(duration, 0.05)
+
+
+if __name__ == "__main__":
+    unittest.main()
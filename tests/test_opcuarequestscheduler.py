@@ -0,0 +1,138 @@
+import asyncio
+import threading
+import unittest
+from sbc_communication.assetskillscommunication_factory import (
+    createAssetSkillCommunication_byConfigDict,
+    ServerTypes,
+)
+from sbc_communication.opcua.opcuarequestscheduler import OpcUaRequestScheduler
+from sbc_communication.requestpriority import (
+    RequestPriority,
+    get_RequestPriority,
+    requestPriorityContext,
+)
+from sbc_communication.simulation.simulatedskillserver import (
+    SimulatedSkillServer,
+    SimulatedSkillServerConfig,
+)
+
+test_port = 4848
+
+
+class Test_RequestPriority(unittest.TestCase):
+    def test_requestPriorityContext(self):
+        self.assertEqual(get_RequestPriority(), RequestPriority.Polling)
+
+        @requestPriorityContext(RequestPriority.Command)
+        def command():
+            return get_RequestPriority()
+
+        with requestPriorityContext(RequestPriority.Execution):
+            self.assertEqual(get_RequestPriority(), RequestPriority.Execution)
+            self.assertEqual(command(), RequestPriority.Command)
+            # outer priority is kept, if more urgent
+            with requestPriorityContext(RequestPriority.Polling):
+                self.assertEqual(get_RequestPriority(), RequestPriority.Execution)
+        self.assertEqual(get_RequestPriority(), RequestPriority.Polling)
+
+
+class Test_OpcUaRequestScheduler(unittest.TestCase):
+    def test_priorityOrder(self):
+        async def run() -> list[str]:
+            scheduler = OpcUaRequestScheduler(maxInFlight=1)
+            await scheduler.acquire()
+            order = []
+
+            async def request(name: str):
+                await scheduler.acquire()
+                order.append(name)
+                scheduler.release()
+
+            tasks = []
+            for name, priority in [
+                ("poll1", RequestPriority.Polling),
+                ("execution", RequestPriority.Execution),
+                ("poll2", RequestPriority.Polling),
+                ("command", RequestPriority.Command),
+            ]:
+                # task copies priority context
+                with requestPriorityContext(priority):
+                    tasks.append(asyncio.create_task(request(name)))
+            await asyncio.sleep(0)
+            self.assertEqual(scheduler.snapshot()["waiting"], 4)
+            scheduler.release()
+            await asyncio.gather(*tasks)
+            self.assertEqual(scheduler.inFlight, 0)
+            snapshot = scheduler.snapshot()
+            self.assertEqual(snapshot["priorities"]["Polling"]["queued"], 2)
+            self.assertEqual(snapshot["priorities"]["Command"]["requests"], 1)
+            return order
+
+        self.assertEqual(asyncio.run(run()), ["command", "execution", "poll1", "poll2"])
+
+    def test_cancelWaiting(self):
+        async def run():
+            scheduler = OpcUaRequestScheduler(maxInFlight=1)
+            await scheduler.acquire()
+            waiting = asyncio.create_task(scheduler.acquire())
+            await asyncio.sleep(0)
+            waiting.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await waiting
+            self.assertEqual(scheduler.snapshot()["waiting"], 0)
+            scheduler.release()
+            self.assertEqual(scheduler.inFlight, 0)
+            await asyncio.wait_for(scheduler.acquire(), 1.0)
+
+        asyncio.run(run())
+        with self.assertRaises(ValueError):
+            OpcUaRequestScheduler(maxInFlight=0)
+
+    def test_commandsWhilePolling(self):
+        serverType = ServerTypes.OPC_UA_Python_Asyncua
+        config = SimulatedSkillServerConfig(serverType=serverType, port=test_port)
+        with SimulatedSkillServer(config) as server:
+            skillCom = createAssetSkillCommunication_byConfigDict(
+                {
+                    "serverType": serverType,
+                    "opc_url": server.connectionInfo.opc_url,
+                    "maxRequestsInFlight": 1,
+                }
+            )
+            self.assertEqual(skillCom.requestScheduler.maxInFlight, 1)
+            skillCom.connect()
+            try:
+                skillCom.searchfor_Skills()
+                skillCom.requestScheduler.reset()
+                polling = threading.Event()
+                polling.set()
+
+                def poll():
+                    while polling.is_set():
+                        skillCom.read_stSkillState("AddSkill")
+
+                pollers = [threading.Thread(target=poll) for i in range(8)]
+                for poller in pollers:
+                    poller.start()
+                try:
+                    self.assertTrue(
+                        skillCom.write_SingleSkillCommand("AddSkill", "Reset")
+                    )
+                finally:
+                    polling.clear()
+                    for poller in pollers:
+                        poller.join()
+                snapshot = skillCom.requestScheduler.snapshot()
+                self.assertEqual(snapshot["priorities"]["Command"]["requests"], 1)
+                self.assertGreater(snapshot["priorities"]["Polling"]["requests"], 0)
+                self.assertEqual(snapshot["inFlight"], 0)
+                self.assertIn(
+                    'sbc_opcua_scheduler_requests_total{priority="Command"} 1',
+                    skillCom.requestScheduler.to_prometheus(),
+                )
+            finally:
+                skillCom.disconnect()
+
+
+if __name__ == "__main__":
+    unittest.main()
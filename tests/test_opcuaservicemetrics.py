@@ -0,0 +1,66 @@
+import unittest
+from asyncua import ua
+from sbc_communication.opcua.opcuaservicemetrics import (
+    OpcUaServiceMetrics,
+    get_ServiceName,
+    get_ServiceNodeCount,
+    opcUaRequestSkillName,
+)
+
+
+def _createReadRequest(nodeCount: int) -> ua.ReadRequest:
+    request = ua.ReadRequest()
+    request.Parameters.NodesToRead = [ua.ReadValueId() for i in range(nodeCount)]
+    return request
+
+
+class Test_OpcUaServiceMetrics(unittest.TestCase):
+    def test_serviceName_nodeCount(self):
+        request = _createReadRequest(3)
+        self.assertEqual(get_ServiceName(request), "Read")
+        self.assertEqual(get_ServiceNodeCount(request), 3)
+        self.assertEqual(get_ServiceNodeCount(ua.CloseSessionRequest()), 0)
+
+    def test_observe_perService_perSkill(self):
+        metrics = OpcUaServiceMetrics()
+        metrics.observe(_createReadRequest(2), b"0" * 100, 0.002)
+        token = opcUaRequestSkillName.set("AddSkill")
+        try:
+            metrics.observe(_createReadRequest(1), b"0" * 50, 0.02)
+            metrics.observe(ua.WriteRequest(), None, 0.5, error=True)
+        finally:
+            opcUaRequestSkillName.reset(token)
+        snapshot = metrics.snapshot()
+        read = snapshot["services"]["Read"]
+        self.assertEqual(read["requests"], 2)
+        self.assertEqual(read["nodes"], 3)
+        self.assertEqual(read["responseBytes"], 150)
+        # request bytes not measured by default
+        self.assertIsNone(read["requestBytes"])
+        self.assertNotIn("request_bytes", metrics.to_prometheus())
+        self.assertEqual(read["latencyBuckets"]["0.0025"], 1)
+        self.assertEqual(read["latencyBuckets"]["+Inf"], 2)
+        self.assertEqual(snapshot["services"]["Write"]["errors"], 1)
+        self.assertEqual(snapshot["skills"]["AddSkill"]["Read"]["requests"], 1)
+        self.assertEqual(snapshot["skills"]["AddSkill"]["Write"]["requests"], 1)
+
+    def test_prometheus(self):
+        metrics = OpcUaServiceMetrics(measureRequestBytes=True)
+        metrics.observe(_createReadRequest(1), b"0" * 10, 0.001)
+        text = metrics.to_prometheus(labels={"asset": "Test"})
+        self.assertIn('sbc_opcua_requests_total{asset="Test",service="Read"} 1', text)
+        self.assertIn("# TYPE sbc_opcua_request_latency_seconds histogram", text)
+        self.assertIn(
+            'sbc_opcua_request_latency_seconds_bucket{asset="Test",service="Read",le="+Inf"} 1',
+            text,
+        )
+        self.assertGreater(metrics.snapshot()["services"]["Read"]["requestBytes"], 0)
+        self.assertIn(
+            'sbc_opcua_request_bytes_total{asset="Test",service="Read"}', text
+        )
+
+    def test_reset(self):
+        metrics = OpcUaServiceMetrics()
+        metrics.observe(_createReadRequest(1), b"", 0.001)
+        metrics.reset()
+        self.assertEqual(metrics.snapshot()["services"], {})
@@ -0,0 +1,159 @@
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from sbc_communication.assetskillscommunication_factory import (
+    createAssetSkillCommunication,
+    ServerTypes,
+)
+from sbc_communication.opcua.opcuasingleflight import (
+    SingleFlight,
+    OpcUaSingleFlight_Error,
+)
+from sbc_communication.simulation.simulatedskillserver import (
+    SimulatedSkillServer,
+    SimulatedSkillServerConfig,
+)
+
+test_port = 4847
+
+
+class Test_SingleFlight(unittest.TestCase):
+    def _start_BlockedLeader(self, singleFlight: SingleFlight, function) -> tuple:
+        """start call in thread, blocked in flight until returned event is set"""
+        started, release = threading.Event(), threading.Event()
+
+        def leaderFunction():
+            started.set()
+            release.wait()
+            return function()
+
+        executor = ThreadPoolExecutor(max_workers=4)
+        leader = executor.submit(singleFlight.do, "key", leaderFunction, "read")
+        started.wait()
+        return executor, leader, release
+
+    def test_shareResult(self):
+        singleFlight = SingleFlight()
+        result = object()
+        executor, leader, release = self._start_BlockedLeader(
+            singleFlight, lambda: result
+        )
+        followers = [
+            executor.submit(singleFlight.do, "key", lambda: None, "read")
+            for i in range(3)
+        ]
+        while singleFlight.snapshot()["operations"]["read"]["sharedCalls"] < 3:
+            pass
+        release.set()
+        self.assertIs(leader.result(), result)
+        for follower in followers:
+            self.assertIs(follower.result(), result)
+        executor.shutdown()
+        # finished calls are executed again
+        self.assertEqual(singleFlight.do("key", lambda: 1, "read"), 1)
+        self.assertEqual(
+            singleFlight.snapshot()["operations"]["read"],
+            {"calls": 2, "sharedCalls": 3, "coalescingRatio": 0.6},
+        )
+        self.assertIn(
+            'sbc_opcua_singleflight_coalescing_ratio{operation="read"} 0.6',
+            singleFlight.to_prometheus(),
+        )
+
+    def test_shareException(self):
+        singleFlight = SingleFlight()
+
+        def fail():
+            raise TimeoutError("read timeout")
+
+        executor, leader, release = self._start_BlockedLeader(singleFlight, fail)
+        follower = executor.submit(singleFlight.do, "key", lambda: None, "read")
+        while singleFlight.snapshot()["operations"]["read"]["sharedCalls"] < 1:
+            pass
+        release.set()
+        self.assertRaises(TimeoutError, leader.result)
+        self.assertRaises(TimeoutError, follower.result)
+        executor.shutdown()
+        # waiting call raises its own copy, chained to exception of the call in flight
+        leaderError, followerError = leader.exception(), follower.exception()
+        self.assertIsNot(followerError, leaderError)
+        self.assertEqual(followerError.args, ("read timeout",))
+        self.assertIs(followerError.__cause__, leaderError)
+
+    def test_shareException_notCopyable(self):
+        singleFlight = SingleFlight()
+
+        class KeywordError(Exception):
+            def __init__(self, *, reason: str):
+                super().__init__()
+                self.reason = reason
+
+        def fail():
+            raise KeywordError(reason="read timeout")
+
+        executor, leader, release = self._start_BlockedLeader(singleFlight, fail)
+        follower = executor.submit(singleFlight.do, "key", lambda: None, "read")
+        while singleFlight.snapshot()["operations"]["read"]["sharedCalls"] < 1:
+            pass
+        release.set()
+        self.assertRaises(KeywordError, leader.result)
+        self.assertRaises(OpcUaSingleFlight_Error, follower.result)
+        self.assertIs(follower.exception().__cause__, leader.exception())
+        executor.shutdown()
+
+    def test_concurrentSkillStateReads(self):
+        serverType = ServerTypes.OPC_UA_Python_Asyncua
+        config = SimulatedSkillServerConfig(serverType=serverType, port=test_port)
+        with SimulatedSkillServer(config) as server:
+            skillCom = createAssetSkillCommunication(serverType, server.connectionInfo)
+            skillCom.connect()
+            try:
+                skillCom.searchfor_Skills()
+                threadCount = 16
+                barrier = threading.Barrier(threadCount)
+
+                def read(i: int):
+                    barrier.wait()
+                    return skillCom.read_stSkillState("AddSkill").strActiveState
+
+                requestCount = skillCom.requestCount
+                with ThreadPoolExecutor(max_workers=threadCount) as executor:
+                    states = list(executor.map(read, range(threadCount)))
+                self.assertEqual(set(states), {"Idle"})
+                counters = skillCom.singleFlight.snapshot()["operations"][
+                    "read_stSkillState"
+                ]
+                self.assertEqual(
+                    counters["calls"] + counters["sharedCalls"], threadCount
+                )
+                self.assertEqual(
+                    skillCom.requestCount - requestCount, counters["calls"]
+                )
+
+                # members of stSkillState
+                def readMember(i: int):
+                    barrier.wait()
+                    return skillCom.read_stSkillState_member(
+                        "AddSkill", "strActiveState"
+                    )
+
+                with ThreadPoolExecutor(max_workers=threadCount) as executor:
+                    states = list(executor.map(readMember, range(threadCount)))
+                self.assertEqual(set(states), {"Idle"})
+                counters = skillCom.singleFlight.snapshot()["operations"][
+                    "read_stSkillState_member"
+                ]
+                self.assertEqual(
+                    counters["calls"] + counters["sharedCalls"], threadCount
+                )
+                # disabled per operation type
+                skillCom.singleFlightOperations.discard("read_stSkillState")
+                skillCom.singleFlight.reset()
+                skillCom.read_stSkillState("AddSkill")
+                self.assertEqual(skillCom.singleFlight.snapshot()["operations"], {})
+            finally:
+                skillCom.disconnect()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,254 @@
+import time
+import unittest
+from dataclasses import replace
+from asyncua import ua
+from sbc_communication.assetskillscommunication_factory import (
+    createAssetSkillCommunication,
+    ServerTypes,
+)
+from sbc_communication.assetskillshandle import AssetSkillsHandle
+from sbc_communication.opcua.assetskillscommunication_opcua import (
+    AssetSkillsCommunication_OPCUA,
+)
+from sbc_communication.simulation.simulatedskillserver import (
+    SERVER_TYPE_NAMES,
+    SimulatedSkillServer,
+    SimulatedSkillServerConfig,
+)
+
+test_port = 4842
+
+
+class Test_SimulatedSkillServer(unittest.TestCase):
+    def _executeTestSkills(self, serverType: ServerTypes, **configKwargs):
+        config = SimulatedSkillServerConfig(
+            serverType=serverType, port=test_port, **configKwargs
+        )
+        with SimulatedSkillServer(config) as server:
+            assetHandle = AssetSkillsHandle(
+                assetName="Test",
+                assetSkillCommunication=createAssetSkillCommunication(
+                    serverType, server.connectionInfo
+                ),
+            )
+            assetHandle.connect()
+            try:
+                assetHandle.read_availableSkills()
+                self.assertEqual(
+                    len(assetHandle.skillCom.skillDataHandles),
+                    len(server.skills),
+                )
+                ret = assetHandle.executeSkill(
+                    "AddSkill", Operant1="1.25", Operant2="2.5"
+                )
+                self.assertEqual(float(ret), 3.75)
+                ret = assetHandle.executeSkill("MultiReturnSkill", return_as_dict=True)
+                self.assertEqual(len(ret), 3)
+                self.assertIsNone(assetHandle.executeSkill("NoParamSkill"))
+                ret = assetHandle.executeSkill(
+                    "SimSkill0000", Parameter0="a", Parameter1="b"
+                )
+                self.assertEqual(ret, "a")
+            finally:
+                assetHandle.disconnect()
+
+    def test_serverTypes(self):
+        for serverType in SERVER_TYPE_NAMES.values():
+            with self.subTest(serverType=serverType.name):
+                self._executeTestSkills(serverType, generatedSkillCount=2)
+
+    def test_browseDepth_plcParameterListLength(self):
+        self._executeTestSkills(
+            ServerTypes.OPC_UA_Siemens,
+            generatedSkillCount=1,
+            browseDepth=3,
+            plcParameterListLength=10,
+        )
+
+    def test_subscribeSkillDataDefaults(self):
+        serverType = ServerTypes.OPC_UA_Python_Asyncua
+        config = SimulatedSkillServerConfig(serverType=serverType, port=test_port)
+        with SimulatedSkillServer(config) as server:
+            skillCom = createAssetSkillCommunication(
+                serverType,
+                replace(server.connectionInfo, subscribeSkillDataDefaults=True),
+            )
+            skillCom.connect()
+            try:
+                skillCom.searchfor_Skills()
+                # defaults of search are cached
+                self.assertTrue(skillCom.is_SkillDataDefaultCached("AddSkill"))
+                self.assertIsNotNone(skillCom.skillDataDefaultSubscription)
+                stSkillDataDefault = skillCom.get_stSkillData(
+                    "AddSkill", useSkillDataDefault=True
+                )
+                stSkillDataDefault.astParameters[0].strValue = "1.5"
+                skillCom.write_stSkillData("AddSkill", useSkillDataDefault=True)
+                # data change notification invalidates cached defaults
+                for i in range(50):
+                    if not skillCom.is_SkillDataDefaultCached("AddSkill"):
+                        break
+                    time.sleep(0.1)
+                self.assertFalse(skillCom.is_SkillDataDefaultCached("AddSkill"))
+                stSkillDataDefault = skillCom.read_stSkillDataDefault_cached("AddSkill")
+                self.assertEqual(stSkillDataDefault.astParameters[0].strValue, "1.5")
+            finally:
+                skillCom.disconnect()
+            self.assertIsNone(skillCom.skillDataDefaultSubscription)
+
+    def test_exactPlcParameterList(self):
+        serverType = ServerTypes.OPC_UA_Siemens
+        config = SimulatedSkillServerConfig(
+            serverType=serverType,
+            port=test_port,
+            generatedSkillCount=1,
+            plcParameterListLength=10,
+        )
+        with SimulatedSkillServer(config) as server:
+            skillCom = createAssetSkillCommunication(serverType, server.connectionInfo)
+            skillCom.connect()
+            try:
+                skillCom.searchfor_Skills()
+                skillCom.read_SkillDatas()
+                skillName = "SimSkill0000"
+                # per skill layout of plc struct
+                layout = skillCom.skillStructLayouts[skillName]
+                self.assertEqual(layout.plcParameterListCount, 10)
+                skillDataCommandNode = skillCom.skillConnectionNodes[
+                    skillName
+                ].skillDataCommandNode
+                for write in (
+                    skillCom.write_stSkillData,
+                    skillCom.write_stSkillData_astParameters,
+                ):
+                    with self.subTest(write=write.__name__):
+                        stSkillDataCommand = skillCom.get_stSkillData(skillName)
+                        parameterCount = stSkillDataCommand.iParameterCount
+                        for parameter in stSkillDataCommand.astParameters:
+                            parameter.strValue = "x"
+                        self.assertTrue(write(skillName))
+                        # written with exact plc array length
+                        uaSkillData = skillDataCommandNode.read_value()
+                        self.assertEqual(len(uaSkillData.astParameters), 10)
+                        self.assertEqual(
+                            uaSkillData.astParameters[parameterCount - 1].strValue,
+                            "x",
+                        )
+                        # reused write target: no values of earlier writes behind iParameterCount
+                        if write == skillCom.write_stSkillData:
+                            targetParameterList = layout.targetSkillDatas[
+                                False
+                            ].astParameters
+                        else:
+                            targetParameterList = layout.targetParameterLists[False]
+                        targetParameters = list(targetParameterList)
+                        stSkillDataCommand.iParameterCount = parameterCount - 1
+                        self.assertTrue(write(skillName))
+                        # tail emptied in place, no parameters allocated
+                        for targetParameter, parameter in zip(
+                            targetParameters, targetParameterList
+                        ):
+                            self.assertIs(targetParameter, parameter)
+                        self.assertEqual(
+                            targetParameterList[parameterCount - 1].strValue, ""
+                        )
+                        uaSkillData = skillDataCommandNode.read_value()
+                        self.assertEqual(
+                            uaSkillData.astParameters[parameterCount - 1].strValue,
+                            "",
+                        )
+                        skillCom.read_stSkillData(skillName, useSkillDataDefault=False)
+            finally:
+                skillCom.disconnect()
+
+    def test_get_IndexRanges(self):
+        self.assertEqual(
+            AssetSkillsCommunication_OPCUA._get_IndexRanges((7, 2, 1, 3, 5, 7)),
+            [(1, 3), (5, 5), (7, 7)],
+        )
+        self.assertEqual(AssetSkillsCommunication_OPCUA._get_IndexRanges(()), [])
+
+    def test_readParametersByIndexes(self):
+        serverType = ServerTypes.OPC_UA_Siemens
+        config = SimulatedSkillServerConfig(serverType=serverType, port=test_port)
+        with SimulatedSkillServer(config) as server:
+            skillCom = createAssetSkillCommunication(serverType, server.connectionInfo)
+            skillCom.connect()
+            try:
+                skillCom.searchfor_Skills()
+                skillCom.read_SkillDatas()
+                skillName = "MultiReturnSkill"
+                astParameters = skillCom.read_stSkillData(skillName).astParameters
+                parameterCount = len(astParameters)
+                parameters = skillCom.read_stSkillData_astParameters_byIndexes(
+                    skillName, (parameterCount - 1, 0)
+                )
+                self.assertEqual(
+                    [parameter.strName for parameter in parameters],
+                    [
+                        astParameters[parameterCount - 1].strName,
+                        astParameters[0].strName,
+                    ],
+                )
+                # out of range indexes are logged and skipped, IndexRange reads stay enabled
+                with self.assertLogs(
+                    "sbc_communication.assetskillscommunication", "WARNING"
+                ):
+                    parameters = skillCom.read_stSkillData_astParameters_byIndexes(
+                        skillName, (0, parameterCount + 5)
+                    )
+                self.assertEqual(
+                    [parameter.strName for parameter in parameters],
+                    [astParameters[0].strName],
+                )
+                self.assertTrue(skillCom.indexRangeReadSupported)
+            finally:
+                skillCom.disconnect()
+
+    def test_readParametersByIndexes_fallback(self):
+        class _IndexRangeIgnoringNode:
+            """returns complete array like servers ignoring IndexRange"""
+
+            def __init__(self, node):
+                self.node = node
+
+            def read_attribute(self, attributeId, indexrange=None):
+                return self.node.read_attribute(attributeId)
+
+        class _IndexRangeNotSupportedNode:
+            def read_attribute(self, attributeId, indexrange=None):
+                raise ua.UaStatusCodeError(ua.StatusCodes.BadNotSupported)
+
+        serverType = ServerTypes.OPC_UA_Siemens
+        config = SimulatedSkillServerConfig(serverType=serverType, port=test_port)
+        with SimulatedSkillServer(config) as server:
+            skillCom = createAssetSkillCommunication(serverType, server.connectionInfo)
+            skillCom.connect()
+            try:
+                skillCom.searchfor_Skills()
+                skillCom.read_SkillDatas()
+                skillName = "AddSkill"
+                astParametersNode = skillCom._get_astParametersNode(skillName, False)
+                astParameters = skillCom.read_stSkillData(skillName).astParameters
+                # complete array instead of range: complete struct for this call only
+                skillCom._get_astParametersNode = (
+                    lambda skillName, useSkillDataDefault: _IndexRangeIgnoringNode(
+                        astParametersNode
+                    )
+                )
+                parameters = skillCom.read_stSkillData_astParameters_byIndexes(
+                    skillName, (1,)
+                )
+                self.assertEqual(parameters[0].strName, astParameters[1].strName)
+                self.assertTrue(skillCom.indexRangeReadSupported)
+                # server rejects IndexRange: complete structs from now on
+                skillCom._get_astParametersNode = (
+                    lambda skillName, useSkillDataDefault: _IndexRangeNotSupportedNode()
+                )
+                parameters = skillCom.read_stSkillData_astParameters_byIndexes(
+                    skillName, (1,)
+                )
+                self.assertEqual(parameters[0].strName, astParameters[1].strName)
+                self.assertFalse(skillCom.indexRangeReadSupported)
+            finally:
+                skillCom.disconnect()
@@ -0,0 +1,112 @@
+import threading
+import unittest
+from sbc_communication.assetskillscommunication_factory import (
+    createAssetSkillCommunication,
+    ServerTypes,
+)
+from sbc_communication.memory.assetskillscommunication_memory import (
+    MemoryConnectionInfo,
+)
+from sbc_communication.skillexecutionhandler import SkillExecutionHandler
+from sbc_communication.skillexecutionmetrics import (
+    SKILL_EXECUTION_PHASES,
+    RollingHistogram,
+    SkillExecutionMetrics,
+    SkillExecutionPhaseRecord,
+    SkillExecutionPhaseTimer,
+)
+
+
+class Test_RollingHistogram(unittest.TestCase):
+    def test_percentiles(self):
+        histogram = RollingHistogram()
+        for value in range(1, 101):
+            histogram.add(float(value))
+        summary = histogram.summary()
+        self.assertEqual(summary["count"], 100)
+        self.assertEqual(summary["p50"], 50.0)
+        self.assertEqual(summary["p95"], 95.0)
+        self.assertEqual(summary["p99"], 99.0)
+        self.assertEqual(summary["max"], 100.0)
+        self.assertEqual(histogram.percentile(0), 1.0)
+
+    def test_window(self):
+        histogram = RollingHistogram(windowSize=10)
+        for value in range(100):
+            histogram.add(float(value))
+        self.assertEqual(len(histogram), 10)
+        self.assertEqual(histogram.percentile(0), 90.0)
+
+    def test_empty(self):
+        histogram = RollingHistogram()
+        self.assertIsNone(histogram.percentile(50))
+        self.assertEqual(histogram.summary()["count"], 0)
+
+
+class Test_SkillExecutionMetrics(unittest.TestCase):
+    def test_phaseTimer(self):
+        requestCount = 0
+
+        def getRequestCount():
+            return requestCount
+
+        timer = SkillExecutionPhaseTimer("AddSkill", getRequestCount)
+        for phase in SKILL_EXECUTION_PHASES:
+            requestCount += 2
+            timer.mark()
+        self.assertEqual(len(timer.record.phaseDurations), len(SKILL_EXECUTION_PHASES))
+        self.assertEqual(timer.record.phaseRequestCounts, [2] * 6)
+        self.assertGreaterEqual(timer.record.totalDuration, 0.0)
+
+    def test_summary(self):
+        metrics = SkillExecutionMetrics()
+        for i in range(10):
+            metrics.add_Record(
+                SkillExecutionPhaseRecord(
+                    "AddSkill",
+                    phaseDurations=[0.001 * i] * 6,
+                    phaseRequestCounts=[1] * 6,
+                )
+            )
+        summary = metrics.get_Summary()
+        self.assertEqual(list(summary.keys()), ["AddSkill"])
+        phases = summary["AddSkill"]["phases"]
+        self.assertEqual(list(phases.keys()), list(SKILL_EXECUTION_PHASES))
+        self.assertEqual(phases["3_start"]["requests"]["p99"], 1)
+        self.assertEqual(summary["AddSkill"]["total"]["count"], 10)
+        self.assertEqual(metrics.get_Summary("Unknown"), {})
+        metrics.reset("AddSkill")
+        self.assertEqual(metrics.get_Summary(), {})
+
+    def test_requestCounts_sharedConnection(self):
+        skillCom = createAssetSkillCommunication(
+            ServerTypes.Memory, MemoryConnectionInfo(requestLatency=0.001)
+        )
+        skillCom.connect()
+        skillCom.searchfor_Skills()
+        skillCom.read_SkillDatas()
+        records: list[SkillExecutionPhaseRecord] = []
+        handler = SkillExecutionHandler(
+            skillCom, assetSkillsCycleTime=0.001, phaseMetricsCallback=records.append
+        )
+        # second execution resets from Completed state, like the measured one
+        for i in range(2):
+            handler.executeSkill("AddSkill", Operant1="1", Operant2="2")
+        expectedCounts = records[-1].phaseRequestCounts
+        # poller thread sharing the connection is not counted in executions
+        stopped = threading.Event()
+
+        def poll():
+            while not stopped.is_set():
+                skillCom.read_stSkillState("NoParamSkill")
+
+        poller = threading.Thread(target=poll)
+        poller.start()
+        try:
+            handler.executeSkill("AddSkill", Operant1="1", Operant2="2")
+        finally:
+            stopped.set()
+            poller.join()
+        phaseRequestCounts = records[-1].phaseRequestCounts
+        self.assertEqual(phaseRequestCounts[:4], expectedCounts[:4])
+        self.assertEqual(phaseRequestCounts[5], expectedCounts[5])
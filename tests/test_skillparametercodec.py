@@ -0,0 +1,280 @@
+import unittest
+from functools import partial
+from sbc_statemachine.skilldatatypes import ST_Parameter, ST_SkillData
+from sbc_communication.assetskillscommunication_factory import (
+    createAssetSkillCommunication,
+    ServerTypes,
+)
+from sbc_communication.assetskillshandle import AssetSkillsHandle
+from sbc_communication.memory.assetskillscommunication_memory import (
+    MemoryConnectionInfo,
+)
+from sbc_communication.simulatedskills import SimulatedSkill
+from sbc_communication.skillexecutionhandler import (
+    SkillExecutionHandler,
+    WrongSkillParameter,
+)
+from sbc_communication.skillparametercodec import (
+    SkillParameterCodec,
+    infer_ParameterType,
+)
+from sbc_communication.skillparameterindex import SkillParameterIndex
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _create_Codec(
+    defaults: dict[str, str], parameterTypes: dict[str, type] | None = None
+) -> SkillParameterCodec:
+    stSkillData = ST_SkillData()
+    stSkillData.astParameters = [
+        ST_Parameter(strName=name, strValue=strValue)
+        for name, strValue in defaults.items()
+    ]
+    return SkillParameterCodec.fromSkillData(
+        stSkillData, SkillParameterIndex.fromSkillData(stSkillData), parameterTypes
+    )
+
+
+def _scale(inputs: dict[str, str]) -> dict[str, str]:
+    value = float(inputs["Value"]) * int(inputs["Factor"])
+    return {"Result": value, "ResultValid": inputs["Enabled"]}
+
+
+class Test_SkillParameterCodec(unittest.TestCase):
+    def test_inferParameterType(self):
+        self.assertIs(infer_ParameterType("0.0"), float)
+        self.assertIs(infer_ParameterType("-12"), float)
+        self.assertIs(infer_ParameterType("1e-3"), float)
+        self.assertIs(infer_ParameterType("FALSE"), bool)
+        self.assertIs(infer_ParameterType(""), str)
+        self.assertIs(infer_ParameterType("Gripper1"), str)
+
+    def test_encode(self):
+        codec = _create_Codec(
+            {"Speed": "0.0", "Count": "0", "Enabled": "FALSE", "Name": ""},
+            {"Count": int},
+        )
+        self.assertEqual(
+            codec.encode_Parameters(
+                {"Speed": 1, "Count": 3.0, "Enabled": True, "Name": 5}
+            ),
+            [(0, "1"), (1, "3"), (2, "TRUE"), (3, "5")],
+        )
+        # inferred types are hints: strings passed unchanged, other values by str()
+        self.assertEqual(
+            codec.encode_Parameters(
+                {"Speed": "fast", "Count": "", "Enabled": "0", "Name": "a"}
+            ),
+            [(0, "fast"), (1, ""), (2, "0"), (3, "a")],
+        )
+        self.assertEqual(codec.encode_Parameters({"Enabled": 2}), [(2, "2")])
+        # explicit types are checked, all invalid values are reported at once
+        codec = _create_Codec(
+            {"Speed": "0.0", "Count": "0", "Enabled": "FALSE"},
+            {"Speed": float, "Count": int, "Enabled": bool},
+        )
+        self.assertEqual(
+            codec.encode_Parameters({"Speed": " 1.25", "Count": "-3", "Enabled": "0"}),
+            [(0, "1.25"), (1, "-3"), (2, "FALSE")],
+        )
+        with self.assertRaises(ValueError) as context:
+            codec.encode_Parameters(
+                {"Speed": "fast", "Count": 1.5, "Enabled": 2, "Other": 1}
+            )
+        for name in ["Speed", "Count", "Enabled", "Other"]:
+            self.assertIn(name, str(context.exception))
+        # no non-finite values or underscores, though accepted by float() and int()
+        for value in ["nan", "inf", "1_000", float("nan"), float("-inf")]:
+            with self.assertRaises(ValueError):
+                codec.encode_Parameters({"Speed": value})
+        with self.assertRaises(ValueError):
+            codec.encode_Parameters({"Count": "1_000"})
+        with self.assertRaises(ValueError):
+            _create_Codec({"Speed": "0.0"}, {"Speed": list})
+
+    def test_checkParameters(self):
+        codec = _create_Codec({"Speed": "0.0", "Name": ""}, {"Speed": float})
+        codec.check_Parameters(
+            [
+                ST_Parameter(strName="Speed", strValue="1e3"),
+                ST_Parameter(strName="Name", strValue="a"),
+            ]
+        )
+        with self.assertRaises(ValueError) as context:
+            codec.check_Parameters(
+                [
+                    ST_Parameter(strName="Speed", strValue="fast"),
+                    ST_Parameter(strName="Speed", strValue=""),
+                    ST_Parameter(strName="Other", strValue=""),
+                ]
+            )
+        for error in ["3 parameters", "Speed='fast'", "duplicate", "unknown"]:
+            self.assertIn(error, str(context.exception))
+        # format of inferred types is not checked
+        _create_Codec({"Speed": "0.0"}).check_Parameters(
+            [ST_Parameter(strName="Speed", strValue="fast")]
+        )
+
+    def test_decode(self):
+        codec = _create_Codec(
+            {"Result": "0.0", "Count": "0", "Valid": "false", "Text": ""},
+            {"Count": int},
+        )
+        values = codec.decode_Parameters(
+            [
+                ST_Parameter(strName="Result", strValue="1.5"),
+                ST_Parameter(strName="Count", strValue="3.0"),
+                ST_Parameter(strName="Valid", strValue="TRUE"),
+                ST_Parameter(strName="Text", strValue="ok"),
+            ]
+        )
+        self.assertEqual(
+            values, {"Result": 1.5, "Count": 3, "Valid": True, "Text": "ok"}
+        )
+        self.assertIsInstance(values["Count"], int)
+        self.assertEqual(
+            codec.decode_Parameters([ST_Parameter(strName="Result", strValue="")]),
+            {"Result": None},
+        )
+        with self.assertRaises(ValueError):
+            codec.decode_Parameters([ST_Parameter(strName="Count", strValue="1.5")])
+        # inferred types: not convertible strings are returned unchanged
+        self.assertEqual(
+            codec.decode_Parameters([ST_Parameter(strName="Result", strValue="n/a")]),
+            {"Result": "n/a"},
+        )
+
+    @unittest.skipUnless(numpy, "numpy not installed")
+    def test_encode_numpy(self):
+        codec = _create_Codec(
+            {"Speed": "0.0", "Count": "0", "Enabled": "false"}, {"Count": int}
+        )
+        self.assertEqual(
+            codec.encode_Parameters(
+                {
+                    "Speed": numpy.float32(0.5),
+                    "Count": numpy.int64(7),
+                    "Enabled": numpy.bool_(True),
+                }
+            ),
+            [(0, "0.5"), (1, "7"), (2, "true")],
+        )
+
+    def test_encodeColumn(self):
+        codec = _create_Codec(
+            {"Speed": "0.0", "Count": "0", "Enabled": "FALSE"}, {"Count": int}
+        )
+        self.assertEqual(codec.encode_Column("Speed", [0.5, "1", ""]), ["0.5", "1", ""])
+        self.assertEqual(codec.encode_Column("Enabled", (True, 0)), ["TRUE", "FALSE"])
+        with self.assertRaises(ValueError) as cm:
+            codec.encode_Column("Count", [1, 1.5, "x"])
+        self.assertIn("1.5", str(cm.exception))
+        self.assertIn("'x'", str(cm.exception))
+        with self.assertRaises(ValueError):
+            codec.encode_Column("Unknown", [1])
+
+    @unittest.skipUnless(numpy, "numpy not installed")
+    def test_encodeColumn_numpy(self):
+        codec = _create_Codec(
+            {"Speed": "0.0", "Count": "0", "Enabled": "FALSE", "Name": ""},
+            {"Count": int, "Enabled": bool},
+        )
+        speeds = numpy.array([0.5, 1.0, 1e20])
+        # same strValues as per value encoding
+        self.assertEqual(
+            codec.encode_Column("Speed", speeds),
+            [codec.encoders["Speed"](value) for value in speeds.tolist()],
+        )
+        self.assertEqual(codec.encode_Column("Count", numpy.arange(3)), ["0", "1", "2"])
+        self.assertEqual(
+            codec.encode_Column("Count", numpy.array([1.0, -2.0])), ["1", "-2"]
+        )
+        self.assertEqual(
+            codec.encode_Column("Enabled", numpy.array([True, False])),
+            ["TRUE", "FALSE"],
+        )
+        self.assertEqual(codec.encode_Column("Name", numpy.arange(2)), ["0", "1"])
+        # explicit types are checked once per array
+        for name, column in (
+            ("Count", numpy.array([1.0, 1.5])),
+            ("Count", numpy.array([True])),
+            ("Enabled", numpy.array([2])),
+        ):
+            with self.subTest(name=name, column=column):
+                with self.assertRaises(ValueError):
+                    codec.encode_Column(name, column)
+        # inferred types are hints: not finite values are converted by str()
+        self.assertEqual(
+            codec.encode_Column("Speed", numpy.array([numpy.nan, 1.5])),
+            ["nan", "1.5"],
+        )
+        codec = _create_Codec({"Speed": "0.0"}, {"Speed": float})
+        with self.assertRaises(ValueError):
+            codec.encode_Column("Speed", numpy.array([numpy.inf, 1.5]))
+
+    def test_executeSkill(self):
+        skill = SimulatedSkill(
+            name="ScaleSkill",
+            parameterNames=["Value", "Factor", "Enabled"],
+            returnParameterNames=["Result", "ResultValid"],
+            function=_scale,
+            parameterDefaults={
+                "Value": "0.0",
+                "Factor": "1",
+                "Enabled": "False",
+                "Result": "0.0",
+                "ResultValid": "False",
+            },
+        )
+        assetHandle = AssetSkillsHandle(
+            assetName="Test",
+            assetSkillCommunication=createAssetSkillCommunication(
+                ServerTypes.Memory, MemoryConnectionInfo(skills=[skill])
+            ),
+            skillExecutionHandlerClass=partial(
+                SkillExecutionHandler, assetSkillsCycleTime=0.001, typedResults=True
+            ),
+        )
+        assetHandle.read_availableSkills()
+        skillCom = assetHandle.skillCom
+        skillCom.set_SkillParameterTypes("ScaleSkill", {"Factor": int})
+        ret = assetHandle.executeSkill(
+            "ScaleSkill", Value=1.5, Factor=2, Enabled=True, return_as_dict=True
+        )
+        self.assertEqual(ret, {"Result": 3.0, "ResultValid": True})
+        # invalid values are rejected before any request
+        requestCount = skillCom.requestCount
+        with self.assertRaises(WrongSkillParameter):
+            assetHandle.executeSkill("ScaleSkill", Value="high", Factor=1.5)
+        with self.assertRaises(WrongSkillParameter):
+            assetHandle.executeSkill("ScaleSkill", Valeu=1.5)
+        with self.assertRaises(WrongSkillParameter):
+            assetHandle.executeSkill(
+                "ScaleSkill", parameters=[ST_Parameter(strName="Factor", strValue="x")]
+            )
+        # invalid explicit types are reported as parameter errors
+        skillCom.set_SkillParameterTypes("ScaleSkill", {"Factor": list})
+        with self.assertRaises(WrongSkillParameter):
+            assetHandle.executeSkill("ScaleSkill", Factor=2)
+        self.assertEqual(skillCom.requestCount, requestCount)
+        skillCom.set_SkillParameterTypes("ScaleSkill", {"Factor": int})
+        # codec is kept while read stSkillDataDefault is unchanged, compiled again after change
+        codec = skillCom.get_SkillParameterCodec("ScaleSkill")
+        skillCom.read_stSkillData("ScaleSkill", useSkillDataDefault=True)
+        self.assertIs(skillCom.get_SkillParameterCodec("ScaleSkill"), codec)
+        skillCom.get_stSkillData("ScaleSkill", useSkillDataDefault=True).astParameters[
+            0
+        ].strValue = "1.0"
+        skillCom.write_stSkillData("ScaleSkill", useSkillDataDefault=True)
+        self.assertIsNot(skillCom.get_SkillParameterCodec("ScaleSkill"), codec)
+        self.assertIs(
+            skillCom.get_SkillParameterCodec("ScaleSkill").types["Factor"], int
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+from sbc_statemachine.skilldatatypes import ST_SkillData, ST_Parameter
+from sbc_communication.skillparameterindex import (
+    SkillParameterIndex,
+    isReturnParameterName,
+)
+
+
+def _createSkillData(parameterNames: list[str]) -> ST_SkillData:
+    stSkillData = ST_SkillData()
+    stSkillData.astParameters = [ST_Parameter() for name in parameterNames]
+    for parameter, name in zip(stSkillData.astParameters, parameterNames):
+        parameter.strName = name
+    stSkillData.iParameterCount = len(parameterNames)
+    return stSkillData
+
+
+class Test_SkillParameterIndex(unittest.TestCase):
+    def test_isReturnParameterName(self):
+        self.assertTrue(isReturnParameterName("Result"))
+        self.assertTrue(isReturnParameterName("myReturnValue"))
+        self.assertFalse(isReturnParameterName("Operant1"))
+
+    def test_fromSkillData(self):
+        parameterIndex = SkillParameterIndex.fromSkillData(
+            _createSkillData(["Operant1", "Operant2", "Result"])
+        )
+        self.assertEqual(parameterIndex.get_Index("Operant1"), 0)
+        self.assertEqual(parameterIndex.get_Index("Result"), 2)
+        self.assertIsNone(parameterIndex.get_Index("Unknown"))
+        self.assertEqual(parameterIndex.returnIndexes, (2,))
+
+    def test_fromSkillData_duplicateNames(self):
+        parameterIndex = SkillParameterIndex.fromSkillData(
+            _createSkillData(["Result", "Result"])
+        )
+        self.assertEqual(parameterIndex.get_Index("Result"), 0)
+        self.assertEqual(parameterIndex.returnIndexes, (0,))
+
+    def test_fromSkillData_noParameters(self):
+        parameterIndex = SkillParameterIndex.fromSkillData(_createSkillData([]))
+        self.assertEqual(parameterIndex.indexByName, {})
+        self.assertEqual(parameterIndex.returnIndexes, ())
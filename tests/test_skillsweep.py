@@ -0,0 +1,129 @@
+import unittest
+from functools import partial
+from sbc_communication.assetskillscommunication_factory import (
+    createAssetSkillCommunication,
+    ServerTypes,
+)
+from sbc_communication.assetskillshandle import AssetSkillsHandle
+from sbc_communication.memory.assetskillscommunication_memory import (
+    MemoryConnectionInfo,
+)
+from sbc_communication.simulatedskills import SimulatedSkill
+from sbc_communication.skillexecutionhandler import (
+    SkillExecutionHandler,
+    WrongSkillParameter,
+)
+from sbc_communication.skillsweep import encode_SweepColumns, get_SweepColumns
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class Test_SkillSweep(unittest.TestCase):
+    def setUp(self):
+        self.assetHandle = AssetSkillsHandle(
+            assetName="Test",
+            assetSkillCommunication=createAssetSkillCommunication(
+                ServerTypes.Memory,
+                MemoryConnectionInfo(
+                    skills=[SimulatedSkill(name="NoResultSkill", parameterNames=["X"])],
+                    generatedSkillCount=1,
+                    generatedReturnParameterCount=2,
+                ),
+            ),
+            skillExecutionHandlerClass=partial(
+                SkillExecutionHandler, assetSkillsCycleTime=0.001
+            ),
+        )
+        self.assetHandle.read_availableSkills()
+
+    def test_sweepColumns(self):
+        columns = get_SweepColumns({"Operant1": (1, 2), "Operant2": ["a", "b"]})
+        self.assertEqual(columns, {"Operant1": (1, 2), "Operant2": ["a", "b"]})
+        codec = self.assetHandle.skillCom.get_SkillParameterCodec("AddSkill")
+        self.assertEqual(
+            encode_SweepColumns(codec, {"Operant1": (1, 2.5)}),
+            {"Operant1": ["1", "2.5"]},
+        )
+        with self.assertRaises(ValueError):
+            get_SweepColumns({"Operant1": [1, 2], "Operant2": [1]})
+        with self.assertRaises(TypeError):
+            get_SweepColumns([[1, 2]])
+
+    def test_sweepSkill(self):
+        results = self.assetHandle.sweepSkill(
+            "AddSkill",
+            {"Operant1": [1, 2, 3], "Operant2": [0.5, 0.5, 0.5]},
+            resultTypes={"Result": float},
+        )
+        self.assertEqual(list(results), ["Result"])
+        self.assertEqual(list(results["Result"]), [1.5, 2.5, 3.5])
+        results = self.assetHandle.sweepSkill(
+            "SimSkill0000", {"Parameter0": ["a", "b"], "Parameter1": ["c", "d"]}
+        )
+        self.assertEqual(list(results["Result0"]), ["a", "b"])
+        self.assertEqual(list(results["Result1"]), ["c", "d"])
+        self.assertEqual(self.assetHandle.sweepSkill("NoResultSkill", {"X": [1]}), {})
+        # values are checked by parameter codec of skill
+        with self.assertRaises(WrongSkillParameter):
+            self.assetHandle.sweepSkill("AddSkill", {"Operant1": [1], "Unknown": [1]})
+
+    def test_sweepSkill_missingResults(self):
+        self.assetHandle.skillExecHandler.typedResults = True
+        self.assetHandle.skillCom.set_SkillParameterTypes(
+            "SimSkill0000", {"Result0": float}
+        )
+        results = self.assetHandle.sweepSkill(
+            "SimSkill0000",
+            {"Parameter0": ["1.5", ""], "Parameter1": ["c", "d"]},
+            resultTypes={"Result0": float},
+        )
+        if numpy is None:
+            self.assertEqual(results["Result0"], [1.5, None])
+        else:
+            self.assertIsInstance(results["Result0"], numpy.ma.MaskedArray)
+            self.assertEqual(results["Result0"].tolist(), [1.5, None])
+            self.assertEqual(results["Result0"].dtype, numpy.float64)
+        self.assertEqual(list(results["Result1"]), ["c", "d"])
+
+    @unittest.skipUnless(numpy, "numpy not installed")
+    def test_sweepSkill_numpy(self):
+        columns = numpy.zeros(4, dtype=[("Operant1", "f8"), ("Operant2", "i4")])
+        columns["Operant1"] = numpy.linspace(0.0, 1.5, 4)
+        columns["Operant2"] = 1
+        results = self.assetHandle.sweepSkill(
+            "AddSkill", columns, resultTypes={"Result": numpy.float64}
+        )
+        self.assertIsInstance(results["Result"], numpy.ndarray)
+        numpy.testing.assert_allclose(results["Result"], [1.0, 1.5, 2.0, 2.5])
+        results = self.assetHandle.sweepSkill(
+            "AddSkill", {"Operant1": numpy.arange(3), "Operant2": numpy.arange(3)}
+        )
+        self.assertEqual(results["Result"].tolist(), ["0.0", "2.0", "4.0"])
+        # numpy columns are encoded per column, rows are not encoded again
+        codec = self.assetHandle.skillCom.get_SkillParameterCodec("AddSkill")
+        strColumns = encode_SweepColumns(codec, get_SweepColumns(columns))
+        self.assertEqual(strColumns["Operant1"], ["0.0", "0.5", "1.0", "1.5"])
+        self.assertEqual(strColumns["Operant2"], ["1", "1", "1", "1"])
+
+        def encode_Parameters(values):
+            raise AssertionError("rows encoded again")
+
+        codec.encode_Parameters = encode_Parameters
+        try:
+            results = self.assetHandle.sweepSkill("AddSkill", columns)
+        finally:
+            del codec.encode_Parameters
+        self.assertEqual(len(results["Result"]), 4)
+        # explicit types are checked before first execution
+        self.assetHandle.skillCom.set_SkillParameterTypes("AddSkill", {"Operant1": int})
+        requestCount = self.assetHandle.skillCom.requestCount
+        with self.assertRaises(WrongSkillParameter):
+            self.assetHandle.sweepSkill("AddSkill", columns)
+        self.assertEqual(self.assetHandle.skillCom.requestCount, requestCount)
+
+
+if __name__ == "__main__":
+    unittest.main()